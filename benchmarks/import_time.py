@@ -0,0 +1,116 @@
+"""Import-time regression check for the CLI and agent modules.
+
+Each module is imported in a fresh interpreter with ``-X importtime`` and the
+cumulative import cost of the module itself is reported (interpreter start-up
+is excluded). The run fails when a module exceeds its budget or drags in one
+of the heavy optional dependencies that should only load on first use.
+
+Run from the repository root::
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeats 9 --budget-ms 150
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+MODULES = [
+    "cli.main",
+    "tradingagents.fundamental_agent",
+    "tradingagents.news_agent",
+    "tradingagents.combined_weight_agent",
+    "tradingagents.llm_client",
+]
+
+HEAVY_MODULES = [
+    "pandas",
+    "numpy",
+    "yfinance",
+    "openai",
+    "google.generativeai",
+    "tiktoken",
+    "vaderSentiment",
+    "rich.markdown",
+]
+
+
+def measure(module: str) -> Tuple[float, List[str]]:
+    """Return (cumulative import ms, heavy modules loaded) for one fresh import."""
+
+    # A plain import statement is required: importlib.import_module bypasses -X importtime.
+    probe = (
+        "import json, sys\n"
+        f"import {module}\n"
+        f"print(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", probe],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    cumulative_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = [part.strip() for part in line[len("import time:"):].split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            cumulative_us = int(parts[1])
+    heavy = json.loads(result.stdout.strip().splitlines()[-1])
+    return cumulative_us / 1000.0, heavy
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=5, help="Fresh interpreters per module.")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=200.0,
+        help="Maximum median import time allowed for any module.",
+    )
+    args = parser.parse_args()
+
+    failures: List[str] = []
+    results: Dict[str, float] = {}
+    for module in MODULES:
+        timings: List[float] = []
+        heavy: List[str] = []
+        for _ in range(max(1, args.repeats)):
+            elapsed, heavy = measure(module)
+            timings.append(elapsed)
+        median = statistics.median(timings)
+        results[module] = median
+        status = "ok"
+        if median > args.budget_ms:
+            status = "OVER BUDGET"
+            failures.append(f"{module} imports in {median:.1f} ms (budget {args.budget_ms:.0f} ms)")
+        if heavy:
+            status = "HEAVY IMPORTS"
+            failures.append(f"{module} eagerly imports {', '.join(heavy)}")
+        print(f"{module:<40} {median:8.1f} ms  {status}")
+
+    if failures:
+        print("\nImport-time regressions:")
+        for failure in failures:
+            print(f"- {failure}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
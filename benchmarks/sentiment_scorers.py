@@ -0,0 +1,104 @@
+"""Agreement and throughput of the lexicon sentiment scorer against VADER.
+
+Use headlines captured by ``pipeline_throughput.py --record``::
+
+    python benchmarks/sentiment_scorers.py --fixtures fixtures/
+
+or a plain text file with one headline per line::
+
+    python benchmarks/sentiment_scorers.py --corpus headlines.txt --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import pickle
+import sys
+import time
+import xml.etree.ElementTree as ET
+from collections import Counter
+from pathlib import Path
+from typing import Callable, List, Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tradingagents.sentiment import (  # noqa: E402
+    Sentiment,
+    _lexicon_scorer,
+    _score_chunk,
+    _sentiment_analyser,
+)
+
+_LABEL_ORDER = ("positive", "neutral", "negative")
+
+
+def _fixture_texts(directory: Path) -> List[str]:
+    texts: List[str] = []
+    for path in sorted((directory / "feed").glob("*.pkl")):
+        with path.open("rb") as handle:
+            _, payload, _ = pickle.load(handle)
+        if not payload:
+            continue
+        try:
+            root = ET.fromstring(payload)
+        except ET.ParseError:
+            continue
+        for item in root.iter("item"):
+            title = (item.findtext("title") or "").strip()
+            if title:
+                texts.append(title)
+    for path in sorted((directory / "ticker_news").glob("*.pkl")):
+        with path.open("rb") as handle:
+            _, payload, _ = pickle.load(handle)
+        for item in payload or []:
+            if isinstance(item, dict):
+                title = (item.get("title") or item.get("headline") or "").strip()
+                if title:
+                    texts.append(title)
+    return texts
+
+
+def _timed(label: str, score: Callable[[Sequence[str]], List[Sentiment]], texts: List[str]):
+    started = time.perf_counter()
+    labels = score(texts)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<10} n={len(texts):<7} wall={elapsed:7.3f}s  throughput={len(texts) / elapsed:10.0f}/s")
+    return labels, elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--fixtures", type=Path, help="Fixture directory written by --record.")
+    source.add_argument("--corpus", type=Path, help="Text file with one headline per line.")
+    parser.add_argument("--repeat", type=int, default=1, help="Repeat the corpus to lengthen the timing run.")
+    args = parser.parse_args()
+
+    if args.fixtures:
+        texts = _fixture_texts(args.fixtures)
+    else:
+        texts = [line.strip() for line in args.corpus.read_text(encoding="utf-8").splitlines() if line.strip()]
+    if not texts:
+        print("No headlines found.", file=sys.stderr)
+        return 1
+    if _sentiment_analyser() is None or _lexicon_scorer() is None:
+        print("vaderSentiment is not installed.", file=sys.stderr)
+        return 1
+
+    corpus = texts * max(1, args.repeat)
+    vader, vader_wall = _timed("vader", lambda batch: _score_chunk(batch, "vader"), corpus)
+    lexicon, lexicon_wall = _timed("lexicon", lambda batch: _score_chunk(batch, "lexicon"), corpus)
+    print(f"speed-up   {vader_wall / lexicon_wall:.1f}x")
+
+    unique = len(set(texts))
+    pairs = Counter((left[0], right[0]) for left, right in zip(vader[: len(texts)], lexicon[: len(texts)]))
+    agreed = sum(count for (left, right), count in pairs.items() if left == right)
+    print(f"\nagreement  {agreed / len(texts):.1%} of {len(texts)} headlines ({unique} distinct)")
+    print(f"{'vader / lexicon':<18}" + "".join(f"{label:>10}" for label in _LABEL_ORDER))
+    for left in _LABEL_ORDER:
+        print(f"{left:<18}" + "".join(f"{pairs.get((left, right), 0):>10}" for right in _LABEL_ORDER))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
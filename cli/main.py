@@ -1,13 +1,22 @@
-from typing import Optional
+import csv
+import json
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional
 
 import typer
 from rich.console import Console
-from rich.markdown import Markdown
 
-from tradingagents import llm_client
-from tradingagents.combined_weight_agent import WeightSynthesisAgent
-from tradingagents.fundamental_agent import FundamentalWeightAgent
-from tradingagents.news_agent import NewsWeightReviewAgent
+from tradingagents import llm_client, llm_resilience
+
+if TYPE_CHECKING:
+    from rich.markdown import Markdown
+
+    from tradingagents.fundamental_agent import FundamentalWeightAgent
+
+# Agents are imported inside each command so `--help` and single-agent runs
+# only load the modules they actually use.
 
 console = Console()
 
@@ -32,6 +41,16 @@ def weight(
         "--llm/--no-llm",
         help="Ask an LLM to draft the fundamental rationale when an API key is configured.",
     ),
+    llm_cache: Optional[bool] = typer.Option(
+        None,
+        "--llm-cache/--no-llm-cache",
+        help="Reuse cached LLM bullets for an identical prompt (defaults to TRADINGAGENTS_LLM_CACHE, on).",
+    ),
+    stream_llm: bool = typer.Option(
+        True,
+        "--stream/--no-stream",
+        help="Show LLM bullets live as they arrive (with --llm).",
+    ),
     llm_model: Optional[str] = typer.Option(
         None,
         help="Override the model name when --llm is enabled (defaults to TRADINGAGENTS_LLM_MODEL or gemini-2.0-flash).",
@@ -40,18 +59,39 @@ def weight(
         None,
         help="Override the as-of date (YYYY-MM-DD).",
     ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Ignore cached fundamentals and refetch everything from Yahoo Finance.",
+    ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        help="Serve fundamentals from the local cache only, even if stale (no network).",
+    ),
+    snapshot_dir: Optional[Path] = typer.Option(
+        None,
+        envvar="TRADINGAGENTS_SNAPSHOT_DIR",
+        help="Record fundamentals snapshots here and replay past --as-of dates from them.",
+    ),
 ):
     """Generate a fundamentals rationale for the supplied weight."""
 
-    agent = FundamentalWeightAgent()
+    _configure_llm_cache(llm_cache)
+
     try:
-        report = agent.generate_report(
-            ticker,
-            weight,
-            as_of=as_of,
-            use_llm=use_llm,
-            llm_model=llm_model,
+        agent = _build_fundamental_agent(
+            refresh=refresh, offline=offline, snapshot_dir=snapshot_dir
         )
+        with _live_llm_points(use_llm and stream_llm, "Drafting fundamental rationale") as on_point:
+            report = agent.generate_report(
+                ticker,
+                weight,
+                as_of=as_of,
+                use_llm=use_llm,
+                llm_model=llm_model,
+                on_llm_point=on_point,
+            )
     except ValueError as err:
         console.print(f"[red]{err}[/red]")
         raise typer.Exit(code=1) from err
@@ -59,13 +99,104 @@ def weight(
         console.print(f"[red]Fundamentals report failed: {err}[/red]")
         raise typer.Exit(code=1) from err
 
-    console.print(Markdown(report.to_markdown(include_metrics=include_metrics)))
+    console.print(_markdown(report.to_markdown(include_metrics=include_metrics)))
 
     if report.generated_via_llm:
-        console.print("\n[dim]Fundamental rationale generated via LLM.[/dim]")
+        console.print(f"\n[dim]Fundamental rationale generated via LLM{_llm_call_note()}.[/dim]")
     elif use_llm:
         reason = llm_client.LAST_LLM_ERROR or "LLM call returned no content."
         console.print(f"\n[yellow]LLM path skipped: {reason}[/yellow]")
+    if use_llm:
+        _print_provider_health()
+
+
+@app.command()
+def weight_batch(
+    portfolio_file: Path = typer.Argument(
+        ...,
+        help="Portfolio file: a JSON object of ticker→weight, or CSV rows of ticker,weight.",
+    ),
+    max_workers: int = typer.Option(8, help="Maximum tickers fetched concurrently."),
+    include_details: bool = typer.Option(
+        False,
+        "--details/--summary-only",
+        help="Append the full per-ticker rationale after the snapshot table.",
+    ),
+    include_metrics: bool = typer.Option(
+        True,
+        "--include-metrics/--no-metrics",
+        help="Include each ticker's metrics table when details are shown.",
+    ),
+    use_llm: bool = typer.Option(
+        False,
+        "--llm/--no-llm",
+        help="Ask an LLM to draft each fundamental rationale when an API key is configured.",
+    ),
+    llm_cache: Optional[bool] = typer.Option(
+        None,
+        "--llm-cache/--no-llm-cache",
+        help="Reuse cached LLM bullets for an identical prompt (defaults to TRADINGAGENTS_LLM_CACHE, on).",
+    ),
+    llm_model: Optional[str] = typer.Option(
+        None,
+        help="Override the model name when --llm is enabled (defaults to TRADINGAGENTS_LLM_MODEL or gemini-2.0-flash).",
+    ),
+    as_of: Optional[str] = typer.Option(
+        None,
+        help="Override the as-of date (YYYY-MM-DD).",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Ignore cached fundamentals and refetch everything from Yahoo Finance.",
+    ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        help="Serve fundamentals from the local cache only, even if stale (no network).",
+    ),
+    snapshot_dir: Optional[Path] = typer.Option(
+        None,
+        envvar="TRADINGAGENTS_SNAPSHOT_DIR",
+        help="Record fundamentals snapshots here and replay past --as-of dates from them.",
+    ),
+):
+    """Review every position in a portfolio file in one process."""
+
+    _configure_llm_cache(llm_cache)
+
+    try:
+        portfolio = _load_portfolio(portfolio_file)
+        agent = _build_fundamental_agent(
+            refresh=refresh, offline=offline, snapshot_dir=snapshot_dir
+        )
+        batch = agent.generate_reports(
+            portfolio,
+            as_of=as_of,
+            use_llm=use_llm,
+            llm_model=llm_model,
+            max_workers=max_workers,
+        )
+    except ValueError as err:
+        console.print(f"[red]{err}[/red]")
+        raise typer.Exit(code=1) from err
+    except Exception as err:  # noqa: BLE001
+        console.print(f"[red]Portfolio review failed: {err}[/red]")
+        raise typer.Exit(code=1) from err
+
+    console.print(
+        _markdown(batch.to_markdown(include_details=include_details, include_metrics=include_metrics))
+    )
+
+    if use_llm:
+        llm_count = sum(1 for report in batch.reports.values() if report.generated_via_llm)
+        console.print(f"\n[dim]{llm_count}/{len(batch.reports)} rationales generated via LLM.[/dim]")
+        if llm_count < len(batch.reports) and llm_client.LAST_LLM_ERROR:
+            console.print(f"[yellow]Last LLM error: {llm_client.LAST_LLM_ERROR}[/yellow]")
+        _print_provider_health()
+
+    if batch.errors and not batch.reports:
+        raise typer.Exit(code=1)
 
 
 @app.command()
@@ -84,6 +215,16 @@ def news_weight(
         "--llm/--no-llm",
         help="Ask an LLM to synthesise the news-based rationale when an API key is configured.",
     ),
+    llm_cache: Optional[bool] = typer.Option(
+        None,
+        "--llm-cache/--no-llm-cache",
+        help="Reuse cached LLM bullets for an identical prompt (defaults to TRADINGAGENTS_LLM_CACHE, on).",
+    ),
+    stream_llm: bool = typer.Option(
+        True,
+        "--stream/--no-stream",
+        help="Show LLM bullets live as they arrive (with --llm).",
+    ),
     llm_model: Optional[str] = typer.Option(
         None,
         help="Override the model name when --llm is enabled (defaults to TRADINGAGENTS_LLM_MODEL or gemini-2.0-flash).",
@@ -92,34 +233,185 @@ def news_weight(
         None,
         help="Override the as-of date (YYYY-MM-DD).",
     ),
+    hedge_delay: Optional[float] = typer.Option(
+        None,
+        help="Start the yfinance fallback after this many seconds instead of waiting for Google News to fail (0 = query both at once).",
+    ),
 ):
     """Evaluate the weight against recent headline tone."""
 
-    agent = NewsWeightReviewAgent()
+    _configure_llm_cache(llm_cache)
+
+    from tradingagents.news_agent import NewsWeightReviewAgent
+
+    try:
+        agent = NewsWeightReviewAgent(hedge_delay=hedge_delay)
+        with _live_llm_points(use_llm and stream_llm, "Drafting news rationale") as on_point:
+            report = agent.generate_report(
+                ticker,
+                weight,
+                as_of=as_of,
+                lookback_days=lookback_days,
+                max_articles=max_articles,
+                use_llm=use_llm,
+                llm_model=llm_model,
+                on_llm_point=on_point,
+            )
+    except ValueError as err:
+        console.print(f"[red]{err}[/red]")
+        raise typer.Exit(code=1) from err
+    except Exception as err:  # noqa: BLE001
+        console.print(f"[red]News review failed: {err}[/red]")
+        raise typer.Exit(code=1) from err
+
+    console.print(_markdown(report.to_markdown(include_articles=include_articles)))
+    if report.sourcing is not None:
+        console.print(f"[dim]News source: {report.sourcing.describe()}[/dim]")
+
+    if report.generated_via_llm:
+        console.print(f"\n[dim]News rationale generated via LLM{_llm_call_note()}.[/dim]")
+    elif use_llm:
+        reason = llm_client.LAST_LLM_ERROR or "LLM call returned no content."
+        console.print(f"\n[yellow]LLM path skipped: {reason}[/yellow]")
+    if use_llm:
+        _print_provider_health()
+
+
+@app.command()
+def news_weight_batch(
+    portfolio_file: Path = typer.Argument(
+        ...,
+        help="Portfolio file: a JSON object of ticker→weight, or CSV rows of ticker,weight.",
+    ),
+    lookback_days: int = typer.Option(7, help="Number of calendar days to scan for news."),
+    max_articles: int = typer.Option(8, help="Maximum number of headlines per ticker."),
+    concurrency: int = typer.Option(16, help="Maximum tickers whose feeds are fetched at once."),
+    feed_timeout: float = typer.Option(10.0, help="Per-request timeout for news feeds, in seconds."),
+    dedupe_across_tickers: bool = typer.Option(
+        False,
+        "--dedupe-across-tickers/--dedupe-per-ticker",
+        help="Keep a story shared by several tickers only for the first one in the portfolio file.",
+    ),
+    hedge_delay: Optional[float] = typer.Option(
+        None,
+        help="Start the yfinance fallback after this many seconds instead of waiting for Google News to fail (0 = query both at once).",
+    ),
+    include_details: bool = typer.Option(
+        False,
+        "--details/--summary-only",
+        help="Append the full per-ticker review after the snapshot table.",
+    ),
+    include_articles: bool = typer.Option(
+        True,
+        "--include-articles/--no-articles",
+        help="Include each ticker's headline table when details are shown.",
+    ),
+    use_llm: bool = typer.Option(
+        False,
+        "--llm/--no-llm",
+        help="Ask an LLM to synthesise each news-based rationale when an API key is configured.",
+    ),
+    llm_cache: Optional[bool] = typer.Option(
+        None,
+        "--llm-cache/--no-llm-cache",
+        help="Reuse cached LLM bullets for an identical prompt (defaults to TRADINGAGENTS_LLM_CACHE, on).",
+    ),
+    llm_model: Optional[str] = typer.Option(
+        None,
+        help="Override the model name when --llm is enabled (defaults to TRADINGAGENTS_LLM_MODEL or gemini-2.0-flash).",
+    ),
+    as_of: Optional[str] = typer.Option(
+        None,
+        help="Override the as-of date (YYYY-MM-DD).",
+    ),
+):
+    """Review headline tone for every position in a portfolio file concurrently."""
+
+    _configure_llm_cache(llm_cache)
+
+    from tradingagents.news_agent import NewsWeightReviewAgent
+
     try:
-        report = agent.generate_report(
-            ticker,
-            weight,
+        portfolio = _load_portfolio(portfolio_file)
+        agent = NewsWeightReviewAgent(feed_timeout=feed_timeout, hedge_delay=hedge_delay)
+        batch = agent.generate_reports(
+            portfolio,
             as_of=as_of,
             lookback_days=lookback_days,
             max_articles=max_articles,
             use_llm=use_llm,
             llm_model=llm_model,
+            concurrency=concurrency,
+            dedupe_across_tickers=dedupe_across_tickers,
         )
     except ValueError as err:
         console.print(f"[red]{err}[/red]")
         raise typer.Exit(code=1) from err
     except Exception as err:  # noqa: BLE001
-        console.print(f"[red]News review failed: {err}[/red]")
+        console.print(f"[red]Portfolio news review failed: {err}[/red]")
         raise typer.Exit(code=1) from err
 
-    console.print(Markdown(report.to_markdown(include_articles=include_articles)))
+    console.print(
+        _markdown(batch.to_markdown(include_details=include_details, include_articles=include_articles))
+    )
+    winners = Counter(
+        report.sourcing.source or "none" for report in batch.reports.values() if report.sourcing
+    )
+    if winners:
+        tally = ", ".join(f"{source} {count}" for source, count in winners.most_common())
+        console.print(f"[dim]News sources: {tally}[/dim]")
 
-    if report.generated_via_llm:
-        console.print("\n[dim]News rationale generated via LLM.[/dim]")
-    elif use_llm:
-        reason = llm_client.LAST_LLM_ERROR or "LLM call returned no content."
-        console.print(f"\n[yellow]LLM path skipped: {reason}[/yellow]")
+    if use_llm:
+        llm_count = sum(1 for report in batch.reports.values() if report.generated_via_llm)
+        console.print(f"\n[dim]{llm_count}/{len(batch.reports)} news rationales generated via LLM.[/dim]")
+        if llm_count < len(batch.reports) and llm_client.LAST_LLM_ERROR:
+            console.print(f"[yellow]Last LLM error: {llm_client.LAST_LLM_ERROR}[/yellow]")
+        _print_provider_health()
+
+    if batch.errors and not batch.reports:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def news_backfill(
+    tickers: List[str] = typer.Argument(..., help="Ticker symbols to sweep, e.g. AAPL MSFT"),
+    start: str = typer.Option(..., help="First day of the range (YYYY-MM-DD)."),
+    end: Optional[str] = typer.Option(None, help="Last day of the range (YYYY-MM-DD); defaults to today."),
+    output: Path = typer.Option(
+        Path("news_sentiment.csv"),
+        help="Destination file; a .parquet suffix writes Parquet, anything else CSV.",
+    ),
+    max_workers: int = typer.Option(8, help="Tickers fetched concurrently."),
+    processes: Optional[int] = typer.Option(
+        None, help="Worker processes for large scoring batches (defaults to the CPU count)."
+    ),
+    feed_timeout: float = typer.Option(10.0, help="Per-request timeout for news feeds, in seconds."),
+):
+    """Write a daily headline-sentiment time series for tickers over a date range."""
+
+    from tradingagents.news_agent import NewsWeightReviewAgent, write_sentiment_series
+
+    try:
+        agent = NewsWeightReviewAgent(feed_timeout=feed_timeout, use_news_store=False)
+        series = agent.backfill(
+            tickers, start=start, end=end, max_workers=max_workers, processes=processes
+        )
+        path = write_sentiment_series(series, output)
+    except ValueError as err:
+        console.print(f"[red]{err}[/red]")
+        raise typer.Exit(code=1) from err
+    except Exception as err:  # noqa: BLE001
+        console.print(f"[red]News backfill failed: {err}[/red]")
+        raise typer.Exit(code=1) from err
+
+    covered = series.groupby("ticker")["articles"].sum()
+    console.print(
+        f"Wrote {len(series)} rows ({series['ticker'].nunique()} tickers, "
+        f"{series['date'].nunique()} days, {int(covered.sum())} headlines) to {path}"
+    )
+    empty = [ticker for ticker, count in covered.items() if count == 0]
+    if empty:
+        console.print(f"[yellow]No headlines found for: {', '.join(empty)}[/yellow]")
 
 
 @app.command()
@@ -146,28 +438,68 @@ def weight_summary(
         "--llm/--no-llm",
         help="Ask an LLM (OpenAI Responses API) to draft the unified summary when an API key is available.",
     ),
+    llm_cache: Optional[bool] = typer.Option(
+        None,
+        "--llm-cache/--no-llm-cache",
+        help="Reuse cached LLM bullets for an identical prompt (defaults to TRADINGAGENTS_LLM_CACHE, on).",
+    ),
+    stream_llm: bool = typer.Option(
+        True,
+        "--stream/--no-stream",
+        help="Show LLM bullets live as they arrive (with --llm).",
+    ),
     llm_model: Optional[str] = typer.Option(
         None,
         help="Override the model name when --llm is enabled (defaults to gpt-4o-mini).",
     ),
+    prompt_budget: Optional[int] = typer.Option(
+        None,
+        help="Token budget for the LLM summary prompt; low-value rows are trimmed to fit (defaults to TRADINGAGENTS_LLM_PROMPT_BUDGET or 1500).",
+    ),
     as_of: Optional[str] = typer.Option(
         None,
         help="Override the as-of date (YYYY-MM-DD).",
     ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Ignore cached fundamentals and refetch everything from Yahoo Finance.",
+    ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        help="Serve fundamentals from the local cache only, even if stale (no network).",
+    ),
+    snapshot_dir: Optional[Path] = typer.Option(
+        None,
+        envvar="TRADINGAGENTS_SNAPSHOT_DIR",
+        help="Record fundamentals snapshots here and replay past --as-of dates from them.",
+    ),
 ):
     """Blend fundamentals and news agents into a 5–6 point summary."""
 
-    agent = WeightSynthesisAgent()
+    _configure_llm_cache(llm_cache)
+
+    from tradingagents.combined_weight_agent import WeightSynthesisAgent
+
     try:
-        report = agent.generate_report(
-            ticker,
-            weight,
-            as_of=as_of,
-            lookback_days=lookback_days,
-            max_articles=max_articles,
-            use_llm=use_llm,
-            llm_model=llm_model,
+        agent = WeightSynthesisAgent(
+            fundamental_agent=_build_fundamental_agent(
+                refresh=refresh, offline=offline, snapshot_dir=snapshot_dir
+            ),
+            prompt_budget=prompt_budget,
         )
+        with _live_llm_points(use_llm and stream_llm, "Drafting unified summary") as on_point:
+            report = agent.generate_report(
+                ticker,
+                weight,
+                as_of=as_of,
+                lookback_days=lookback_days,
+                max_articles=max_articles,
+                use_llm=use_llm,
+                llm_model=llm_model,
+                on_llm_point=on_point,
+            )
     except ValueError as err:
         console.print(f"[red]{err}[/red]")
         raise typer.Exit(code=1) from err
@@ -176,7 +508,7 @@ def weight_summary(
         raise typer.Exit(code=1) from err
 
     console.print(
-        Markdown(
+        _markdown(
             report.to_markdown(
                 include_components=include_components,
                 include_metrics=include_metrics,
@@ -186,10 +518,220 @@ def weight_summary(
     )
 
     if report.generated_via_llm:
-        console.print("\n[dim]Unified summary generated via LLM.[/dim]")
+        console.print(f"\n[dim]Unified summary generated via LLM{_llm_call_note()}.[/dim]")
     elif use_llm:
         reason = llm_client.LAST_LLM_ERROR or "LLM call returned no content."
         console.print(f"\n[yellow]LLM path skipped: {reason}[/yellow]")
+    if use_llm:
+        _print_provider_health()
+
+
+@app.command()
+def weight_summary_batch(
+    portfolio_file: Path = typer.Argument(
+        ...,
+        help="Portfolio file: a JSON object of ticker→weight, or CSV rows of ticker,weight.",
+    ),
+    lookback_days: int = typer.Option(7, help="Days of news used by the news agent."),
+    max_articles: int = typer.Option(8, help="Maximum headlines per ticker for the news agent."),
+    concurrency: int = typer.Option(8, help="Maximum tickers reviewed at once."),
+    include_details: bool = typer.Option(
+        False,
+        "--details/--summary-only",
+        help="Append each ticker's unified summary after the snapshot table.",
+    ),
+    use_llm: bool = typer.Option(
+        False,
+        "--llm/--no-llm",
+        help="Ask an LLM to draft each unified summary when an API key is configured.",
+    ),
+    llm_cache: Optional[bool] = typer.Option(
+        None,
+        "--llm-cache/--no-llm-cache",
+        help="Reuse cached LLM bullets for an identical prompt (defaults to TRADINGAGENTS_LLM_CACHE, on).",
+    ),
+    llm_model: Optional[str] = typer.Option(
+        None,
+        help="Override the model name when --llm is enabled (defaults to TRADINGAGENTS_LLM_MODEL or gemini-2.0-flash).",
+    ),
+    prompt_budget: Optional[int] = typer.Option(
+        None,
+        help="Token budget for the LLM summary prompt; low-value rows are trimmed to fit (defaults to TRADINGAGENTS_LLM_PROMPT_BUDGET or 1500).",
+    ),
+    llm_concurrency: Optional[int] = typer.Option(
+        None,
+        help="Maximum LLM requests in flight per provider (defaults to TRADINGAGENTS_<PROVIDER>_CONCURRENCY or 8).",
+    ),
+    pack_size: int = typer.Option(
+        1,
+        help="Tickers bundled into one LLM request with --llm (1 = one request per ticker).",
+    ),
+    as_of: Optional[str] = typer.Option(
+        None,
+        help="Override the as-of date (YYYY-MM-DD).",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Ignore cached fundamentals and refetch everything from Yahoo Finance.",
+    ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        help="Serve fundamentals from the local cache only, even if stale (no network).",
+    ),
+    snapshot_dir: Optional[Path] = typer.Option(
+        None,
+        envvar="TRADINGAGENTS_SNAPSHOT_DIR",
+        help="Record fundamentals snapshots here and replay past --as-of dates from them.",
+    ),
+):
+    """Blend fundamentals and news for every position in a portfolio file concurrently."""
+
+    _configure_llm_cache(llm_cache)
+
+    from tradingagents.combined_weight_agent import WeightSynthesisAgent
+
+    try:
+        if llm_concurrency is not None:
+            for provider in llm_client.PROVIDER_CONCURRENCY:
+                llm_client.set_provider_concurrency(provider, llm_concurrency)
+        portfolio = _load_portfolio(portfolio_file)
+        agent = WeightSynthesisAgent(
+            fundamental_agent=_build_fundamental_agent(
+                refresh=refresh, offline=offline, snapshot_dir=snapshot_dir
+            ),
+            prompt_budget=prompt_budget,
+        )
+        batch = agent.generate_reports(
+            portfolio,
+            as_of=as_of,
+            lookback_days=lookback_days,
+            max_articles=max_articles,
+            use_llm=use_llm,
+            llm_model=llm_model,
+            concurrency=concurrency,
+            pack_size=pack_size,
+        )
+    except ValueError as err:
+        console.print(f"[red]{err}[/red]")
+        raise typer.Exit(code=1) from err
+    except Exception as err:  # noqa: BLE001
+        console.print(f"[red]Portfolio combined review failed: {err}[/red]")
+        raise typer.Exit(code=1) from err
+
+    console.print(_markdown(batch.to_markdown(include_details=include_details)))
+
+    if use_llm:
+        llm_count = sum(1 for report in batch.reports.values() if report.generated_via_llm)
+        prompt_tokens = sum(report.prompt_tokens or 0 for report in batch.reports.values())
+        console.print(
+            f"\n[dim]{llm_count}/{len(batch.reports)} unified summaries generated via LLM "
+            f"({prompt_tokens} prompt tokens across the book).[/dim]"
+        )
+        if llm_count < len(batch.reports) and llm_client.LAST_LLM_ERROR:
+            console.print(f"[yellow]Last LLM error: {llm_client.LAST_LLM_ERROR}[/yellow]")
+        _print_provider_health()
+
+    if batch.errors and not batch.reports:
+        raise typer.Exit(code=1)
+
+
+@contextmanager
+def _live_llm_points(enabled: bool, title: str) -> Iterator[Optional[Callable[[str], None]]]:
+    """Yield an ``on_llm_point`` callback that shows streamed bullets until the report is ready."""
+
+    if not enabled:
+        yield None
+        return
+
+    from rich.live import Live
+    from rich.text import Text
+
+    lines = [f"{title}…"]
+    with Live(Text(lines[0], style="dim"), console=console, transient=True) as live:
+
+        def on_point(point: str) -> None:
+            lines.append(f"• {point}")
+            live.update(Text("\n".join(lines), style="dim"))
+
+        yield on_point
+
+
+def _configure_llm_cache(enabled: Optional[bool]) -> None:
+    if enabled is not None:
+        llm_client.RESPONSE_CACHE_ENABLED = enabled
+
+
+def _llm_call_note() -> str:
+    details = []
+    if llm_client.LAST_PROMPT_TOKENS is not None:
+        details.append(f"{llm_client.LAST_PROMPT_TOKENS} prompt tokens")
+    if llm_client.LAST_LLM_CACHE_HIT:
+        details.append("cached response")
+    return f" ({', '.join(details)})" if details else ""
+
+
+def _print_provider_health() -> None:
+    health = llm_resilience.describe_providers()
+    if health:
+        console.print(f"[dim]LLM providers: {health}.[/dim]")
+
+
+def _markdown(markup: str) -> "Markdown":
+    # rich.markdown pulls in markdown-it; only pay for it when rendering output.
+    from rich.markdown import Markdown
+
+    return Markdown(markup)
+
+
+def _load_portfolio(path: Path) -> Dict[str, float]:
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError as exc:
+        raise ValueError(f"Unable to read portfolio file {path}: {exc}") from exc
+
+    if path.suffix.lower() == ".json":
+        try:
+            payload = json.loads(text)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Portfolio JSON is invalid: {exc}") from exc
+        if not isinstance(payload, dict):
+            raise ValueError("Portfolio JSON must be an object mapping ticker to weight")
+        return payload
+
+    portfolio: Dict[str, float] = {}
+    for row in csv.reader(text.splitlines()):
+        if not row or not row[0].strip() or row[0].strip().startswith("#"):
+            continue
+        if len(row) < 2:
+            raise ValueError(f"Portfolio row {row!r} must contain ticker,weight")
+        ticker, raw_weight = row[0].strip(), row[1].strip()
+        try:
+            weight = float(raw_weight)
+        except ValueError:
+            if not portfolio and ticker.lower() == "ticker":
+                continue
+            raise ValueError(f"Portfolio row {row!r} has a non-numeric weight") from None
+        portfolio[ticker] = portfolio.get(ticker, 0.0) + weight
+    if not portfolio:
+        raise ValueError(f"Portfolio file {path} contains no positions")
+    return portfolio
+
+
+def _build_fundamental_agent(
+    *, refresh: bool, offline: bool, snapshot_dir: Optional[Path] = None
+) -> "FundamentalWeightAgent":
+    from tradingagents.fundamental_agent import FundamentalWeightAgent
+
+    if refresh and offline:
+        raise ValueError("--refresh and --offline cannot be used together")
+    snapshot_store = None
+    if snapshot_dir is not None:
+        from tradingagents.snapshot_store import FundamentalsSnapshotStore
+
+        snapshot_store = FundamentalsSnapshotStore(snapshot_dir)
+    return FundamentalWeightAgent(refresh=refresh, offline=offline, snapshot_store=snapshot_store)
 
 
 if __name__ == "__main__":
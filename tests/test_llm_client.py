@@ -0,0 +1,65 @@
+import json
+import types
+
+from tradingagents import llm_client, llm_resilience
+
+
+def _request(ticker):
+    return {
+        "ticker": ticker,
+        "weight": 0.1,
+        "as_of": "2025-01-31",
+        "fundamental_points": ["Margins expanded."],
+        "news_points": ["Coverage was mixed."],
+        "metrics_table": "| Metric | Value |\n| --- | --- |\n| Profit Margin | 12.00% |",
+        "news_table": "",
+        "max_points": 3,
+    }
+
+
+def _fake_gemini(monkeypatch, replies):
+    prompts = []
+
+    class Model:
+        def generate_content(self, prompt, stream=False):
+            prompts.append(prompt)
+            reply = replies.pop(0)
+            if isinstance(reply, Exception):
+                raise reply
+            return types.SimpleNamespace(text=reply)
+
+    genai = types.SimpleNamespace(configure=lambda **kwargs: None, GenerativeModel=lambda name: Model())
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    monkeypatch.setattr(llm_client, "_load_genai", lambda: genai)
+    llm_client.reset_llm_clients()
+    llm_resilience.configure("gemini", rate=0, max_attempts=1)
+    return prompts
+
+
+def teardown_function():
+    llm_resilience.reset("gemini")
+    llm_client.reset_llm_clients()
+
+
+def test_packed_reply_gaps_are_requested_singly(monkeypatch):
+    replies = [json.dumps({"AAA": ["- First point"]}), "- Second point"]
+    prompts = _fake_gemini(monkeypatch, replies)
+
+    results = llm_client.summarise_weight_points_packed(
+        [_request("AAA"), _request("BBB")], model="gemini-test", use_cache=False
+    )
+
+    assert results == [["First point"], ["Second point"]]
+    assert len(prompts) == 2
+
+
+def test_failed_pack_is_not_fanned_out(monkeypatch):
+    prompts = _fake_gemini(monkeypatch, [RuntimeError("connection refused")])
+
+    results = llm_client.summarise_weight_points_packed(
+        [_request("AAA"), _request("BBB"), _request("CCC")], model="gemini-test", use_cache=False
+    )
+
+    assert results == [None, None, None]
+    assert len(prompts) == 1
+    assert "connection refused" in llm_client.LAST_LLM_ERROR
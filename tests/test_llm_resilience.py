@@ -0,0 +1,67 @@
+import time
+
+import pytest
+
+from tradingagents import llm_resilience
+
+
+class Unavailable(Exception):
+    status_code = 503
+
+
+def _failing():
+    raise Unavailable("upstream overloaded")
+
+
+def _configure(**overrides):
+    settings = dict(rate=0, max_attempts=4, backoff_base=0.0, backoff_max=0.0, failure_threshold=1, reset_timeout=0.05)
+    settings.update(overrides)
+    llm_resilience.configure("test", **settings)
+
+
+def teardown_function():
+    llm_resilience.reset("test")
+
+
+def test_breaker_opening_surfaces_the_provider_error():
+    _configure()
+    with pytest.raises(Unavailable):
+        llm_resilience.call("test", _failing)
+    assert llm_resilience.status("test").state == "open"
+    with pytest.raises(llm_resilience.CircuitOpenError):
+        llm_resilience.call("test", _failing)
+
+
+def test_failed_probe_surfaces_the_provider_error():
+    _configure()
+    with pytest.raises(Unavailable):
+        llm_resilience.call("test", _failing)
+    time.sleep(0.06)
+    with pytest.raises(Unavailable):
+        llm_resilience.call("test", _failing)
+    assert llm_resilience.status("test").state == "open"
+
+
+def test_rate_limited_probe_releases_the_slot():
+    _configure(rate=1, burst=1, max_wait=0.0)
+    with pytest.raises(Unavailable):
+        llm_resilience.call("test", _failing)
+    time.sleep(0.06)
+    with pytest.raises(llm_resilience.RateLimitedError):
+        llm_resilience.call("test", lambda: "ok")
+    time.sleep(1.0)
+    assert llm_resilience.call("test", lambda: "ok") == "ok"
+    assert llm_resilience.status("test").state == "closed"
+
+
+def test_transient_errors_are_retried():
+    _configure(failure_threshold=5)
+    outcomes = [Unavailable("busy"), Unavailable("busy")]
+
+    def flaky():
+        if outcomes:
+            raise outcomes.pop(0)
+        return "ok"
+
+    assert llm_resilience.call("test", flaky) == "ok"
+    assert llm_resilience.status("test").retries == 2
@@ -0,0 +1,112 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from tradingagents.fundamental_agent import _calculate_metrics
+from tradingagents.metric_engine import METRIC_COLUMNS, calculate_metrics_frame, metrics_from_frame
+
+NAN = float("nan")
+
+
+def _statement(rows):
+    return pd.DataFrame(rows, index=["2024-12-31", "2023-12-31"]).T
+
+
+def _financials(revenue=(400.0, 320.0), net_income=(40.0, 30.0)):
+    return _statement(
+        {
+            "Total Revenue": revenue,
+            "Net Income": net_income,
+            "Operating Income": (60.0, 50.0),
+            "Gross Profit": (180.0, 150.0),
+        }
+    )
+
+
+def _balance_sheet(equity=(200.0, 180.0), liabilities=(300.0, 280.0)):
+    return _statement({"Total Stockholder Equity": equity, "Total Liab": liabilities})
+
+
+def _cashflow():
+    return _statement({"Operating Cash Flow": (70.0, 65.0)})
+
+
+PAYLOADS = {
+    "info_first": (
+        {"trailingPE": 21.5, "profitMargins": 0.12, "returnOnEquity": 0.31, "dividendYield": 0.006, "revenueGrowth": 0.08},
+        _financials(),
+        _balance_sheet(),
+        _cashflow(),
+    ),
+    "statement_fallbacks": ({"forwardPE": 18.0}, _financials(), _balance_sheet(), _cashflow()),
+    "unparseable_info": (
+        {"trailingPE": "n/a", "forwardPE": 15.0, "profitMargins": "n/a", "dividendYield": None},
+        _financials(),
+        _balance_sheet(),
+        _cashflow(),
+    ),
+    "zero_denominators": (
+        {},
+        _financials(revenue=(0.0, 0.0)),
+        _balance_sheet(equity=(0.0, 10.0)),
+        _cashflow(),
+    ),
+    "nan_latest_values": (
+        {},
+        _financials(revenue=(NAN, 250.0), net_income=(NAN, 20.0)),
+        _balance_sheet(equity=(NAN, 100.0)),
+        _cashflow(),
+    ),
+    "nan_info": ({"profitMargins": NAN, "trailingPE": NAN}, _financials(), _balance_sheet(), _cashflow()),
+    "missing_frames": ({"trailingPE": 30.0}, None, pd.DataFrame(), None),
+    "no_info": (None, _financials(), None, _cashflow()),
+    "out_of_bounds": (
+        {"dividendYield": 150.0, "revenueGrowth": 9.0, "returnOnEquity": -700.0},
+        _financials(revenue=(4000.0, 100.0)),
+        _balance_sheet(),
+        _cashflow(),
+    ),
+    "percent_already_scaled": (
+        {"profitMargins": 12.5, "dividendYield": 2.5, "revenueGrowth": -4.0},
+        _financials(),
+        _balance_sheet(),
+        _cashflow(),
+    ),
+}
+
+
+def _assert_same(expected, actual, label):
+    if expected is None or (isinstance(expected, float) and math.isnan(expected)):
+        assert actual is None or math.isnan(actual), label
+    else:
+        assert actual is not None and math.isclose(expected, actual, rel_tol=1e-12, abs_tol=1e-12), (
+            label,
+            expected,
+            actual,
+        )
+
+
+def test_frame_matches_scalar_path():
+    frame = calculate_metrics_frame(PAYLOADS)
+    assert list(frame.columns) == METRIC_COLUMNS
+    assert list(frame.index) == list(PAYLOADS)
+    for ticker, (info, financials, balance_sheet, cashflow) in PAYLOADS.items():
+        expected = _calculate_metrics(info or {}, financials, balance_sheet, cashflow)
+        for column in METRIC_COLUMNS:
+            _assert_same(expected.get(column), frame.at[ticker, column], f"{ticker}.{column}")
+
+
+def test_metrics_from_frame_reads_nan_as_none():
+    frame = calculate_metrics_frame({"missing_frames": PAYLOADS["missing_frames"]})
+    metrics = metrics_from_frame(frame, "missing_frames")
+    assert metrics["pe_ratio"] == 30.0
+    assert metrics["revenue"] is None
+    assert metrics["debt_to_equity"] is None
+
+
+def test_empty_universe():
+    frame = calculate_metrics_frame({})
+    assert frame.empty
+    assert list(frame.columns) == METRIC_COLUMNS
+    assert np.issubdtype(frame.dtypes.iloc[0], np.floating)
@@ -0,0 +1,39 @@
+from tradingagents.near_duplicates import NearDuplicateIndex, headline_tokens
+
+
+def _cluster(headlines):
+    index = NearDuplicateIndex()
+    return [index.add(headline)[0] for headline in headlines]
+
+
+def test_rewrites_of_one_story_share_a_cluster():
+    first, second = _cluster(
+        ["Apple shares rise on record iPhone sales", "Apple stock rises after record iPhone sales - Reuters"]
+    )
+    assert first == second
+
+
+def test_direction_words_are_tokens():
+    for word in ("up", "down", "over", "under"):
+        assert word in headline_tokens(f"Tesla stock {word} 5% after earnings")
+
+
+def test_opposite_direction_headlines_stay_apart():
+    pairs = [
+        ("Tesla stock up 5% after earnings", "Tesla stock down 5% after earnings"),
+        (
+            "Tesla stock up 5% after strong quarterly earnings beat",
+            "Tesla stock down 5% after strong quarterly earnings beat",
+        ),
+        ("Nvidia shares jump on export approval", "Nvidia shares drop on export approval"),
+        ("Analysts upgrade Apple ahead of earnings", "Analysts downgrade Apple ahead of earnings"),
+        ("Oil settles over $80 on supply worries", "Oil settles under $80 on supply worries"),
+    ]
+    for rising, falling in pairs:
+        first, second = _cluster([rising, falling])
+        assert first != second, (rising, falling)
+
+
+def test_same_direction_rewrites_still_merge():
+    first, second = _cluster(["Nvidia shares fall over 3% on export curbs", "Nvidia stock falls 3% on export curbs"])
+    assert first == second
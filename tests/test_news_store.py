@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from tradingagents.news_agent import NewsWeightReviewAgent
+from tradingagents.news_store import NewsArticleStore
+from tradingagents.providers import FeedResponse, NewsProvider
+
+# Relative to today: the store prunes rows older than its retention window.
+_NEWEST = datetime.now(timezone.utc).replace(hour=0, minute=30, second=0, microsecond=0)
+AS_OF = _NEWEST.date().isoformat()
+_TOPICS = ["factory", "dividend", "lawsuit", "partnership", "recall", "buyback", "launch", "hiring"]
+
+
+def _feed(count):
+    items = []
+    for index in range(count):
+        published = _NEWEST - timedelta(hours=20 * index)
+        items.append(
+            f"<item><title>AAA {_TOPICS[index % len(_TOPICS)]} story {index} - Wire</title>"
+            f"<link>https://example.com/aaa/{index}</link>"
+            f"<pubDate>{format_datetime(published)}</pubDate></item>"
+        )
+    return ("<rss><channel>" + "".join(items) + "</channel></rss>").encode()
+
+
+class _Provider(NewsProvider):
+    def __init__(self, count):
+        self.body = _feed(count)
+        self.down = False
+        self.feed_calls = 0
+
+    def fetch_feed_conditional(self, url, *, timeout, etag=None, last_modified=None):
+        self.feed_calls += 1
+        if self.down:
+            raise ConnectionError("feed unavailable")
+        return FeedResponse(body=self.body)
+
+    def fetch_ticker_news(self, ticker):
+        if self.down:
+            raise ConnectionError("yfinance unavailable")
+        return []
+
+
+def _agent(provider, store):
+    return NewsWeightReviewAgent(
+        provider=provider, news_store=store, use_feed_cache=False, use_sentiment_cache=False
+    )
+
+
+def test_window_stores_more_than_max_articles(tmp_path):
+    store = NewsArticleStore(tmp_path / "articles.sqlite3")
+    agent = _agent(_Provider(12), store)
+
+    assert len(agent.generate_report("AAA", 0.1, as_of=AS_OF, lookback_days=10, max_articles=3).articles) == 3
+    assert len(agent.generate_report("AAA", 0.1, as_of=AS_OF, lookback_days=10, max_articles=10).articles) == 10
+
+
+def test_outage_does_not_mark_the_window_covered(tmp_path):
+    store = NewsArticleStore(tmp_path / "articles.sqlite3")
+    provider = _Provider(12)
+    agent = _agent(provider, store)
+
+    agent.generate_report("AAA", 0.1, as_of=AS_OF, lookback_days=2, max_articles=20)
+    narrow = store.high_water_mark("AAA")
+
+    provider.down = True
+    outage = agent.generate_report("AAA", 0.1, as_of=AS_OF, lookback_days=10, max_articles=20)
+    assert outage.sourcing.source == "store"
+    assert store.high_water_mark("AAA") == narrow
+
+    provider.down = False
+    recovered = agent.generate_report("AAA", 0.1, as_of=AS_OF, lookback_days=10, max_articles=20)
+    assert len(recovered.articles) == 12
+
+
+def test_each_scorer_gets_its_own_store(tmp_path, monkeypatch):
+    monkeypatch.setenv("TRADINGAGENTS_CACHE_DIR", str(tmp_path))
+    provider = _Provider(1)
+    vader = NewsWeightReviewAgent(provider=provider, sentiment_scorer="vader", use_sentiment_cache=False)
+    lexicon = NewsWeightReviewAgent(provider=provider, sentiment_scorer="lexicon", use_sentiment_cache=False)
+
+    assert vader._news_store.path == tmp_path / "news" / "articles-vader.sqlite3"
+    assert lexicon._news_store.path == tmp_path / "news" / "articles-lexicon.sqlite3"
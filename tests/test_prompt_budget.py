@@ -0,0 +1,76 @@
+from tradingagents.fundamental_agent import WeightReport
+from tradingagents.llm_client import _build_weight_points_prompt
+from tradingagents.news_agent import NewsArticle, NewsWeightReport
+from tradingagents.prompt_budget import compact_weight_prompt, count_tokens
+
+
+def _fund_report(metrics):
+    return WeightReport(
+        ticker="AAA",
+        weight=0.1,
+        as_of="2025-01-31",
+        rationale_points=[f"Fundamental observation number {index} about the business." for index in range(6)],
+        metrics=metrics,
+    )
+
+
+def _news_report(articles):
+    return NewsWeightReport(
+        ticker="AAA",
+        weight=0.1,
+        as_of="2025-01-31",
+        lookback_days=7,
+        judgement="Hold.",
+        points=[f"News observation number {index} about coverage." for index in range(6)],
+        articles=articles,
+    )
+
+
+def _neutral_articles(count):
+    return [
+        NewsArticle(
+            headline=f"AAA announces routine update number {index} to its product line",
+            published_at=f"2025-01-{30 - index:02d}T12:00:00+00:00",
+            summary=None,
+            source="Wire",
+            url=None,
+            sentiment="neutral",
+            sentiment_score=0,
+        )
+        for index in range(count)
+    ]
+
+
+def test_all_neutral_articles_keep_one_headline():
+    prompt = compact_weight_prompt(
+        _fund_report({"revenue": 1e9, "net_income": 1e8, "pe_ratio": 20.0, "roe": 15.0}),
+        _news_report(_neutral_articles(10)),
+        0.1,
+        max_points=4,
+        budget=50,
+    )
+    rows = [line for line in prompt.request["news_table"].splitlines() if line.startswith("| 2025")]
+    assert len(rows) == 1
+    assert prompt.tokens > 50
+
+
+def test_low_value_metrics_keep_three_rows():
+    metrics = {"gross_profit": 5e8, "equity": 2e9, "liabilities": 3e9, "operating_income": 2e8, "pe_ratio": 18.0}
+    prompt = compact_weight_prompt(
+        _fund_report(metrics), _news_report(_neutral_articles(2)), 0.1, max_points=4, budget=50
+    )
+    rows = prompt.request["metrics_table"].splitlines()[2:]
+    assert len(rows) == 3
+    assert any("Price/Earnings" in row for row in rows)
+
+
+def test_prompt_within_budget_is_untouched():
+    prompt = compact_weight_prompt(
+        _fund_report({"revenue": 1e9, "pe_ratio": 20.0}),
+        _news_report(_neutral_articles(3)),
+        0.1,
+        max_points=4,
+        budget=100_000,
+    )
+    assert not any(prompt.trimmed.values())
+    assert prompt.tokens == count_tokens(_build_weight_points_prompt(**prompt.request))
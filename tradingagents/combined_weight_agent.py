@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Optional
+import asyncio
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable, Dict, List, Mapping, Optional
 
 from tradingagents.fundamental_agent import FundamentalWeightAgent, WeightReport
 from tradingagents.news_agent import (
@@ -9,10 +11,16 @@ from tradingagents.news_agent import (
 	NewsWeightReport,
 	NewsWeightReviewAgent,
 )
-from tradingagents.llm_client import summarise_weight_points
+from tradingagents.llm_client import (
+	asummarise_weight_points,
+	asummarise_weight_points_packed,
+	summarise_weight_points,
+)
+from tradingagents.portfolio import normalise_portfolio
+from tradingagents.prompt_budget import WeightPrompt, compact_weight_prompt
 
 
-@dataclass
+@dataclass(slots=True)
 class WeightSynthesisReport:
 	ticker: str
 	weight: float
@@ -22,6 +30,7 @@ class WeightSynthesisReport:
 	fundamental_report: WeightReport
 	news_report: NewsWeightReport
 	generated_via_llm: bool = False
+	prompt_tokens: Optional[int] = None
 
 	def to_markdown(
 		self,
@@ -60,12 +69,53 @@ class WeightSynthesisReport:
 		return "".join(sections)
 
 
+@dataclass(slots=True)
+class WeightSynthesisPortfolioReports:
+	"""Batch output: one blended review per ticker plus the failures captured along the way."""
+
+	as_of: str
+	lookback_days: int
+	reports: Dict[str, WeightSynthesisReport]
+	errors: Dict[str, str] = field(default_factory=dict)
+
+	def to_markdown(self, *, include_details: bool = False) -> str:
+		sections = [
+			"# Portfolio Combined Review\n\n",
+			f"- **As of:** {self.as_of}\n",
+			f"- **News Lookback:** {self.lookback_days} day(s)\n",
+			f"- **Tickers Reviewed:** {len(self.reports)}\n",
+			f"- **Failures:** {len(self.errors)}\n\n",
+		]
+
+		if self.reports:
+			sections.extend(["## Snapshot\n", _format_portfolio_table(self.reports.values()), "\n\n"])
+
+		if self.errors:
+			error_lines = "\n".join(f"- **{ticker}:** {message}" for ticker, message in self.errors.items())
+			sections.extend(["## Failures\n", error_lines, "\n\n"])
+
+		if include_details:
+			for report in self.reports.values():
+				sections.extend([report.to_markdown(), "\n"])
+
+		return "".join(sections)
+
+
 class WeightSynthesisAgent:
 	"""Coordinates fundamental and news agents to deliver a unified view."""
 
-	def __init__(self):
-		self._fundamental_agent = FundamentalWeightAgent()
-		self._news_agent = NewsWeightReviewAgent()
+	def __init__(
+		self,
+		*,
+		fundamental_agent: Optional[FundamentalWeightAgent] = None,
+		news_agent: Optional[NewsWeightReviewAgent] = None,
+		prompt_budget: Optional[int] = None,
+	):
+		if prompt_budget is not None and prompt_budget <= 0:
+			raise ValueError("prompt_budget must be positive")
+		self._fundamental_agent = fundamental_agent or FundamentalWeightAgent()
+		self._news_agent = news_agent or NewsWeightReviewAgent()
+		self._prompt_budget = prompt_budget
 
 	def generate_report(
 		self,
@@ -77,6 +127,7 @@ class WeightSynthesisAgent:
 		max_articles: int = 8,
 		use_llm: bool = False,
 		llm_model: Optional[str] = None,
+		on_llm_point: Optional[Callable[[str], None]] = None,
 	) -> WeightSynthesisReport:
 		fund_report = self._fundamental_agent.generate_report(ticker, weight, as_of=as_of)
 		news_report = self._news_agent.generate_report(
@@ -88,36 +139,205 @@ class WeightSynthesisAgent:
 		)
 
 		summary_points = _synthesise_summary(fund_report, news_report)
-		used_llm = False
+		llm_points = None
+		prompt = None
+		if use_llm:
+			prompt = self._llm_prompt(fund_report, news_report, weight, summary_points, llm_model)
+			llm_points = summarise_weight_points(**prompt.request, model=llm_model, on_point=on_llm_point)
+		return _synthesis_report(
+			fund_report, news_report, weight, lookback_days, summary_points, llm_points, prompt
+		)
+
+	async def agenerate_report(
+		self,
+		ticker: str,
+		weight: float,
+		*,
+		as_of: Optional[str] = None,
+		lookback_days: int = 7,
+		max_articles: int = 8,
+		use_llm: bool = False,
+		llm_model: Optional[str] = None,
+	) -> WeightSynthesisReport:
+		"""Awaitable ``generate_report``; the fundamentals and news legs run concurrently."""
+
+		fund_report, news_report = await asyncio.gather(
+			self._fundamental_agent.agenerate_report(ticker, weight, as_of=as_of),
+			self._news_agent.agenerate_report(
+				ticker,
+				weight,
+				as_of=as_of,
+				lookback_days=lookback_days,
+				max_articles=max_articles,
+			),
+		)
+
+		summary_points = _synthesise_summary(fund_report, news_report)
+		llm_points = None
+		prompt = None
 		if use_llm:
-			fund_markdown = fund_report.to_markdown(include_metrics=True)
-			news_markdown = news_report.to_markdown(include_articles=True)
-			llm_points = summarise_weight_points(
-				ticker=fund_report.ticker,
-				weight=weight,
-				as_of=fund_report.as_of,
-				fundamental_points=fund_report.rationale_points,
-				news_points=news_report.points,
-				metrics_table=fund_markdown,
-				news_table=news_markdown,
-				max_points=len(summary_points) or 6,
-				model=llm_model,
+			prompt = self._llm_prompt(fund_report, news_report, weight, summary_points, llm_model)
+			llm_points = await asummarise_weight_points(**prompt.request, model=llm_model)
+		return _synthesis_report(
+			fund_report, news_report, weight, lookback_days, summary_points, llm_points, prompt
+		)
+
+	def generate_reports(
+		self,
+		portfolio: Mapping[str, float],
+		*,
+		as_of: Optional[str] = None,
+		lookback_days: int = 7,
+		max_articles: int = 8,
+		use_llm: bool = False,
+		llm_model: Optional[str] = None,
+		concurrency: int = 8,
+		pack_size: int = 1,
+	) -> WeightSynthesisPortfolioReports:
+		"""Blocking wrapper around ``agenerate_reports`` for callers without an event loop."""
+
+		return asyncio.run(
+			self.agenerate_reports(
+				portfolio,
+				as_of=as_of,
+				lookback_days=lookback_days,
+				max_articles=max_articles,
+				use_llm=use_llm,
+				llm_model=llm_model,
+				concurrency=concurrency,
+				pack_size=pack_size,
 			)
-			if llm_points:
-				summary_points = llm_points
-				used_llm = True
-
-		return WeightSynthesisReport(
-			ticker=fund_report.ticker,
-			weight=weight,
-			as_of=fund_report.as_of,
-			lookback_days=lookback_days,
-			summary_points=summary_points,
-			fundamental_report=fund_report,
-			news_report=news_report,
-			generated_via_llm=used_llm,
 		)
 
+	async def agenerate_reports(
+		self,
+		portfolio: Mapping[str, float],
+		*,
+		as_of: Optional[str] = None,
+		lookback_days: int = 7,
+		max_articles: int = 8,
+		use_llm: bool = False,
+		llm_model: Optional[str] = None,
+		concurrency: int = 8,
+		pack_size: int = 1,
+	) -> WeightSynthesisPortfolioReports:
+		"""Blend fundamentals and news for a whole ticker→weight book.
+
+		At most ``concurrency`` tickers are reviewed at once, and LLM calls are
+		further bounded by ``llm_client.PROVIDER_CONCURRENCY``, so a book of LLM
+		summaries takes roughly one call's latency per wave instead of the sum.
+		Failures are recorded in ``errors`` instead of aborting the batch.
+
+		With ``pack_size`` above 1, the LLM step bundles that many tickers into
+		one request (see ``llm_client.summarise_weight_points_packed``), so the
+		shared instructions are sent once per pack rather than once per ticker.
+		"""
+
+		if concurrency <= 0:
+			raise ValueError("concurrency must be positive")
+		if pack_size <= 0:
+			raise ValueError("pack_size must be positive")
+		positions, errors = normalise_portfolio(portfolio)
+		semaphore = asyncio.Semaphore(concurrency)
+		packed = use_llm and pack_size > 1
+
+		async def review(ticker: str, weight: float) -> WeightSynthesisReport:
+			async with semaphore:
+				return await self.agenerate_report(
+					ticker,
+					weight,
+					as_of=as_of,
+					lookback_days=lookback_days,
+					max_articles=max_articles,
+					use_llm=use_llm and not packed,
+					llm_model=llm_model,
+				)
+
+		outcomes = await asyncio.gather(
+			*(review(ticker, weight) for ticker, weight in positions.items()),
+			return_exceptions=True,
+		)
+
+		reports: Dict[str, WeightSynthesisReport] = {}
+		for ticker, outcome in zip(positions, outcomes):
+			if isinstance(outcome, BaseException):
+				errors[ticker] = str(outcome) or outcome.__class__.__name__
+			else:
+				reports[ticker] = outcome
+
+		if packed and reports:
+			ordered = list(reports.values())
+			packs = [ordered[index:index + pack_size] for index in range(0, len(ordered), pack_size)]
+			prompts = {
+				report.ticker: self._llm_prompt(
+					report.fundamental_report, report.news_report, report.weight, report.summary_points, llm_model
+				)
+				for report in ordered
+			}
+			answers = await asyncio.gather(
+				*(
+					asummarise_weight_points_packed(
+						[prompts[report.ticker].request for report in pack], model=llm_model
+					)
+					for pack in packs
+				)
+			)
+			for pack, points in zip(packs, answers):
+				for report, llm_points in zip(pack, points):
+					reports[report.ticker] = _synthesis_report(
+						report.fundamental_report,
+						report.news_report,
+						report.weight,
+						lookback_days,
+						report.summary_points,
+						llm_points,
+						prompts[report.ticker],
+					)
+
+		as_of_str = next(iter(reports.values())).as_of if reports else (as_of or date.today().isoformat())
+		return WeightSynthesisPortfolioReports(
+			as_of=as_of_str, lookback_days=lookback_days, reports=reports, errors=errors
+		)
+
+	def _llm_prompt(
+		self,
+		fund_report: WeightReport,
+		news_report: NewsWeightReport,
+		weight: float,
+		summary_points: List[str],
+		llm_model: Optional[str],
+	) -> WeightPrompt:
+		return compact_weight_prompt(
+			fund_report,
+			news_report,
+			weight,
+			max_points=len(summary_points) or 6,
+			budget=self._prompt_budget,
+			model=llm_model,
+		)
+
+
+def _synthesis_report(
+	fund_report: WeightReport,
+	news_report: NewsWeightReport,
+	weight: float,
+	lookback_days: int,
+	summary_points: List[str],
+	llm_points: Optional[List[str]],
+	prompt: Optional[WeightPrompt] = None,
+) -> WeightSynthesisReport:
+	return WeightSynthesisReport(
+		ticker=fund_report.ticker,
+		weight=weight,
+		as_of=fund_report.as_of,
+		lookback_days=lookback_days,
+		summary_points=llm_points or summary_points,
+		fundamental_report=fund_report,
+		news_report=news_report,
+		generated_via_llm=bool(llm_points),
+		prompt_tokens=prompt.tokens if prompt is not None else None,
+	)
+
 
 def _synthesise_summary(
 	fund_report: WeightReport,
@@ -202,6 +422,16 @@ def _news_snapshot(articles: List[NewsArticle]) -> Optional[str]:
 	)
 
 
+def _format_portfolio_table(reports) -> str:
+	header = "| Ticker | Weight | Net Sentiment | Lead Point |\n| --- | --- | --- | --- |"
+	rows = []
+	for report in reports:
+		net = sum(article.sentiment_score for article in report.news_report.articles)
+		lead = report.summary_points[0].replace("|", "/") if report.summary_points else "--"
+		rows.append(f"| {report.ticker} | {report.weight:.2%} | {net:+d} | {lead} |")
+	return "\n".join([header] + rows)
+
+
 def _strip_top_heading(markdown: str) -> str:
 	lines = markdown.strip().splitlines()
 	if not lines:
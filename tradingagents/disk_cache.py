@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+
+def default_cache_root() -> Path:
+    """Root directory for persistent caches (override with TRADINGAGENTS_CACHE_DIR)."""
+
+    configured = os.getenv("TRADINGAGENTS_CACHE_DIR")
+    if configured:
+        return Path(configured).expanduser()
+    return Path.home() / ".cache" / "tradingagents"
+
+
+class DiskCache:
+    """Small pickle-backed key/value store with age checks and LRU eviction.
+
+    Each entry lives in its own file so concurrent readers never see a partial
+    write; the file modification time doubles as the last-access timestamp used
+    when the namespace grows past ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        *,
+        root: Optional[Union[str, Path]] = None,
+        max_entries: int = 2048,
+    ):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self._directory = Path(root or default_cache_root()) / namespace
+        self._max_entries = max_entries
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def get(self, key: str, *, max_age: Optional[float] = None) -> Any:
+        """Return the cached value, or None when missing or older than ``max_age`` seconds."""
+
+        path = self._path_for(key)
+        try:
+            with path.open("rb") as handle:
+                stored_at, value = pickle.load(handle)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self._discard(path)
+            return None
+
+        if max_age is not None and time.time() - stored_at > max_age:
+            return None
+
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        path = self._path_for(key)
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                pickle.dump((time.time(), value), handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, path)
+        except Exception:
+            self._discard(Path(tmp_name))
+            return
+        self._evict()
+
+    def delete(self, key: str) -> None:
+        self._discard(self._path_for(key))
+
+    def clear(self) -> None:
+        for path in self._entries():
+            self._discard(path)
+
+    def _path_for(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self._directory / f"{digest}.pkl"
+
+    def _entries(self) -> list:
+        try:
+            return list(self._directory.glob("*.pkl"))
+        except OSError:
+            return []
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        overflow = len(entries) - self._max_entries
+        if overflow <= 0:
+            return
+
+        def last_access(path: Path) -> float:
+            try:
+                return path.stat().st_mtime
+            except OSError:
+                return 0.0
+
+        for path in sorted(entries, key=last_access)[:overflow]:
+            self._discard(path)
+
+    @staticmethod
+    def _discard(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
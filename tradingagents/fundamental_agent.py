@@ -1,12 +1,29 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import math
+import time
+from array import array
+from collections.abc import Mapping as MappingABC
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
 from datetime import date
-from typing import Any, Dict, List, Optional, Tuple
-
-import yfinance as yf  # type: ignore[import]
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 from tradingagents import llm_client
+from tradingagents.disk_cache import DiskCache
+from tradingagents.portfolio import normalise_portfolio, validate_position
+from tradingagents.providers import FundamentalsProvider, default_fundamentals_provider
+
+if TYPE_CHECKING:
+    from tradingagents.snapshot_store import FundamentalsSnapshotStore
+
+_DATASET_TTLS: Dict[str, float] = {
+    "info": 6 * 60 * 60,
+    "financials": 24 * 60 * 60,
+    "balance_sheet": 24 * 60 * 60,
+    "cashflow": 24 * 60 * 60,
+}
 
 _METRIC_FIELDS = [
     ("revenue", "Total Revenue", "currency"),
@@ -24,8 +41,60 @@ _METRIC_FIELDS = [
     ("dividend_yield", "Dividend Yield", "percent"),
 ]
 
+_METRIC_INDEX = {key: position for position, (key, _, _) in enumerate(_METRIC_FIELDS)}
+
+
+class MetricVector(MappingABC):
+    """Read-only metric mapping stored as one float array in ``_METRIC_FIELDS`` order.
+
+    Missing values are held as NaN and read back as None, so callers keep the
+    ``metrics.get(key)`` / ``metrics[key]`` API of the former per-ticker dict
+    at a fraction of its memory.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, metrics: Optional[Mapping[str, Optional[float]]] = None):
+        values = array("d", [math.nan]) * len(_METRIC_FIELDS)
+        for key, value in (metrics or {}).items():
+            position = _METRIC_INDEX.get(key)
+            if position is None:
+                raise KeyError(f"Unknown metric {key!r}")
+            if value is not None:
+                values[position] = float(value)
+        self._values = values
+
+    @classmethod
+    def from_sequence(cls, values) -> "MetricVector":
+        """Build from values already laid out in ``_METRIC_FIELDS`` order (NaN for missing)."""
+
+        vector = cls.__new__(cls)
+        vector._values = array("d", values)
+        if len(vector._values) != len(_METRIC_FIELDS):
+            raise ValueError(f"Expected {len(_METRIC_FIELDS)} metric values")
+        return vector
+
+    def __getitem__(self, key: str) -> Optional[float]:
+        value = self._values[_METRIC_INDEX[key]]
+        return None if math.isnan(value) else value
+
+    def __iter__(self):
+        return iter(_METRIC_INDEX)
+
+    def __len__(self) -> int:
+        return len(_METRIC_INDEX)
+
+    def __reduce__(self):
+        return (MetricVector.from_sequence, (self._values,))
 
-@dataclass
+    def __repr__(self) -> str:
+        return f"MetricVector({dict(self)!r})"
+
+    def to_dict(self) -> Dict[str, Optional[float]]:
+        return dict(self)
+
+
+@dataclass(slots=True)
 class WeightReport:
     """Structured presentation of a fundamentals-based weight decision."""
 
@@ -33,9 +102,13 @@ class WeightReport:
     weight: float
     as_of: str
     rationale_points: List[str]
-    metrics: Dict[str, Optional[float]]
+    metrics: MetricVector
     generated_via_llm: bool = False
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.metrics, MetricVector):
+            self.metrics = MetricVector(self.metrics)
+
     def to_markdown(self, include_metrics: bool = True) -> str:
         header = (
             f"# Portfolio Weight Rationale: {self.ticker}\n\n"
@@ -57,11 +130,66 @@ class WeightReport:
         return "".join(sections)
 
 
+@dataclass(slots=True)
+class PortfolioWeightReports:
+    """Batch output: one report per ticker plus the failures captured along the way."""
+
+    as_of: str
+    reports: Dict[str, WeightReport]
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def to_markdown(self, *, include_details: bool = False, include_metrics: bool = True) -> str:
+        sections = [
+            "# Portfolio Fundamentals Review\n\n",
+            f"- **As of:** {self.as_of}\n",
+            f"- **Tickers Reviewed:** {len(self.reports)}\n",
+            f"- **Failures:** {len(self.errors)}\n\n",
+        ]
+
+        if self.reports:
+            sections.extend(["## Snapshot\n", _format_portfolio_table(self.reports.values()), "\n\n"])
+
+        if self.errors:
+            error_lines = "\n".join(f"- **{ticker}:** {message}" for ticker, message in self.errors.items())
+            sections.extend(["## Failures\n", error_lines, "\n\n"])
+
+        if include_details:
+            for report in self.reports.values():
+                sections.extend([report.to_markdown(include_metrics=include_metrics), "\n"])
+
+        return "".join(sections)
+
+
 class FundamentalWeightAgent:
     """Generates weight rationales using Yahoo Finance fundamentals."""
 
-    def __init__(self, *, default_as_of: Optional[date] = None):
+    def __init__(
+        self,
+        *,
+        default_as_of: Optional[date] = None,
+        use_cache: bool = True,
+        cache: Optional[DiskCache] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        refresh: bool = False,
+        offline: bool = False,
+        fetch_timeout: float = 20.0,
+        snapshot_store: Optional["FundamentalsSnapshotStore"] = None,
+        provider: Optional[FundamentalsProvider] = None,
+    ):
+        if refresh and offline:
+            raise ValueError("refresh and offline modes cannot be combined")
+        if fetch_timeout <= 0:
+            raise ValueError("fetch_timeout must be positive")
         self._default_as_of = default_as_of or date.today()
+        if cache is None and (use_cache or offline):
+            cache = DiskCache("fundamentals")
+        self._cache = cache
+        self._cache_ttls = {**_DATASET_TTLS, **(cache_ttls or {})}
+        self._refresh = refresh
+        self._offline = offline
+        self._fetch_timeout = fetch_timeout
+        self._snapshot_store = snapshot_store
+        self._provider = provider or default_fundamentals_provider()
 
     def generate_report(
         self,
@@ -71,78 +199,302 @@ class FundamentalWeightAgent:
         as_of: Optional[str] = None,
         use_llm: bool = False,
         llm_model: Optional[str] = None,
+        on_llm_point: Optional[Callable[[str], None]] = None,
     ) -> WeightReport:
-        clean_ticker = ticker.strip().upper()
-        if not clean_ticker:
-            raise ValueError("Ticker symbol cannot be empty")
-        if not (0.0 <= weight <= 1.0):
-            raise ValueError("Weight must be between 0.0 and 1.0 inclusive")
+        """Review one position; ``on_llm_point`` receives LLM bullets as they stream in."""
+
+        clean_ticker = validate_position(ticker, weight)
 
         as_of_str = as_of or self._default_as_of.isoformat()
-        info, financials, balance_sheet, cashflow = self._fetch_fundamentals(clean_ticker)
+        info, financials, balance_sheet, cashflow = self._load_statements(clean_ticker, as_of_str)
         metrics = _calculate_metrics(info, financials, balance_sheet, cashflow)
-        rationale = _build_rationale(clean_ticker, weight, metrics)
-        generated_via_llm = False
+        return self._compose_report(
+            clean_ticker,
+            weight,
+            as_of_str,
+            metrics,
+            use_llm=use_llm,
+            llm_model=llm_model,
+            on_llm_point=on_llm_point,
+        )
+
+    async def agenerate_report(
+        self,
+        ticker: str,
+        weight: float,
+        *,
+        as_of: Optional[str] = None,
+        use_llm: bool = False,
+        llm_model: Optional[str] = None,
+    ) -> WeightReport:
+        """Awaitable ``generate_report``: statements load on a worker thread, the LLM call via ``llm_client``."""
+
+        clean_ticker = validate_position(ticker, weight)
+
+        as_of_str = as_of or self._default_as_of.isoformat()
+        info, financials, balance_sheet, cashflow = await asyncio.to_thread(
+            self._load_statements, clean_ticker, as_of_str
+        )
+        metrics = _calculate_metrics(info, financials, balance_sheet, cashflow)
+        return await self._acompose_report(
+            clean_ticker, weight, as_of_str, metrics, use_llm=use_llm, llm_model=llm_model
+        )
+
+    def generate_reports(
+        self,
+        portfolio: Mapping[str, float],
+        *,
+        as_of: Optional[str] = None,
+        use_llm: bool = False,
+        llm_model: Optional[str] = None,
+        max_workers: int = 8,
+    ) -> PortfolioWeightReports:
+        """Review a whole ticker→weight book on a bounded worker pool.
 
+        Tickers are normalised and deduplicated (weights of repeated symbols are
+        summed) so each name is fetched once, and metrics for the whole book are
+        derived in one pass by ``metric_engine``. A failing ticker is recorded in
+        ``errors`` instead of aborting the batch.
+        """
+
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+
+        as_of_str = as_of or self._default_as_of.isoformat()
+        positions, errors = normalise_portfolio(portfolio)
+        outcomes: Dict[str, WeightReport] = {}
+
+        if positions:
+            # metric_engine imports this module, so defer the import to call time.
+            from tradingagents.metric_engine import calculate_metrics_frame, metrics_from_frame
+
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(positions)), thread_name_prefix="fundamentals-batch"
+            ) as executor:
+                statements = _collect_results(
+                    {
+                        ticker: executor.submit(self._load_statements, ticker, as_of_str)
+                        for ticker in positions
+                    },
+                    errors,
+                )
+                metrics_frame = calculate_metrics_frame(statements)
+                outcomes = _collect_results(
+                    {
+                        ticker: executor.submit(
+                            self._compose_report,
+                            ticker,
+                            positions[ticker],
+                            as_of_str,
+                            metrics_from_frame(metrics_frame, ticker),
+                            use_llm=use_llm,
+                            llm_model=llm_model,
+                        )
+                        for ticker in statements
+                    },
+                    errors,
+                )
+
+        return PortfolioWeightReports(as_of=as_of_str, reports=outcomes, errors=errors)
+
+    def _compose_report(
+        self,
+        ticker: str,
+        weight: float,
+        as_of: str,
+        metrics: Mapping[str, Optional[float]],
+        *,
+        use_llm: bool,
+        llm_model: Optional[str],
+        on_llm_point: Optional[Callable[[str], None]] = None,
+    ) -> WeightReport:
+        llm_points = None
         if use_llm:
-            metrics_table = _format_metrics_table(metrics)
-            metrics_summary = _metrics_prompt_summary(metrics)
             llm_points = llm_client.summarise_fundamentals(
-                ticker=clean_ticker,
-                weight=weight,
-                as_of=as_of_str,
-                metrics_table=metrics_table,
-                metrics_summary=metrics_summary,
-                max_points=4,
-                model=llm_model,
+                **_llm_request(ticker, weight, as_of, metrics), model=llm_model, on_point=on_llm_point
             )
-            if llm_points:
-                rationale = llm_points
-                generated_via_llm = True
-
-        return WeightReport(
-            ticker=clean_ticker,
-            weight=weight,
-            as_of=as_of_str,
-            rationale_points=rationale,
-            metrics=metrics,
-            generated_via_llm=generated_via_llm,
-        )
+        return _weight_report(ticker, weight, as_of, metrics, llm_points)
+
+    async def _acompose_report(
+        self,
+        ticker: str,
+        weight: float,
+        as_of: str,
+        metrics: Mapping[str, Optional[float]],
+        *,
+        use_llm: bool,
+        llm_model: Optional[str],
+    ) -> WeightReport:
+        llm_points = None
+        if use_llm:
+            llm_points = await llm_client.asummarise_fundamentals(
+                **_llm_request(ticker, weight, as_of, metrics), model=llm_model
+            )
+        return _weight_report(ticker, weight, as_of, metrics, llm_points)
+
+    def _load_statements(
+        self, ticker: str, as_of: str
+    ) -> Tuple[Dict[str, Any], Any, Any, Any]:
+        """Return statements as known on ``as_of``.
+
+        With a snapshot store attached, past dates are replayed from the latest
+        snapshot on or before ``as_of`` without touching the network, and live
+        fetches are recorded under today's date for future replays.
+        """
+
+        if self._snapshot_store is None:
+            return self._fetch_fundamentals(ticker)
+
+        as_of_date = _parse_as_of(as_of)
+        today = date.today()
+        if as_of_date < today:
+            snapshot = self._snapshot_store.load(ticker, as_of_date)
+            if snapshot is None:
+                raise ValueError(f"No fundamentals snapshot for {ticker} on or before {as_of}")
+            return snapshot[1]
+
+        statements = self._fetch_fundamentals(ticker)
+        if any(_has_data(part) for part in statements) and (
+            self._refresh or not self._snapshot_store.has_snapshot(ticker, today)
+        ):
+            self._snapshot_store.record(ticker, statements, snapshot_date=today)
+        return statements
 
     def _fetch_fundamentals(
         self, ticker: str
     ) -> Tuple[Dict[str, Any], Any, Any, Any]:
-        ticker_obj = yf.Ticker(ticker)
+        datasets: Dict[str, Any] = {}
+        missing: List[str] = []
+
+        for dataset in _DATASET_TTLS:
+            cached = self._read_cache(ticker, dataset)
+            if cached is not None:
+                datasets[dataset] = cached
+            elif self._offline:
+                datasets[dataset] = None
+            else:
+                missing.append(dataset)
+
+        if missing:
+            datasets.update(self._download_datasets(ticker, missing))
+
+        return (
+            datasets["info"] or {},
+            datasets["financials"],
+            datasets["balance_sheet"],
+            datasets["cashflow"],
+        )
 
-        info: Dict[str, Any] = {}
-        try:
-            info = ticker_obj.get_info()
-        except Exception:
-            try:
-                info = getattr(ticker_obj, "info", {}) or {}
-            except Exception:
-                info = {}
+    def _download_datasets(self, ticker: str, datasets: List[str]) -> Dict[str, Any]:
+        """Fetch the requested datasets concurrently, one worker per dataset.
 
-        financials = None
-        balance_sheet = None
-        cashflow = None
+        Each dataset keeps its own fallback: a failure or a call exceeding
+        ``fetch_timeout`` yields None (or an empty info dict) for that dataset only.
+        """
 
+        results: Dict[str, Any] = {}
+        executor = ThreadPoolExecutor(
+            max_workers=len(datasets), thread_name_prefix=f"fundamentals-{ticker}"
+        )
         try:
-            financials = ticker_obj.get_financials()
-        except Exception:
-            financials = None
-
+            futures = {
+                dataset: executor.submit(_load_dataset, self._provider, ticker, dataset)
+                for dataset in datasets
+            }
+            deadline = time.monotonic() + self._fetch_timeout
+            for dataset, future in futures.items():
+                try:
+                    value = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except FutureTimeoutError:
+                    value = {} if dataset == "info" else None
+                else:
+                    self._write_cache(ticker, dataset, value)
+                results[dataset] = value
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return results
+
+    def _read_cache(self, ticker: str, dataset: str) -> Any:
+        if self._cache is None or self._refresh:
+            return None
+        max_age = None if self._offline else self._cache_ttls.get(dataset)
+        return self._cache.get(_cache_key(ticker, dataset), max_age=max_age)
+
+    def _write_cache(self, ticker: str, dataset: str, value: Any) -> None:
+        if self._cache is None or value is None:
+            return
+        if dataset == "info" and not value:
+            return
+        self._cache.set(_cache_key(ticker, dataset), value)
+
+
+def _collect_results(futures: Dict[str, Any], errors: Dict[str, str]) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for ticker, future in futures.items():
         try:
-            balance_sheet = ticker_obj.get_balance_sheet()
-        except Exception:
-            balance_sheet = None
+            results[ticker] = future.result()
+        except Exception as exc:  # noqa: BLE001
+            errors[ticker] = str(exc) or exc.__class__.__name__
+    return results
+
+
+def _llm_request(
+    ticker: str, weight: float, as_of: str, metrics: Mapping[str, Optional[float]]
+) -> Dict[str, Any]:
+    return {
+        "ticker": ticker,
+        "weight": weight,
+        "as_of": as_of,
+        "metrics_table": _format_metrics_table(metrics),
+        "metrics_summary": _metrics_prompt_summary(metrics),
+        "max_points": 4,
+    }
 
-        try:
-            cashflow = ticker_obj.get_cashflow()
-        except Exception:
-            cashflow = None
 
-        return info or {}, financials, balance_sheet, cashflow
+def _weight_report(
+    ticker: str,
+    weight: float,
+    as_of: str,
+    metrics: Mapping[str, Optional[float]],
+    llm_points: Optional[List[str]],
+) -> WeightReport:
+    return WeightReport(
+        ticker=ticker,
+        weight=weight,
+        as_of=as_of,
+        rationale_points=llm_points or _build_rationale(ticker, weight, metrics),
+        metrics=metrics,
+        generated_via_llm=bool(llm_points),
+    )
+
+
+def _parse_as_of(as_of: str) -> date:
+    try:
+        return date.fromisoformat(as_of)
+    except ValueError as exc:
+        raise ValueError("as_of must be in YYYY-MM-DD format") from exc
+
+
+def _has_data(part: Any) -> bool:
+    if part is None:
+        return False
+    if isinstance(part, dict):
+        return bool(part)
+    return not getattr(part, "empty", True)
+
+
+def _cache_key(ticker: str, dataset: str) -> str:
+    return f"{ticker}:{dataset}"
+
+
+def _load_dataset(provider: FundamentalsProvider, ticker: str, dataset: str) -> Any:
+    try:
+        value = provider.fetch_dataset(ticker, dataset)
+    except Exception:
+        value = None
+    if dataset == "info":
+        return value or {}
+    return value
 
 
 def _calculate_metrics(
@@ -282,7 +634,7 @@ def _compute_growth(frame, label: str) -> Optional[float]:
     return ((latest - prior) / prior) * 100.0
 
 
-def _build_rationale(ticker: str, weight: float, metrics: Dict[str, Optional[float]]) -> List[str]:
+def _build_rationale(ticker: str, weight: float, metrics: Mapping[str, Optional[float]]) -> List[str]:
     rationale: List[str] = [
         f"Current allocation for {ticker} stands at {weight:.2%}; below are the latest fundamentals pulled from Yahoo Finance."
     ]
@@ -303,7 +655,7 @@ def _build_rationale(ticker: str, weight: float, metrics: Dict[str, Optional[flo
     return rationale[:4]
 
 
-def _describe_metrics(metrics: Dict[str, Optional[float]]) -> List[str]:
+def _describe_metrics(metrics: Mapping[str, Optional[float]]) -> List[str]:
     statements: List[str] = []
 
     for key, label, value_type in _METRIC_FIELDS:
@@ -334,7 +686,7 @@ def _describe_metrics(metrics: Dict[str, Optional[float]]) -> List[str]:
     return statements
 
 
-def _metric_summary(metrics: Dict[str, Optional[float]]) -> str:
+def _metric_summary(metrics: Mapping[str, Optional[float]]) -> str:
     pieces: List[str] = []
     pe = metrics.get("pe_ratio")
     if pe is not None:
@@ -354,7 +706,7 @@ def _metric_summary(metrics: Dict[str, Optional[float]]) -> str:
     return ", ".join(pieces)
 
 
-def _metrics_prompt_summary(metrics: Dict[str, Optional[float]]) -> str:
+def _metrics_prompt_summary(metrics: Mapping[str, Optional[float]]) -> str:
     lines: List[str] = []
     for key, label, value_type in _METRIC_FIELDS:
         value = metrics.get(key)
@@ -370,26 +722,61 @@ def _metrics_prompt_summary(metrics: Dict[str, Optional[float]]) -> str:
     return "\n".join(lines)
 
 
-def _format_metrics_table(metrics: Dict[str, Optional[float]]) -> str:
-    rows: List[str] = []
+def _format_metrics_table(metrics: Mapping[str, Optional[float]]) -> str:
+    rows = [row for _, row in _metric_rows(metrics)]
+    if not rows:
+        return "No fundamentals were returned by Yahoo Finance for this ticker."
+
+    header = "| Metric | Value |\n| --- | --- |"
+    return "\n".join([header] + rows)
+
+
+def _metric_rows(metrics: Mapping[str, Optional[float]]) -> List[Tuple[str, str]]:
+    """``(metric key, Markdown table row)`` for every metric with a value, in display order."""
+
+    rows: List[Tuple[str, str]] = []
     for key, label, value_type in _METRIC_FIELDS:
         value = metrics.get(key)
         if value is None:
             continue
         if value_type == "currency":
-            rows.append(f"| {label} | {_format_currency(value)} |")
+            rows.append((key, f"| {label} | {_format_currency(value)} |"))
         elif value_type == "percent":
-            rows.append(f"| {label} | {value:.2f}% |")
+            rows.append((key, f"| {label} | {value:.2f}% |"))
         else:
-            rows.append(f"| {label} | {value:.2f} |")
+            rows.append((key, f"| {label} | {value:.2f} |"))
+    return rows
 
-    if not rows:
-        return "No fundamentals were returned by Yahoo Finance for this ticker."
 
-    header = "| Metric | Value |\n| --- | --- |"
+def _format_portfolio_table(reports) -> str:
+    header = "| Ticker | Weight | P/E | ROE | Margin | Growth | D/E |\n| --- | --- | --- | --- | --- | --- | --- |"
+    rows: List[str] = []
+    for report in reports:
+        metrics = report.metrics
+        rows.append(
+            "| "
+            + " | ".join(
+                [
+                    report.ticker,
+                    f"{report.weight:.2%}",
+                    _format_optional(metrics.get("pe_ratio"), "{:.1f}"),
+                    _format_optional(metrics.get("roe"), "{:.1f}%"),
+                    _format_optional(metrics.get("profit_margin"), "{:.1f}%"),
+                    _format_optional(metrics.get("revenue_growth"), "{:.1f}%"),
+                    _format_optional(metrics.get("debt_to_equity"), "{:.2f}"),
+                ]
+            )
+            + " |"
+        )
     return "\n".join([header] + rows)
 
 
+def _format_optional(value: Optional[float], template: str) -> str:
+    if value is None:
+        return "--"
+    return template.format(float(value))
+
+
 def _format_currency(value: float) -> str:
     abs_value = abs(value)
     if abs_value >= 1_000_000_000_000:
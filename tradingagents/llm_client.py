@@ -1,22 +1,51 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import os
-from typing import Iterable, List, Optional
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
-try:
-    from openai import OpenAI
-except ImportError:  # pragma: no cover - handled at runtime
-    OpenAI = None  # type: ignore
+from tradingagents import llm_resilience
 
-try:
-    import google.generativeai as genai  # type: ignore
-except ImportError:  # pragma: no cover - handled at runtime
-    genai = None  # type: ignore
+if TYPE_CHECKING:
+    from tradingagents.disk_cache import DiskCache
 
 
 _DEFAULT_MODEL = os.getenv("TRADINGAGENTS_LLM_MODEL", "gemini-2.0-flash")
 LAST_LLM_ERROR: Optional[str] = None
 LAST_LLM_ERROR: Optional[str] = None
+LAST_LLM_CACHE_HIT = False
+LAST_PROMPT_TOKENS: Optional[int] = None
+
+# Normalised bullets are cached on disk keyed by (model, prompt hash, max_points),
+# so re-running a review over unchanged data skips the provider round trip.
+RESPONSE_CACHE_ENABLED = os.getenv("TRADINGAGENTS_LLM_CACHE", "1").strip().lower() not in ("0", "false", "no", "off")
+RESPONSE_CACHE_TTL = float(os.getenv("TRADINGAGENTS_LLM_CACHE_TTL", str(7 * 24 * 3600)))
+_RESPONSE_CACHE: Optional["DiskCache"] = None
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+# Provider clients are built once per process and shared across threads so
+# batch runs keep their HTTP keep-alive connections and TLS sessions.
+_OPENAI_CLIENTS: Dict[str, Any] = {}
+_GEMINI_MODELS: Dict[Tuple[str, str], Any] = {}
+_GEMINI_CONFIGURED_KEY: Optional[str] = None
+_CLIENTS_LOCK = threading.Lock()
+
+# Async callers share one worker pool; each event loop gets its own semaphore
+# per provider so at most PROVIDER_CONCURRENCY requests are in flight.
+PROVIDER_CONCURRENCY: Dict[str, int] = {
+    "openai": int(os.getenv("TRADINGAGENTS_OPENAI_CONCURRENCY", "8")),
+    "gemini": int(os.getenv("TRADINGAGENTS_GEMINI_CONCURRENCY", "8")),
+}
+_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, int], asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+_LLM_POOL: Optional[ThreadPoolExecutor] = None
+_ASYNC_LOCK = threading.Lock()
 
 
 def summarise_weight_points(
@@ -30,17 +59,390 @@ def summarise_weight_points(
     news_table: str,
     max_points: int = 6,
     model: Optional[str] = None,
+    use_cache: Optional[bool] = None,
+    on_point: Optional[Callable[[str], None]] = None,
 ) -> Optional[List[str]]:
     """Generate summary bullets using an LLM when available."""
 
-    global LAST_LLM_ERROR
-    LAST_LLM_ERROR = None
+    prompt = _build_weight_points_prompt(
+        ticker=ticker,
+        weight=weight,
+        as_of=as_of,
+        fundamental_points=fundamental_points,
+        news_points=news_points,
+        metrics_table=metrics_table,
+        news_table=news_table,
+        max_points=max_points,
+    )
+    return generate_bullets(
+        prompt, max_points=max_points, model=model, use_cache=use_cache, on_point=on_point
+    )
+
+
+async def asummarise_weight_points(
+    *,
+    ticker: str,
+    weight: float,
+    as_of: str,
+    fundamental_points: Iterable[str],
+    news_points: Iterable[str],
+    metrics_table: str,
+    news_table: str,
+    max_points: int = 6,
+    model: Optional[str] = None,
+    use_cache: Optional[bool] = None,
+) -> Optional[List[str]]:
+    """Awaitable ``summarise_weight_points``."""
+
+    prompt = _build_weight_points_prompt(
+        ticker=ticker,
+        weight=weight,
+        as_of=as_of,
+        fundamental_points=fundamental_points,
+        news_points=news_points,
+        metrics_table=metrics_table,
+        news_table=news_table,
+        max_points=max_points,
+    )
+    return await agenerate_bullets(prompt, max_points=max_points, model=model, use_cache=use_cache)
+
+
+def summarise_weight_points_packed(
+    requests: Sequence[Mapping[str, Any]],
+    *,
+    model: Optional[str] = None,
+    use_cache: Optional[bool] = None,
+) -> List[Optional[List[str]]]:
+    """Summarise several tickers' weights in one LLM request.
+
+    Each entry of ``requests`` holds the keyword arguments of
+    ``summarise_weight_points`` (``max_points`` defaults to 6). The shared
+    instructions are sent once and the model answers with a JSON object keyed
+    by ticker. Each ticker's bullets are validated and cached under the same
+    key a single ``summarise_weight_points`` call would use. Any ticker that
+    is missing or malformed in the reply is re-requested on its own; if the
+    request fails outright, nothing is re-requested and ``LAST_LLM_ERROR``
+    says why. Returns bullets (or None) aligned with ``requests``.
+    """
+
+    requests = _packed_requests(requests)
+    chosen_model, results, pending, keys = _packed_plan(requests, model, use_cache)
+    if chosen_model is None or not pending:
+        return results
+
+    prompt = _build_packed_prompt([requests[index] for index in pending])
+    _record_prompt_size(prompt, chosen_model)
+    text = _request_text(prompt, chosen_model)
+    for index in _settle_packed(text, requests, pending, results, keys):
+        results[index] = summarise_weight_points(**requests[index], model=chosen_model, use_cache=use_cache)
+    return results
+
+
+async def asummarise_weight_points_packed(
+    requests: Sequence[Mapping[str, Any]],
+    *,
+    model: Optional[str] = None,
+    use_cache: Optional[bool] = None,
+) -> List[Optional[List[str]]]:
+    """Awaitable ``summarise_weight_points_packed``; the pack holds one provider slot."""
+
+    requests = _packed_requests(requests)
+    loop = asyncio.get_running_loop()
+    pool = _llm_pool()
+    chosen_model, results, pending, keys = await loop.run_in_executor(
+        pool, _packed_plan, requests, model, use_cache
+    )
+    if chosen_model is None or not pending:
+        return results
+
+    prompt = _build_packed_prompt([requests[index] for index in pending])
+    _record_prompt_size(prompt, chosen_model)
+    async with _provider_semaphore(_provider_for(chosen_model)):
+        text = await loop.run_in_executor(pool, _request_text, prompt, chosen_model)
+    missing = await loop.run_in_executor(pool, _settle_packed, text, requests, pending, results, keys)
+    retried = await asyncio.gather(
+        *(
+            asummarise_weight_points(**requests[index], model=chosen_model, use_cache=use_cache)
+            for index in missing
+        )
+    )
+    for index, points in zip(missing, retried):
+        results[index] = points
+    return results
+
+
+def summarise_fundamentals(
+    *,
+    ticker: str,
+    weight: float,
+    as_of: str,
+    metrics_table: str,
+    metrics_summary: str,
+    max_points: int = 4,
+    model: Optional[str] = None,
+    use_cache: Optional[bool] = None,
+    on_point: Optional[Callable[[str], None]] = None,
+) -> Optional[List[str]]:
+    """Summarise key fundamental data into actionable bullets."""
+
+    prompt = _build_fundamentals_prompt(
+        ticker=ticker,
+        weight=weight,
+        as_of=as_of,
+        metrics_table=metrics_table,
+        metrics_summary=metrics_summary,
+        max_points=max_points,
+    )
+    return generate_bullets(
+        prompt, max_points=max_points, model=model, use_cache=use_cache, on_point=on_point
+    )
+
+
+async def asummarise_fundamentals(
+    *,
+    ticker: str,
+    weight: float,
+    as_of: str,
+    metrics_table: str,
+    metrics_summary: str,
+    max_points: int = 4,
+    model: Optional[str] = None,
+    use_cache: Optional[bool] = None,
+) -> Optional[List[str]]:
+    """Awaitable ``summarise_fundamentals``."""
+
+    prompt = _build_fundamentals_prompt(
+        ticker=ticker,
+        weight=weight,
+        as_of=as_of,
+        metrics_table=metrics_table,
+        metrics_summary=metrics_summary,
+        max_points=max_points,
+    )
+    return await agenerate_bullets(prompt, max_points=max_points, model=model, use_cache=use_cache)
+
+
+def summarise_news(
+    *,
+    ticker: str,
+    weight: float,
+    as_of: str,
+    lookback_days: int,
+    article_summaries: str,
+    net_sentiment: int,
+    max_points: int = 4,
+    model: Optional[str] = None,
+    use_cache: Optional[bool] = None,
+    on_point: Optional[Callable[[str], None]] = None,
+) -> Optional[List[str]]:
+    """Summarise headline flow into guidance bullets."""
+
+    prompt = _build_news_prompt(
+        ticker=ticker,
+        weight=weight,
+        as_of=as_of,
+        lookback_days=lookback_days,
+        article_summaries=article_summaries,
+        net_sentiment=net_sentiment,
+        max_points=max_points,
+    )
+    return generate_bullets(
+        prompt, max_points=max_points, model=model, use_cache=use_cache, on_point=on_point
+    )
+
+
+async def asummarise_news(
+    *,
+    ticker: str,
+    weight: float,
+    as_of: str,
+    lookback_days: int,
+    article_summaries: str,
+    net_sentiment: int,
+    max_points: int = 4,
+    model: Optional[str] = None,
+    use_cache: Optional[bool] = None,
+) -> Optional[List[str]]:
+    """Awaitable ``summarise_news``."""
+
+    prompt = _build_news_prompt(
+        ticker=ticker,
+        weight=weight,
+        as_of=as_of,
+        lookback_days=lookback_days,
+        article_summaries=article_summaries,
+        net_sentiment=net_sentiment,
+        max_points=max_points,
+    )
+    return await agenerate_bullets(prompt, max_points=max_points, model=model, use_cache=use_cache)
+
+
+def generate_bullets(
+    prompt: str,
+    *,
+    max_points: int = 6,
+    model: Optional[str] = None,
+    use_cache: Optional[bool] = None,
+    on_point: Optional[Callable[[str], None]] = None,
+) -> Optional[List[str]]:
+    """Shared helper that routes to the configured LLM provider.
+
+    ``use_cache`` overrides ``RESPONSE_CACHE_ENABLED`` for this call; a bypassed
+    call neither reads nor writes the response cache. With ``on_point`` the
+    response is streamed and each bullet is passed to it as soon as it is
+    complete (see ``stream_bullets``).
+    """
+
+    if on_point is not None:
+        points: List[str] = []
+        stream = _stream_points(prompt, max_points, model, use_cache)
+        while True:
+            try:
+                point = next(stream)
+            except StopIteration as stop:
+                completed = stop.value
+                break
+            points.append(point)
+            on_point(point)
+        # Bullets from a stream that failed part-way are shown but not used as the rationale.
+        return points if completed else None
+
+    chosen_model, cache_key = _begin_call(prompt, max_points, model, use_cache)
+    if chosen_model is None:
+        return None
+    if cache_key is not None:
+        cached = _cached_points(cache_key)
+        if cached is not None:
+            return cached
+    return _invoke(prompt, max_points, chosen_model, cache_key)
+
+
+def stream_bullets(
+    prompt: str,
+    *,
+    max_points: int = 6,
+    model: Optional[str] = None,
+    use_cache: Optional[bool] = None,
+) -> Iterator[str]:
+    """Yield normalised bullets as the provider streams them.
+
+    Each line is yielded once its newline arrives (the last one when the stream
+    ends), and the provider stream is closed as soon as ``max_points`` bullets
+    are complete. Cache hits are replayed; a completed stream is cached like a
+    ``generate_bullets`` result. Failures end the iteration early, are
+    reported through ``LAST_LLM_ERROR`` and leave the cache untouched.
+    """
+
+    yield from _stream_points(prompt, max_points, model, use_cache)
+
+
+def _stream_points(
+    prompt: str,
+    max_points: int,
+    model: Optional[str],
+    use_cache: Optional[bool],
+) -> Generator[str, None, bool]:
+    """``stream_bullets`` body; returns True only when the bullets are complete."""
+
+    chosen_model, cache_key = _begin_call(prompt, max_points, model, use_cache)
+    if chosen_model is None:
+        return False
+    if cache_key is not None:
+        cached = _cached_points(cache_key)
+        if cached is not None:
+            yield from cached
+            return True
+
+    bullets = _BulletStream(max_points)
+    points: List[str] = []
+    deltas = _stream_text(prompt, chosen_model)
+    try:
+        for delta in deltas:
+            for point in bullets.feed(delta):
+                points.append(point)
+                yield point
+            if bullets.complete:
+                break
+        else:
+            for point in bullets.finish():
+                points.append(point)
+                yield point
+    except _StreamFailed as exc:
+        # A truncated list must not be cached as the answer to this prompt.
+        _set_error(str(exc))
+        return False
+    finally:
+        deltas.close()
+
+    if not points:
+        if LAST_LLM_ERROR is None:
+            _set_error("LLM stream contained no text output")
+        return False
+    if cache_key is not None:
+        _response_cache().set(cache_key, list(points))
+    return True
+
+
+async def agenerate_bullets(
+    prompt: str,
+    *,
+    max_points: int = 6,
+    model: Optional[str] = None,
+    use_cache: Optional[bool] = None,
+) -> Optional[List[str]]:
+    """Awaitable ``generate_bullets`` with bounded per-provider concurrency.
+
+    The blocking SDK call runs on a shared worker pool while at most
+    ``PROVIDER_CONCURRENCY[provider]`` requests per provider are in flight on
+    the running event loop. Cache hits never wait for a provider slot.
+    """
+
+    chosen_model, cache_key = _begin_call(prompt, max_points, model, use_cache)
+    if chosen_model is None:
+        return None
+
+    loop = asyncio.get_running_loop()
+    pool = _llm_pool()
+    if cache_key is not None:
+        cached = await loop.run_in_executor(pool, _cached_points, cache_key)
+        if cached is not None:
+            return cached
+
+    async with _provider_semaphore(_provider_for(chosen_model)):
+        return await loop.run_in_executor(pool, _invoke, prompt, max_points, chosen_model, cache_key)
+
+
+def set_provider_concurrency(provider: str, limit: int) -> None:
+    """Cap in-flight async requests for ``provider`` ("openai" or "gemini")."""
+
+    if provider not in PROVIDER_CONCURRENCY:
+        raise ValueError(f"Unknown LLM provider {provider!r}; expected one of {sorted(PROVIDER_CONCURRENCY)}")
+    if limit <= 0:
+        raise ValueError("limit must be positive")
+    PROVIDER_CONCURRENCY[provider] = limit
+
+
+def clear_response_cache() -> None:
+    """Drop every cached LLM response."""
 
+    _response_cache().clear()
 
+
+def _build_weight_points_prompt(
+    *,
+    ticker: str,
+    weight: float,
+    as_of: str,
+    fundamental_points: Iterable[str],
+    news_points: Iterable[str],
+    metrics_table: str,
+    news_table: str,
+    max_points: int,
+) -> str:
     fundamental_text = "\n".join(f"- {point}" for point in fundamental_points)
     news_text = "\n".join(f"- {point}" for point in news_points)
 
-    prompt = f"""
+    return f"""
 You are assisting a portfolio manager. Produce up to {max_points} succinct bullet points
 that justify the current weight for {ticker} as of {as_of}. Blend fundamentals and news insights. You can either support or challenge the weight based on the data provided. Try to provide unique points that do not overlap with each other.
 
@@ -62,22 +464,16 @@ Output format: one bullet per line, concise, informative, no numbering, no pream
 """.strip()
 
 
-    return generate_bullets(prompt, max_points=max_points, model=model)
-
-
-def summarise_fundamentals(
+def _build_fundamentals_prompt(
     *,
     ticker: str,
     weight: float,
     as_of: str,
     metrics_table: str,
     metrics_summary: str,
-    max_points: int = 4,
-    model: Optional[str] = None,
-) -> Optional[List[str]]:
-    """Summarise key fundamental data into actionable bullets."""
-
-    prompt = f"""
+    max_points: int,
+) -> str:
+    return f"""
 You are the fundamentals analyst on a portfolio desk. Review the metrics and craft up to {max_points} bullet points that explain whether the current allocation for {ticker} at {weight:.2%} is justified as of {as_of}.
 
 Key metrics overview:
@@ -92,10 +488,8 @@ Output requirements:
 - Keep bullets concise and avoid repeating facts.
 """.strip()
 
-    return generate_bullets(prompt, max_points=max_points, model=model)
-
 
-def summarise_news(
+def _build_news_prompt(
     *,
     ticker: str,
     weight: float,
@@ -103,12 +497,9 @@ def summarise_news(
     lookback_days: int,
     article_summaries: str,
     net_sentiment: int,
-    max_points: int = 4,
-    model: Optional[str] = None,
-) -> Optional[List[str]]:
-    """Summarise headline flow into guidance bullets."""
-
-    prompt = f"""
+    max_points: int,
+) -> str:
+    return f"""
 You are the news-flow specialist on a portfolio team. Recent vendor headlines for {ticker} over the last {lookback_days} day(s) carry a net sentiment score of {net_sentiment} (positives minus negatives).
 
 The portfolio holds a {weight:.2%} weight as of {as_of}. Produce up to {max_points} bullet points advising how to manage this weight given the news.
@@ -122,40 +513,259 @@ Output requirements:
 - Keep bullets concise and avoid duplicating points.
 """.strip()
 
-    return generate_bullets(prompt, max_points=max_points, model=model)
 
+def _build_packed_prompt(requests: Sequence[Mapping[str, Any]]) -> str:
+    sections = []
+    for request in requests:
+        fundamental_text = "\n".join(f"- {point}" for point in request["fundamental_points"])
+        news_text = "\n".join(f"- {point}" for point in request["news_points"])
+        sections.append(
+            f"""
+=== TICKER: {request["ticker"]} ===
+Bullets wanted: up to {request["max_points"]}
+As of: {request["as_of"]}
+Current portfolio weight: {request["weight"]:.2%}
 
-def generate_bullets(
-    prompt: str,
-    *,
-    max_points: int = 6,
-    model: Optional[str] = None,
-) -> Optional[List[str]]:
-    """Shared helper that routes to the configured LLM provider."""
+Fundamental signals:
+{fundamental_text or "(none)"}
 
-    global LAST_LLM_ERROR
+News signals:
+{news_text or "(none)"}
+
+Fundamental metrics table (Markdown):
+{request["metrics_table"] or "(none)"}
+
+News headlines table (Markdown):
+{request["news_table"] or "(none)"}
+""".strip()
+        )
+
+    tickers = ", ".join(request["ticker"] for request in requests)
+    return (
+        "You are assisting a portfolio manager. For each ticker section below, produce succinct bullet points "
+        "that justify that ticker's current weight as of its date. Blend fundamentals and news insights. You can "
+        "either support or challenge the weight based on the data provided. Use only the data in a ticker's own "
+        "section and keep its points unique.\n\n"
+        + "\n\n".join(sections)
+        + f"\n\nOutput format: a single JSON object whose keys are exactly these ticker symbols ({tickers}) and "
+        "whose values are arrays of bullet strings, respecting each ticker's bullet limit. No numbering, no "
+        "markdown fences, no text outside the JSON."
+    )
+
+
+def _packed_requests(requests: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    prepared: List[Dict[str, Any]] = []
+    seen = set()
+    for request in requests:
+        entry = dict(request)
+        entry["ticker"] = str(entry["ticker"]).strip().upper()
+        entry["max_points"] = int(entry.get("max_points", 6))
+        entry["fundamental_points"] = list(entry["fundamental_points"])
+        entry["news_points"] = list(entry["news_points"])
+        if entry["ticker"] in seen:
+            raise ValueError(f"Duplicate ticker {entry['ticker']} in packed request")
+        seen.add(entry["ticker"])
+        prepared.append(entry)
+    return prepared
+
+
+def _packed_plan(
+    requests: List[Dict[str, Any]], model: Optional[str], use_cache: Optional[bool]
+) -> Tuple[Optional[str], List[Optional[List[str]]], List[int], List[Optional[str]]]:
+    """Resolve the model and serve cached tickers; return (model, results, pending indices, cache keys)."""
+
+    results: List[Optional[List[str]]] = [None] * len(requests)
+    keys: List[Optional[str]] = [None] * len(requests)
+    pending: List[int] = []
+    chosen_model = None
+    for index, request in enumerate(requests):
+        # Each ticker shares the cache entry of the equivalent single-ticker prompt.
+        chosen_model, keys[index] = _begin_call(
+            _build_weight_points_prompt(**request), request["max_points"], model, use_cache
+        )
+        if chosen_model is None:
+            return None, results, [], keys
+        cached = _cached_points(keys[index]) if keys[index] is not None else None
+        if cached is None:
+            pending.append(index)
+        else:
+            results[index] = cached
+    return chosen_model, results, pending, keys
+
+
+def _settle_packed(
+    text: Optional[str],
+    requests: List[Dict[str, Any]],
+    pending: List[int],
+    results: List[Optional[List[str]]],
+    keys: List[Optional[str]],
+) -> List[int]:
+    """Fill ``results`` from a packed reply; return the indices to re-request singly.
+
+    Only tickers absent from a reply that arrived are retried. When the request
+    itself failed (transport error, open circuit, rate limit) every pending
+    result stays None, so one failed pack does not become N more requests to a
+    provider that is already failing.
+    """
+
+    if not text:
+        if LAST_LLM_ERROR is None:
+            _set_error("Packed response contained no text output")
+        return []
+    parsed = _parse_packed_output(text)
+    missing: List[int] = []
+    for index in pending:
+        request = requests[index]
+        points = _packed_points(parsed.get(request["ticker"]), request["max_points"])
+        if not points:
+            missing.append(index)
+            continue
+        results[index] = points
+        if keys[index] is not None:
+            _response_cache().set(keys[index], list(points))
+    if missing:
+        _set_error(
+            "Packed response omitted "
+            + ", ".join(requests[index]["ticker"] for index in missing)
+            + "; re-requesting individually"
+        )
+    return missing
+
+
+def _parse_packed_output(raw_text: str) -> Dict[str, Any]:
+    start = raw_text.find("{")
+    end = raw_text.rfind("}")
+    if start < 0 or end <= start:
+        return {}
+    try:
+        payload = json.loads(raw_text[start:end + 1])
+    except ValueError:
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+    return {str(key).strip().upper(): value for key, value in payload.items()}
+
+
+def _packed_points(value: Any, max_points: int) -> Optional[List[str]]:
+    if isinstance(value, str):
+        return _normalise_output(value, max_points) or None
+    if not isinstance(value, list):
+        return None
+    lines = [item for item in value if isinstance(item, str)]
+    return _normalise_output("\n".join(lines), max_points) or None
+
+
+def _begin_call(
+    prompt: str, max_points: int, model: Optional[str], use_cache: Optional[bool]
+) -> Tuple[Optional[str], Optional[str]]:
+    """Reset per-call status; return the model (None if unset) and the cache key (None if bypassed)."""
+
+    global LAST_LLM_ERROR, LAST_LLM_CACHE_HIT, LAST_PROMPT_TOKENS
     LAST_LLM_ERROR = None
+    LAST_LLM_CACHE_HIT = False
 
     chosen_model = (model or _DEFAULT_MODEL).strip()
     if not chosen_model:
         LAST_LLM_ERROR = "No model provided"
-        return None
+        return None, None
+    LAST_PROMPT_TOKENS = _count_tokens(prompt, chosen_model)
+    if not (RESPONSE_CACHE_ENABLED if use_cache is None else use_cache):
+        return chosen_model, None
+    return chosen_model, _response_cache_key(chosen_model, prompt, max_points)
 
-    if _looks_like_gemini(chosen_model):
-        return _invoke_gemini(prompt, max_points, chosen_model)
 
-    return _invoke_openai(prompt, max_points, chosen_model)
+def _count_tokens(prompt: str, model: str) -> int:
+    from tradingagents.prompt_budget import count_tokens
 
+    return count_tokens(prompt, model=model)
 
-def _invoke_openai(prompt: str, max_points: int, model: str) -> Optional[List[str]]:
+
+def _record_prompt_size(prompt: str, model: str) -> None:
+    global LAST_PROMPT_TOKENS
+    LAST_PROMPT_TOKENS = _count_tokens(prompt, model)
+
+
+def _cached_points(cache_key: str) -> Optional[List[str]]:
+    global LAST_LLM_CACHE_HIT
+    cached = _response_cache().get(cache_key, max_age=RESPONSE_CACHE_TTL)
+    if isinstance(cached, list) and cached:
+        LAST_LLM_CACHE_HIT = True
+        return list(cached)
+    return None
+
+
+def _invoke(prompt: str, max_points: int, model: str, cache_key: Optional[str]) -> Optional[List[str]]:
+    text = _request_text(prompt, model)
+    points = _normalise_output(text, max_points) if text is not None else None
+
+    if cache_key is not None and points:
+        _response_cache().set(cache_key, list(points))
+    return points
+
+
+def _request_text(prompt: str, model: str) -> Optional[str]:
+    if _looks_like_gemini(model):
+        return _request_gemini(prompt, model)
+    return _request_openai(prompt, model)
+
+
+def _provider_for(model: str) -> str:
+    return "gemini" if _looks_like_gemini(model) else "openai"
+
+
+def _provider_semaphore(provider: str) -> asyncio.Semaphore:
+    """Per-event-loop semaphore for ``provider``, rebuilt when its limit changes."""
+
+    loop = asyncio.get_running_loop()
+    limit = PROVIDER_CONCURRENCY[provider]
+    with _ASYNC_LOCK:
+        semaphores = _SEMAPHORES.setdefault(loop, {})
+        semaphore = semaphores.get((provider, limit))
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(limit)
+            semaphores[(provider, limit)] = semaphore
+        return semaphore
+
+
+def _llm_pool() -> ThreadPoolExecutor:
+    global _LLM_POOL
+    with _ASYNC_LOCK:
+        if _LLM_POOL is None:
+            # Workers only block on provider I/O, so size for the summed limits.
+            _LLM_POOL = ThreadPoolExecutor(
+                max_workers=max(32, sum(PROVIDER_CONCURRENCY.values())),
+                thread_name_prefix="llm",
+            )
+        return _LLM_POOL
+
+
+def _response_cache() -> "DiskCache":
+    global _RESPONSE_CACHE
+    with _RESPONSE_CACHE_LOCK:
+        if _RESPONSE_CACHE is None:
+            from tradingagents.disk_cache import DiskCache
+
+            _RESPONSE_CACHE = DiskCache("llm-responses", max_entries=1024)
+        return _RESPONSE_CACHE
+
+
+def _response_cache_key(model: str, prompt: str, max_points: int) -> str:
+    digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=20).hexdigest()
+    return f"{model}\x1f{max_points}\x1f{digest}"
+
+
+def _request_openai(prompt: str, model: str) -> Optional[str]:
     api_key = os.getenv("OPENAI_API_KEY")
+    OpenAI = _load_openai() if api_key else None
     if not api_key or OpenAI is None:
         _set_error("OpenAI client unavailable or OPENAI_API_KEY missing")
         return None
 
-    client = OpenAI(api_key=api_key)
     try:
-        response = client.responses.create(
+        client = _openai_client(OpenAI, api_key)
+        response = llm_resilience.call(
+            "openai",
+            client.responses.create,
             model=model,
             input=prompt,
         )
@@ -172,29 +782,28 @@ def _invoke_openai(prompt: str, max_points: int, model: str) -> Optional[List[st
         content = getattr(message, "content", []) or []
         for item in content:
             if getattr(item, "type", "") == "text":
-                text = getattr(item, "text", "")
-                return _normalise_output(text, max_points)
+                return getattr(item, "text", "")
     _set_error("OpenAI response contained no text output")
     return None
 
 
-def _invoke_gemini(prompt: str, max_points: int, model: str) -> Optional[List[str]]:
+def _request_gemini(prompt: str, model: str) -> Optional[str]:
     api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
+    genai = _load_genai() if api_key else None
     if not api_key or genai is None:
         _set_error("Gemini client unavailable or GOOGLE_API_KEY/GEMINI_API_KEY missing")
         return None
 
     try:
-        genai.configure(api_key=api_key)
-        generation_model = genai.GenerativeModel(model)
-        response = generation_model.generate_content(prompt)
+        generation_model = _gemini_model(genai, api_key, model)
+        response = llm_resilience.call("gemini", generation_model.generate_content, prompt)
     except Exception as exc:  # noqa: BLE001
         _set_error(f"Gemini request failed: {exc}")
         return None
 
     text = getattr(response, "text", None)
     if isinstance(text, str) and text.strip():
-        return _normalise_output(text, max_points)
+        return text
 
     for candidate in getattr(response, "candidates", []) or []:
         content = getattr(candidate, "content", None)
@@ -204,27 +813,194 @@ def _invoke_gemini(prompt: str, max_points: int, model: str) -> Optional[List[st
         for part in parts:
             part_text = getattr(part, "text", None)
             if isinstance(part_text, str) and part_text.strip():
-                return _normalise_output(part_text, max_points)
+                return part_text
 
     _set_error("Gemini response contained no text output")
     return None
 
 
+class _StreamFailed(RuntimeError):
+    """A provider stream could not be opened or broke before it finished."""
+
+
+def _stream_text(prompt: str, model: str) -> Iterator[str]:
+    if _looks_like_gemini(model):
+        return _stream_gemini(prompt, model)
+    return _stream_openai(prompt, model)
+
+
+def _stream_openai(prompt: str, model: str) -> Iterator[str]:
+    api_key = os.getenv("OPENAI_API_KEY")
+    OpenAI = _load_openai() if api_key else None
+    if not api_key or OpenAI is None:
+        _set_error("OpenAI client unavailable or OPENAI_API_KEY missing")
+        return
+
+    try:
+        client = _openai_client(OpenAI, api_key)
+        # Only opening the stream is retried; a failure mid-stream ends it.
+        stream = llm_resilience.call("openai", client.responses.create, model=model, input=prompt, stream=True)
+    except Exception as exc:  # noqa: BLE001
+        raise _StreamFailed(f"OpenAI request failed: {exc}") from exc
+
+    try:
+        for event in stream:
+            event_type = getattr(event, "type", "")
+            if event_type == "response.output_text.delta":
+                delta = getattr(event, "delta", "")
+                if delta:
+                    yield delta
+            elif event_type in ("error", "response.failed"):
+                raise _StreamFailed(f"OpenAI stream failed: {getattr(event, 'message', None) or event_type}")
+    except _StreamFailed:
+        raise
+    except Exception as exc:  # noqa: BLE001
+        raise _StreamFailed(f"OpenAI stream failed: {exc}") from exc
+    finally:
+        close = getattr(stream, "close", None)
+        if callable(close):
+            close()
+
+
+def _stream_gemini(prompt: str, model: str) -> Iterator[str]:
+    api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
+    genai = _load_genai() if api_key else None
+    if not api_key or genai is None:
+        _set_error("Gemini client unavailable or GOOGLE_API_KEY/GEMINI_API_KEY missing")
+        return
+
+    try:
+        generation_model = _gemini_model(genai, api_key, model)
+        response = llm_resilience.call("gemini", generation_model.generate_content, prompt, stream=True)
+        for chunk in response:
+            try:
+                text = chunk.text
+            except ValueError:
+                # Chunks without text parts (e.g. a trailing safety rating) raise here.
+                continue
+            if text:
+                yield text
+    except Exception as exc:  # noqa: BLE001
+        raise _StreamFailed(f"Gemini stream failed: {exc}") from exc
+
+
+def _openai_client(OpenAI: Any, api_key: str) -> Any:
+    """One OpenAI client per API key; the SDK client is safe to share across threads."""
+
+    with _CLIENTS_LOCK:
+        client = _OPENAI_CLIENTS.get(api_key)
+        if client is None:
+            # Retries happen in llm_resilience, under the retry budget and breaker.
+            client = OpenAI(api_key=api_key, max_retries=0)
+            _OPENAI_CLIENTS[api_key] = client
+        return client
+
+
+def _gemini_model(genai: Any, api_key: str, model: str) -> Any:
+    """One GenerativeModel per (API key, model name).
+
+    ``genai.configure`` swaps module-global state, so it only runs when the key
+    changes; models built under a previous key are dropped at that point.
+    """
+
+    global _GEMINI_CONFIGURED_KEY
+    with _CLIENTS_LOCK:
+        if _GEMINI_CONFIGURED_KEY != api_key:
+            genai.configure(api_key=api_key)
+            _GEMINI_CONFIGURED_KEY = api_key
+            _GEMINI_MODELS.clear()
+        handle = _GEMINI_MODELS.get((api_key, model))
+        if handle is None:
+            handle = genai.GenerativeModel(model)
+            _GEMINI_MODELS[(api_key, model)] = handle
+        return handle
+
+
+def reset_llm_clients() -> None:
+    """Close and forget pooled provider clients (e.g. after rotating API keys)."""
+
+    global _GEMINI_CONFIGURED_KEY
+    with _CLIENTS_LOCK:
+        clients = list(_OPENAI_CLIENTS.values())
+        _OPENAI_CLIENTS.clear()
+        _GEMINI_MODELS.clear()
+        _GEMINI_CONFIGURED_KEY = None
+    for client in clients:
+        close = getattr(client, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception:  # noqa: BLE001
+                pass
+
+
+def _load_openai() -> Any:
+    # Provider SDKs are imported on first use; both cost hundreds of milliseconds.
+    try:
+        from openai import OpenAI
+    except ImportError:  # pragma: no cover - handled at runtime
+        return None
+    return OpenAI
+
+
+def _load_genai() -> Any:
+    try:
+        import google.generativeai as genai  # type: ignore
+    except ImportError:  # pragma: no cover - handled at runtime
+        return None
+    return genai
+
+
 def _looks_like_gemini(model: str) -> bool:
     lowered = model.lower()
     return lowered.startswith("gemini") or lowered.startswith("flash-")
 
 
 def _normalise_output(raw_text: str, max_points: int) -> List[str]:
-    lines: List[str] = []
-    for line in raw_text.splitlines():
-        cleaned = line.strip().lstrip("-•*").strip()
-        if not cleaned:
-            continue
-        lines.append(cleaned)
-        if len(lines) >= max_points:
-            break
-    return lines
+    bullets = _BulletStream(max_points)
+    return bullets.feed(raw_text) + bullets.finish()
+
+
+class _BulletStream:
+    """Incremental ``_normalise_output``: turns streamed text deltas into finished bullets."""
+
+    __slots__ = ("_max_points", "_pending", "_emitted")
+
+    def __init__(self, max_points: int):
+        self._max_points = max_points
+        self._pending = ""
+        self._emitted = 0
+
+    @property
+    def complete(self) -> bool:
+        return self._emitted >= self._max_points
+
+    def feed(self, delta: str) -> List[str]:
+        """Bullets completed by ``delta`` (lines whose terminator has arrived)."""
+
+        *lines, self._pending = (self._pending + delta).splitlines(keepends=True) or [""]
+        if self._pending.endswith(("\n", "\r")):
+            lines.append(self._pending)
+            self._pending = ""
+        return self._accept(lines)
+
+    def finish(self) -> List[str]:
+        """Flush the unterminated last line once the stream ends."""
+
+        pending, self._pending = self._pending, ""
+        return self._accept([pending])
+
+    def _accept(self, lines: List[str]) -> List[str]:
+        points: List[str] = []
+        for line in lines:
+            if self.complete:
+                break
+            cleaned = line.strip().lstrip("-•*").strip()
+            if not cleaned:
+                continue
+            points.append(cleaned)
+            self._emitted += 1
+        return points
 
 
 def _set_error(message: str) -> None:
@@ -0,0 +1,421 @@
+"""Rate limiting, retries and circuit breaking around LLM provider calls.
+
+Every provider request goes through ``call(provider, fn, ...)``, which:
+
+* waits on a per-provider token bucket (``TRADINGAGENTS_<PROVIDER>_RATE``
+  requests per second, bursting to ``_BURST``), failing with
+  ``RateLimitedError`` rather than queueing longer than ``max_wait``;
+* retries throttling, timeout and 5xx errors with full-jitter exponential
+  backoff, honouring ``Retry-After`` when the SDK exposes it, while a retry
+  budget caps retries at a fraction of recent requests so an outage does not
+  multiply traffic;
+* trips a circuit breaker after consecutive transient failures, failing fast
+  with ``CircuitOpenError`` until a cool-down passes and a probe succeeds.
+
+Client errors (bad request, auth) are raised at once and do not count against
+the breaker.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+_RETRYABLE_STATUS = frozenset({408, 409, 425, 429, 500, 502, 503, 504})
+_RETRYABLE_NAMES = (
+    "RateLimit",
+    "Timeout",
+    "TimedOut",
+    "ResourceExhausted",
+    "DeadlineExceeded",
+    "ServiceUnavailable",
+    "InternalServerError",
+    "APIConnectionError",
+    "TooManyRequests",
+)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider whose circuit breaker is open."""
+
+
+class RateLimitedError(RuntimeError):
+    """Raised when the local rate limit would delay a request longer than ``max_wait``."""
+
+
+@dataclass(frozen=True, slots=True)
+class ResilienceConfig:
+    rate: float = 5.0
+    burst: int = 5
+    max_wait: float = 30.0
+    max_attempts: int = 4
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    retry_ratio: float = 0.2
+    retry_reserve: float = 5.0
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+
+    @classmethod
+    def from_env(cls, provider: str) -> "ResilienceConfig":
+        prefix = f"TRADINGAGENTS_{provider.upper()}_"
+        defaults = cls()
+        return cls(
+            rate=_env_float(prefix + "RATE", defaults.rate),
+            burst=int(_env_float(prefix + "BURST", defaults.burst)),
+            max_wait=_env_float("TRADINGAGENTS_LLM_MAX_WAIT", defaults.max_wait),
+            max_attempts=int(_env_float("TRADINGAGENTS_LLM_MAX_ATTEMPTS", defaults.max_attempts)),
+            backoff_base=_env_float("TRADINGAGENTS_LLM_BACKOFF_BASE", defaults.backoff_base),
+            backoff_max=_env_float("TRADINGAGENTS_LLM_BACKOFF_MAX", defaults.backoff_max),
+            retry_ratio=_env_float("TRADINGAGENTS_LLM_RETRY_RATIO", defaults.retry_ratio),
+            failure_threshold=int(_env_float("TRADINGAGENTS_LLM_BREAKER_THRESHOLD", defaults.failure_threshold)),
+            reset_timeout=_env_float("TRADINGAGENTS_LLM_BREAKER_RESET", defaults.reset_timeout),
+        )
+
+    def validate(self) -> "ResilienceConfig":
+        if self.rate < 0:
+            raise ValueError("rate must be non-negative (0 disables rate limiting)")
+        if self.burst <= 0:
+            raise ValueError("burst must be positive")
+        if self.max_attempts <= 0:
+            raise ValueError("max_attempts must be positive")
+        if self.backoff_base < 0 or self.backoff_max < 0:
+            raise ValueError("backoff delays must be non-negative")
+        if not (0.0 <= self.retry_ratio <= 1.0):
+            raise ValueError("retry_ratio must be between 0.0 and 1.0")
+        if self.failure_threshold <= 0:
+            raise ValueError("failure_threshold must be positive")
+        if self.reset_timeout < 0:
+            raise ValueError("reset_timeout must be non-negative")
+        return self
+
+
+@dataclass(slots=True)
+class ProviderStatus:
+    """Counters for one provider since start-up (or the last ``reset``)."""
+
+    provider: str
+    state: str = "closed"
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    rejected: int = 0
+    throttled_seconds: float = 0.0
+    reopens_in: Optional[float] = None
+
+    def describe(self) -> str:
+        parts = [f"{self.provider} circuit {self.state}"]
+        if self.reopens_in is not None:
+            parts[0] += f" (probe in {self.reopens_in:.0f}s)"
+        parts.append(f"{self.requests} request{'s' if self.requests != 1 else ''}")
+        if self.retries:
+            parts.append(f"{self.retries} retr{'ies' if self.retries != 1 else 'y'}")
+        if self.failures:
+            parts.append(f"{self.failures} failed")
+        if self.rejected:
+            parts.append(f"{self.rejected} rejected")
+        if self.throttled_seconds >= 0.05:
+            parts.append(f"{self.throttled_seconds:.1f}s throttled")
+        return ", ".join(parts)
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``rate`` of 0 disables limiting."""
+
+    def __init__(self, rate: float, capacity: int):
+        self._rate = rate
+        self._capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: float) -> Optional[float]:
+        """Take a token, returning how long to wait before using it (None if over ``max_wait``)."""
+
+        if self._rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            wait = max(0.0, (1.0 - self._tokens) / self._rate)
+            if wait > max_wait:
+                return None
+            # Going negative reserves a future token, keeping waiters in arrival order.
+            self._tokens -= 1.0
+            return wait
+
+
+class RetryBudget:
+    """Allows retries up to ``ratio`` of recent requests, plus a small ``reserve``."""
+
+    def __init__(self, ratio: float, reserve: float):
+        self._ratio = ratio
+        self._reserve = reserve
+        self._balance = reserve
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._balance = min(self._reserve + 100 * self._ratio, self._balance + self._ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._balance < 1.0:
+                return False
+            self._balance -= 1.0
+            return True
+
+
+class CircuitBreaker:
+    """Closed → open after ``threshold`` consecutive failures → half-open probe after ``reset_timeout``."""
+
+    def __init__(self, threshold: int, reset_timeout: float):
+        self._threshold = threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or time.monotonic() - self._opened_at < self._reset_timeout:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def release(self) -> None:
+        """Give back a probe slot taken by ``allow`` when no request was actually made."""
+
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self._threshold:
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._probing or time.monotonic() - self._opened_at >= self._reset_timeout:
+                return "half-open"
+            return "open"
+
+    def reopens_in(self) -> Optional[float]:
+        with self._lock:
+            if self._opened_at is None:
+                return None
+            return max(0.0, self._reset_timeout - (time.monotonic() - self._opened_at))
+
+
+class _ProviderGuard:
+    def __init__(self, provider: str, config: ResilienceConfig):
+        self.provider = provider
+        self.config = config
+        self.bucket = TokenBucket(config.rate, config.burst)
+        self.budget = RetryBudget(config.retry_ratio, config.retry_reserve)
+        self.breaker = CircuitBreaker(config.failure_threshold, config.reset_timeout)
+        self.status = ProviderStatus(provider)
+        self._lock = threading.Lock()
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        self.budget.deposit()
+        attempt = 0
+        last_error: Optional[Exception] = None
+        while True:
+            try:
+                self._admit()
+            except (CircuitOpenError, RateLimitedError):
+                if last_error is None:
+                    raise
+                # A retry that cannot go out reports the provider's failure, not the local refusal.
+                self._count("failures")
+                raise last_error
+            self._count("requests")
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as exc:  # noqa: BLE001 - classified below, then re-raised
+                if not is_retryable(exc):
+                    # The provider answered; a bad request says nothing about its health.
+                    self.breaker.record_success()
+                    self._count("failures")
+                    raise
+                self.breaker.record_failure()
+                attempt += 1
+                if (
+                    attempt >= self.config.max_attempts
+                    or self.breaker.state() != "closed"
+                    or not self.budget.withdraw()
+                ):
+                    # Once this failure has opened the breaker, retrying would only
+                    # replace the provider's error with CircuitOpenError.
+                    self._count("failures")
+                    raise
+                last_error = exc
+                self._count("retries")
+                time.sleep(self._backoff(attempt, retry_after(exc)))
+                continue
+            except BaseException:
+                # Interrupted before the provider answered: says nothing about its health.
+                self.breaker.release()
+                raise
+            self.breaker.record_success()
+            return result
+
+    def _admit(self) -> None:
+        """Pass the breaker and the rate limit, releasing any probe slot if the request never goes out."""
+
+        if not self.breaker.allow():
+            self._count("rejected")
+            remaining = self.breaker.reopens_in() or 0.0
+            raise CircuitOpenError(
+                f"{self.provider} circuit open after repeated failures; next probe in {remaining:.0f}s"
+            )
+        try:
+            wait = self.bucket.reserve(self.config.max_wait)
+            if wait is None:
+                self._count("rejected")
+                raise RateLimitedError(
+                    f"{self.provider} rate limit ({self.config.rate:g}/s) would delay the request "
+                    f"more than {self.config.max_wait:g}s"
+                )
+            if wait:
+                with self._lock:
+                    self.status.throttled_seconds += wait
+                time.sleep(wait)
+        except BaseException:
+            self.breaker.release()
+            raise
+
+    def snapshot(self) -> ProviderStatus:
+        with self._lock:
+            status = replace(self.status)
+        status.state = self.breaker.state()
+        status.reopens_in = self.breaker.reopens_in() if status.state == "open" else None
+        return status
+
+    def _backoff(self, attempt: int, hinted: Optional[float]) -> float:
+        ceiling = min(self.config.backoff_max, self.config.backoff_base * (2 ** (attempt - 1)))
+        delay = random.uniform(0.0, ceiling)
+        if hinted is not None:
+            delay = max(delay, min(hinted, self.config.backoff_max))
+        return delay
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self.status, name, getattr(self.status, name) + 1)
+
+
+_GUARDS: Dict[str, _ProviderGuard] = {}
+_GUARDS_LOCK = threading.Lock()
+
+
+def call(provider: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run ``fn(*args, **kwargs)`` under ``provider``'s rate limit, retry policy and breaker."""
+
+    return _guard(provider).call(fn, *args, **kwargs)
+
+
+def configure(provider: str, **overrides: Any) -> ResilienceConfig:
+    """Replace ``provider``'s settings (starting from the environment) and reset its state."""
+
+    config = replace(ResilienceConfig.from_env(provider), **overrides).validate()
+    with _GUARDS_LOCK:
+        _GUARDS[provider] = _ProviderGuard(provider, config)
+    return config
+
+
+def status(provider: str) -> ProviderStatus:
+    return _guard(provider).snapshot()
+
+
+def describe_providers() -> str:
+    """One-line health summary of every provider used so far ("" when none)."""
+
+    with _GUARDS_LOCK:
+        guards = list(_GUARDS.values())
+    snapshots = [guard.snapshot() for guard in guards]
+    return "; ".join(snapshot.describe() for snapshot in snapshots if snapshot.requests or snapshot.rejected)
+
+
+def reset(provider: Optional[str] = None) -> None:
+    """Forget counters and breaker state for ``provider`` (or every provider)."""
+
+    with _GUARDS_LOCK:
+        if provider is None:
+            _GUARDS.clear()
+        else:
+            _GUARDS.pop(provider, None)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Throttling, timeouts, connection drops and 5xx responses are worth retrying."""
+
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    status_code = _status_code(exc)
+    if status_code is not None:
+        return status_code in _RETRYABLE_STATUS
+    name = type(exc).__name__
+    return any(marker in name for marker in _RETRYABLE_NAMES)
+
+
+def retry_after(exc: BaseException) -> Optional[float]:
+    """Seconds from a ``Retry-After`` header on the SDK error's response, when present."""
+
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        return max(0.0, float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    # OpenAI errors carry ``status_code``; google.api_core errors carry an int ``code``.
+    for attribute in ("status_code", "code"):
+        value = getattr(exc, attribute, None)
+        if isinstance(value, int) and 100 <= value < 600:
+            return value
+    return None
+
+
+def _guard(provider: str) -> _ProviderGuard:
+    with _GUARDS_LOCK:
+        guard = _GUARDS.get(provider)
+        if guard is None:
+            guard = _ProviderGuard(provider, ResilienceConfig.from_env(provider).validate())
+            _GUARDS[provider] = guard
+        return guard
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return float(value)
+    except ValueError as exc:
+        raise ValueError(f"{name} must be a number, got {value!r}") from exc
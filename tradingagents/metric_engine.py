@@ -0,0 +1,188 @@
+"""Columnar counterpart to ``fundamental_agent._calculate_metrics``.
+
+Statement values are pulled out of each ticker's payload once, then every
+metric in ``_METRIC_FIELDS`` is derived for the whole universe with NumPy array
+operations. The rules (fallbacks, percent normalisation, sanity bounds) mirror
+the scalar path exactly so either can feed ``WeightReport``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from tradingagents.fundamental_agent import (
+    _METRIC_FIELDS,
+    MetricVector,
+    _first_not_none,
+    _latest_financial_value,
+    _maybe_percent,
+)
+
+Statements = Tuple[Dict[str, Any], Any, Any, Any]
+
+METRIC_COLUMNS = [key for key, _, _ in _METRIC_FIELDS]
+
+_STATEMENT_LABELS = {
+    "revenue": (1, "Total Revenue"),
+    "net_income": (1, "Net Income"),
+    "operating_income": (1, "Operating Income"),
+    "gross_profit": (1, "Gross Profit"),
+    "equity": (2, "Total Stockholder Equity"),
+    "liabilities": (2, "Total Liab"),
+    "operating_cash_flow": (3, "Operating Cash Flow"),
+}
+
+_INFO_PERCENT_FIELDS = {
+    "profit_margin": "profitMargins",
+    "roe": "returnOnEquity",
+    "dividend_yield": "dividendYield",
+    "revenue_growth": "revenueGrowth",
+}
+
+
+def calculate_metrics_frame(statements: Mapping[str, Statements]) -> pd.DataFrame:
+    """Compute every fundamental metric for many tickers in one vectorised pass.
+
+    ``statements`` maps ticker to the ``(info, financials, balance_sheet, cashflow)``
+    tuple returned by ``FundamentalWeightAgent._fetch_fundamentals``. The result is
+    indexed by ticker with one float column per ``_METRIC_FIELDS`` key; missing
+    values are NaN.
+    """
+
+    tickers = list(statements)
+    columns, present = _extract_columns(statements.values())
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        revenue = columns["revenue"]
+        net_income = columns["net_income"]
+        equity = columns["equity"]
+        liabilities = columns["liabilities"]
+
+        profit_margin = np.where(
+            ~present["profit_margin"] & _usable_denominator(revenue) & ~np.isnan(net_income),
+            (net_income / revenue) * 100.0,
+            columns["profit_margin"],
+        )
+        roe = np.where(
+            ~present["roe"] & _usable_denominator(equity) & ~np.isnan(net_income),
+            (net_income / equity) * 100.0,
+            columns["roe"],
+        )
+
+        latest_revenue = columns["revenue_latest"]
+        prior_revenue = columns["revenue_prior"]
+        computed_growth = np.where(
+            _usable_denominator(prior_revenue) & ~np.isnan(latest_revenue),
+            ((latest_revenue - prior_revenue) / prior_revenue) * 100.0,
+            np.nan,
+        )
+        revenue_growth = np.where(
+            present["revenue_growth"], columns["revenue_growth"], computed_growth
+        )
+
+        debt_to_equity = np.where(
+            ~np.isnan(liabilities) & _usable_denominator(equity),
+            liabilities / equity,
+            np.nan,
+        )
+
+        dividend = columns["dividend_yield"]
+        dividend = np.where(np.abs(dividend) <= 3, dividend * 100.0, dividend)
+        dividend = np.where(np.abs(dividend) <= 100, dividend, np.nan)
+
+        profit_margin = _normalise_percent(profit_margin)
+        roe = _normalise_percent(roe)
+        revenue_growth = _normalise_percent(revenue_growth)
+
+    frame = pd.DataFrame(
+        {
+            "revenue": revenue,
+            "net_income": net_income,
+            "operating_income": columns["operating_income"],
+            "operating_cash_flow": columns["operating_cash_flow"],
+            "gross_profit": columns["gross_profit"],
+            "equity": equity,
+            "liabilities": liabilities,
+            "profit_margin": profit_margin,
+            "roe": roe,
+            "revenue_growth": revenue_growth,
+            "pe_ratio": columns["pe_ratio"],
+            "debt_to_equity": debt_to_equity,
+            "dividend_yield": dividend,
+        },
+        index=pd.Index(tickers, name="ticker"),
+    )
+    return frame[METRIC_COLUMNS]
+
+
+def metrics_from_frame(frame: pd.DataFrame, ticker: str) -> MetricVector:
+    """Return one ticker's row as a ``MetricVector`` (NaN cells read back as None)."""
+
+    return MetricVector.from_sequence(frame.loc[ticker, METRIC_COLUMNS].to_numpy(dtype=float))
+
+
+def _extract_columns(
+    payloads: Sequence[Statements],
+) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    values: Dict[str, list] = {
+        key: []
+        for key in (
+            *_STATEMENT_LABELS,
+            *_INFO_PERCENT_FIELDS,
+            "pe_ratio",
+            "revenue_latest",
+            "revenue_prior",
+        )
+    }
+    present: Dict[str, list] = {key: [] for key in _INFO_PERCENT_FIELDS}
+
+    for info, *frames in payloads:
+        info = info or {}
+        values["pe_ratio"].append(
+            _as_float(_first_not_none(info.get("trailingPE"), info.get("forwardPE")))
+        )
+        for key, info_key in _INFO_PERCENT_FIELDS.items():
+            number = _maybe_percent(info.get(info_key))
+            present[key].append(number is not None)
+            values[key].append(_as_float(number))
+
+        for key, (position, label) in _STATEMENT_LABELS.items():
+            values[key].append(_as_float(_latest_financial_value(frames[position - 1], label)))
+
+        latest, prior = _latest_two(frames[0], "Total Revenue")
+        values["revenue_latest"].append(latest)
+        values["revenue_prior"].append(prior)
+
+    columns = {key: np.asarray(items, dtype=float) for key, items in values.items()}
+    masks = {key: np.asarray(items, dtype=bool) for key, items in present.items()}
+    return columns, masks
+
+
+def _latest_two(frame, label: str) -> Tuple[float, float]:
+    if frame is None or getattr(frame, "empty", True):
+        return np.nan, np.nan
+    if label not in frame.index:
+        return np.nan, np.nan
+    series = frame.loc[label].dropna()
+    if len(series) < 2:
+        return np.nan, np.nan
+    try:
+        return float(series.iloc[0]), float(series.iloc[1])
+    except (TypeError, ValueError):
+        return np.nan, np.nan
+
+
+def _usable_denominator(values: np.ndarray) -> np.ndarray:
+    return ~np.isnan(values) & (values != 0)
+
+
+def _normalise_percent(values: np.ndarray) -> np.ndarray:
+    scaled = np.where(np.abs(values) <= 5, values * 100.0, values)
+    return np.where(np.abs(scaled) <= 500, scaled, np.nan)
+
+
+def _as_float(value: Optional[float]) -> float:
+    return np.nan if value is None else float(value)
@@ -0,0 +1,195 @@
+"""Near-duplicate headline clustering with MinHash locality-sensitive hashing.
+
+Wire stories are routinely rewritten ("Apple shares rise..." / "Apple stock
+rises..."), so exact string matching lets the same story through several
+times. Headlines are reduced to a set of normalised tokens, summarised by a
+short MinHash signature, and bucketed by signature bands; only headlines that
+share a bucket are compared by exact Jaccard similarity. Each insert therefore
+costs a constant number of hash operations plus a few candidate checks, which
+keeps clustering a whole feed roughly linear in its size.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+import threading
+from typing import Dict, FrozenSet, List, Tuple
+
+_MERSENNE_PRIME = (1 << 31) - 1
+
+_SOURCE_SUFFIX = re.compile(r"\s+[-–—|]\s+[^-–—|]{1,60}$")
+_TOKEN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+_STOPWORDS = frozenset(
+    """
+    a an and are as at be by for from has have in into is it its of on or
+    says said than that the this to was were will with after amid about
+    new why how what here report reports
+    """.split()
+)
+
+# Wire desks swap these freely; folding them together lets rewrites match.
+_SYNONYMS = {
+    "shares": "stock",
+    "share": "stock",
+    "stocks": "stock",
+    "equity": "stock",
+    "corp": "inc",
+    "corporation": "inc",
+    "co": "inc",
+    "company": "inc",
+}
+
+
+# Direction words are kept as tokens, and headlines moving opposite ways never
+# cluster: "stock up 5% after earnings" and "stock down 5% after earnings"
+# share most of their tokens but carry opposite sentiment.
+_UP_WORDS = """
+    up over above higher rise rises rising rose gain gains gained jump jumps jumped
+    surge surges surged soar soars soared climb climbs climbed rally rallies rallied
+    beat beats upgrade upgrades upgraded
+"""
+_DOWN_WORDS = """
+    down under below lower fall falls fell drop drops dropped slide slides slid
+    sink sinks sank plunge plunges plunged tumble tumbles tumbled lose loses lost
+    loss losses miss misses missed downgrade downgrades downgraded
+"""
+
+
+class NearDuplicateIndex:
+    """Assigns each headline to a cluster of near-identical headlines.
+
+    Two headlines belong together when the Jaccard similarity of their
+    normalised token sets reaches ``threshold`` when compared with the
+    headline that founded the cluster. The MinHash signature has
+    ``bands * rows`` components; with the defaults a pair at similarity 0.7
+    becomes a candidate with probability above 99%.
+    """
+
+    def __init__(self, *, threshold: float = 0.7, bands: int = 24, rows: int = 4, seed: int = 1):
+        if not (0.0 < threshold <= 1.0):
+            raise ValueError("threshold must be in (0.0, 1.0]")
+        if bands <= 0 or rows <= 0:
+            raise ValueError("bands and rows must be positive")
+        import numpy as np  # deferred so importing the news agent stays light
+
+        self._threshold = threshold
+        self._bands = bands
+        self._rows = rows
+        rng = random.Random(seed)
+        permutations = bands * rows
+        self._np = np
+        self._multipliers = np.array(
+            [rng.randrange(1, _MERSENNE_PRIME) for _ in range(permutations)], dtype=np.uint64
+        )
+        self._offsets = np.array(
+            [rng.randrange(0, _MERSENNE_PRIME) for _ in range(permutations)], dtype=np.uint64
+        )
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(bands)]
+        self._founders: List[FrozenSet[str]] = []
+        self._exact: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._founders)
+
+    def add(self, text: str) -> Tuple[int, bool]:
+        """Return ``(cluster_id, created)`` for ``text``, opening a new cluster if needed."""
+
+        tokens = headline_tokens(text)
+        with self._lock:
+            if not tokens:
+                # Nothing left after normalisation; fall back to an exact match.
+                exact_key = text.strip().lower()
+                cluster = self._exact.get(exact_key)
+                if cluster is not None:
+                    return cluster, False
+                cluster = self._open_cluster(tokens)
+                self._exact[exact_key] = cluster
+                return cluster, True
+
+            band_keys = self._band_keys(tokens)
+            checked = set()
+            for band, key in enumerate(band_keys):
+                for candidate in self._buckets[band].get(key, ()):
+                    if candidate in checked:
+                        continue
+                    checked.add(candidate)
+                    founder = self._founders[candidate]
+                    if _opposed(tokens, founder):
+                        continue
+                    if _jaccard(tokens, founder) >= self._threshold:
+                        return candidate, False
+
+            cluster = self._open_cluster(tokens)
+            for band, key in enumerate(band_keys):
+                self._buckets[band].setdefault(key, []).append(cluster)
+            return cluster, True
+
+    def _open_cluster(self, tokens: FrozenSet[str]) -> int:
+        self._founders.append(tokens)
+        return len(self._founders) - 1
+
+    def _band_keys(self, tokens: FrozenSet[str]) -> List[bytes]:
+        np = self._np
+        hashed = np.fromiter((_token_hash(token) for token in tokens), dtype=np.uint64, count=len(tokens))
+        # 32-bit hashes and 31-bit coefficients keep a * x + b inside uint64.
+        permuted = (np.outer(self._multipliers, hashed) + self._offsets[:, None]) % _MERSENNE_PRIME
+        raw = permuted.min(axis=1).tobytes()
+        width = len(raw) // self._bands
+        return [raw[band * width:(band + 1) * width] for band in range(self._bands)]
+
+
+def headline_tokens(text: str) -> FrozenSet[str]:
+    """Normalise a headline into the token set used for similarity.
+
+    Drops a trailing " - Publisher" attribution, stopwords and punctuation,
+    folds common wire-desk synonyms and strips simple English suffixes.
+    """
+
+    cleaned = _SOURCE_SUFFIX.sub("", text.strip()).lower()
+    tokens = set()
+    for token in _TOKEN.findall(cleaned):
+        token = token.split("'", 1)[0]
+        if token in _STOPWORDS:
+            continue
+        token = _SYNONYMS.get(token, token)
+        tokens.add(_stem(token))
+    return frozenset(tokens)
+
+
+def _stem(token: str) -> str:
+    if len(token) <= 3 or token.isdigit():
+        return token
+    if token.endswith("ies") and len(token) > 4:
+        return token[:-3] + "y"
+    if token.endswith("s") and not token.endswith("ss"):
+        token = token[:-1]
+    for suffix in ("ing", "ed"):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[: -len(suffix)]
+            break
+    if token.endswith("e") and len(token) > 3:
+        token = token[:-1]
+    return token
+
+
+_UP = frozenset(_stem(word) for word in _UP_WORDS.split())
+_DOWN = frozenset(_stem(word) for word in _DOWN_WORDS.split())
+
+
+def _opposed(left: FrozenSet[str], right: FrozenSet[str]) -> bool:
+    # Only the direction words the two headlines do not share decide it.
+    changed = left ^ right
+    return bool(changed & _UP) and bool(changed & _DOWN)
+
+
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=4).digest(), "big")
+
+
+def _jaccard(left: FrozenSet[str], right: FrozenSet[str]) -> float:
+    union = len(left | right)
+    return len(left & right) / union if union else 1.0
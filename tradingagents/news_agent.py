@@ -1,32 +1,56 @@
 from __future__ import annotations
 
-import contextlib
+import asyncio
 import html
+import io
 import re
-from dataclasses import dataclass
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
-from typing import Iterable, List, Optional, Tuple
-from urllib.error import URLError
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple, Union
 from urllib.parse import quote_plus
-from urllib.request import urlopen
 
 import xml.etree.ElementTree as ET
 
-import yfinance as yf
-
 from tradingagents import llm_client
-
-try:
-    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-except ImportError:  # pragma: no cover - handled at runtime
-    SentimentIntensityAnalyzer = None  # type: ignore
-
-
-_SENTIMENT_ANALYSER = SentimentIntensityAnalyzer() if SentimentIntensityAnalyzer else None
-
-
-@dataclass
+from tradingagents.disk_cache import DiskCache
+from tradingagents.near_duplicates import NearDuplicateIndex
+from tradingagents.news_store import NewsArticleStore, default_news_store_path
+from tradingagents.portfolio import normalise_portfolio, validate_position
+from tradingagents.providers import NewsProvider, default_news_provider
+from tradingagents.sentiment import (
+    SentimentCache,
+    default_scorer,
+    resolve_scorer,
+    score_texts,
+    shared_sentiment_cache,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_SCORED_FEED_MEMO_SIZE = 512
+# Scored results persisted per cached feed body, one per (window, limit, mark, scorer).
+_PERSISTED_SCORES_PER_FEED = 8
+# Re-read a little behind the high-water mark so late-indexed articles are not missed.
+_HIGH_WATER_OVERLAP = timedelta(hours=1)
+
+# A source returns None when it has no usable answer and the next one should be tried.
+_NewsSource = Tuple[str, Callable[[], Optional[List["NewsArticle"]]]]
+_StoryKey = Callable[[str, datetime], Hashable]
+
+_NEWS_STORES: Dict[Path, NewsArticleStore] = {}
+_NEWS_STORES_LOCK = threading.Lock()
+
+
+@dataclass(slots=True)
 class NewsArticle:
     headline: str
     published_at: Optional[str]
@@ -37,7 +61,23 @@ class NewsArticle:
     sentiment_score: int
 
 
-@dataclass
+@dataclass(slots=True)
+class NewsSourcing:
+    """Which source supplied a review's headlines and how long each source took (seconds)."""
+
+    source: Optional[str]
+    timings: Dict[str, float] = field(default_factory=dict)
+    abandoned: List[str] = field(default_factory=list)
+
+    def describe(self) -> str:
+        parts = [f"{self.source or 'none'} won"]
+        for name, seconds in self.timings.items():
+            suffix = " (abandoned)" if name in self.abandoned else ""
+            parts.append(f"{name} {seconds:.2f}s{suffix}")
+        return "; ".join(parts)
+
+
+@dataclass(slots=True)
 class NewsWeightReport:
     ticker: str
     weight: float
@@ -47,6 +87,7 @@ class NewsWeightReport:
     points: List[str]
     articles: List[NewsArticle]
     generated_via_llm: bool = False
+    sourcing: Optional[NewsSourcing] = None
 
     def to_markdown(self, include_articles: bool = True) -> str:
         header = (
@@ -65,11 +106,87 @@ class NewsWeightReport:
         return "".join(sections)
 
 
+@dataclass(slots=True)
+class NewsPortfolioReports:
+    """Batch output: one news review per ticker plus the failures captured along the way."""
+
+    as_of: str
+    lookback_days: int
+    reports: Dict[str, NewsWeightReport]
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def to_markdown(self, *, include_details: bool = False, include_articles: bool = True) -> str:
+        sections = [
+            "# Portfolio News Review\n\n",
+            f"- **As of:** {self.as_of}\n",
+            f"- **News Lookback:** {self.lookback_days} day(s)\n",
+            f"- **Tickers Reviewed:** {len(self.reports)}\n",
+            f"- **Failures:** {len(self.errors)}\n\n",
+        ]
+
+        if self.reports:
+            sections.extend(["## Snapshot\n", _format_portfolio_table(self.reports.values()), "\n\n"])
+
+        if self.errors:
+            error_lines = "\n".join(f"- **{ticker}:** {message}" for ticker, message in self.errors.items())
+            sections.extend(["## Failures\n", error_lines, "\n\n"])
+
+        if include_details:
+            for report in self.reports.values():
+                sections.extend([report.to_markdown(include_articles=include_articles), "\n"])
+
+        return "".join(sections)
+
+
 class NewsWeightReviewAgent:
     """Reviews an assigned portfolio weight against recent news flow."""
 
-    def __init__(self, *, default_as_of: Optional[date] = None):
+    def __init__(
+        self,
+        *,
+        default_as_of: Optional[date] = None,
+        provider: Optional[NewsProvider] = None,
+        feed_timeout: float = 10.0,
+        use_feed_cache: bool = True,
+        feed_cache: Optional[DiskCache] = None,
+        use_sentiment_cache: bool = True,
+        sentiment_cache: Optional[SentimentCache] = None,
+        use_news_store: bool = True,
+        news_store: Optional[NewsArticleStore] = None,
+        hedge_delay: Optional[float] = None,
+        sentiment_scorer: Optional[str] = None,
+    ):
+        """``hedge_delay`` controls fallback sourcing: None waits for Google News to
+        come back empty before asking yfinance, 0 queries both at once, and a
+        positive value starts yfinance once Google News has been pending that
+        many seconds. The first usable answer wins either way (past a high-water
+        mark, a Google feed with nothing newer counts).
+
+        ``sentiment_scorer`` picks "vader" or the faster "lexicon" approximation
+        and defaults to TRADINGAGENTS_SENTIMENT_SCORER."""
+
+        if feed_timeout <= 0:
+            raise ValueError("feed_timeout must be positive")
+        if hedge_delay is not None and hedge_delay < 0:
+            raise ValueError("hedge_delay must be non-negative")
         self._default_as_of = default_as_of or date.today()
+        self._provider = provider or default_news_provider()
+        self._feed_timeout = feed_timeout
+        if feed_cache is None and use_feed_cache:
+            feed_cache = DiskCache("news-feeds", max_entries=256)
+        self._feed_cache = feed_cache
+        self._sentiment_scorer = resolve_scorer(sentiment_scorer) if sentiment_scorer else default_scorer()
+        if sentiment_cache is None and use_sentiment_cache:
+            sentiment_cache = shared_sentiment_cache(self._sentiment_scorer)
+        self._sentiment_cache = sentiment_cache
+        if news_store is None and use_news_store:
+            news_store = _shared_news_store(self._sentiment_scorer)
+        self._news_store = news_store
+        self._hedge_delay = hedge_delay
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._hedge_executor_lock = threading.Lock()
+        self._scored_feeds: "OrderedDict[Tuple[Any, ...], List[NewsArticle]]" = OrderedDict()
+        self._scored_feeds_lock = threading.Lock()
 
     def generate_report(
         self,
@@ -81,50 +198,375 @@ class NewsWeightReviewAgent:
         max_articles: int = 8,
         use_llm: bool = False,
         llm_model: Optional[str] = None,
+        on_llm_point: Optional[Callable[[str], None]] = None,
     ) -> NewsWeightReport:
-        clean_ticker = ticker.strip().upper()
-        if not clean_ticker:
-            raise ValueError("Ticker symbol cannot be empty")
-        if not (0.0 <= weight <= 1.0):
-            raise ValueError("Weight must be between 0.0 and 1.0 inclusive")
-        if lookback_days <= 0:
-            raise ValueError("Lookback window must be positive")
-        if max_articles <= 0:
-            raise ValueError("max_articles must be positive")
+        """Review one position; ``on_llm_point`` receives LLM bullets as they stream in."""
+
+        clean_ticker = validate_position(ticker, weight)
+        _validate_window(lookback_days, max_articles)
 
         as_of_date = self._resolve_date(as_of)
         start_date = as_of_date - timedelta(days=lookback_days)
 
-        articles = self._fetch_news(clean_ticker, start_date, as_of_date)
-        articles = self._score_articles(articles)
+        articles, sourcing = self._fetch_news(clean_ticker, start_date, as_of_date, max_articles)
+        return self._compose_report(
+            clean_ticker,
+            weight,
+            as_of_date,
+            lookback_days,
+            max_articles,
+            articles,
+            use_llm=use_llm,
+            llm_model=llm_model,
+            sourcing=sourcing,
+            on_llm_point=on_llm_point,
+        )
+
+    async def agenerate_report(
+        self,
+        ticker: str,
+        weight: float,
+        *,
+        as_of: Optional[str] = None,
+        lookback_days: int = 7,
+        max_articles: int = 8,
+        use_llm: bool = False,
+        llm_model: Optional[str] = None,
+    ) -> NewsWeightReport:
+        """Awaitable ``generate_report``: feeds are fetched on a worker thread, the LLM call via ``llm_client``."""
+
+        clean_ticker = validate_position(ticker, weight)
+        _validate_window(lookback_days, max_articles)
+
+        as_of_date = self._resolve_date(as_of)
+        start_date = as_of_date - timedelta(days=lookback_days)
+
+        articles, sourcing = await asyncio.to_thread(
+            self._fetch_news, clean_ticker, start_date, as_of_date, max_articles
+        )
+        return await self._acompose_report(
+            clean_ticker,
+            weight,
+            as_of_date,
+            lookback_days,
+            max_articles,
+            articles,
+            use_llm=use_llm,
+            llm_model=llm_model,
+            sourcing=sourcing,
+        )
+
+    def generate_reports(
+        self,
+        portfolio: Mapping[str, float],
+        *,
+        as_of: Optional[str] = None,
+        lookback_days: int = 7,
+        max_articles: int = 8,
+        use_llm: bool = False,
+        llm_model: Optional[str] = None,
+        concurrency: int = 16,
+        dedupe_across_tickers: bool = False,
+    ) -> NewsPortfolioReports:
+        """Blocking wrapper around ``agenerate_reports`` for callers without an event loop."""
+
+        return asyncio.run(
+            self.agenerate_reports(
+                portfolio,
+                as_of=as_of,
+                lookback_days=lookback_days,
+                max_articles=max_articles,
+                use_llm=use_llm,
+                llm_model=llm_model,
+                concurrency=concurrency,
+                dedupe_across_tickers=dedupe_across_tickers,
+            )
+        )
+
+    async def agenerate_reports(
+        self,
+        portfolio: Mapping[str, float],
+        *,
+        as_of: Optional[str] = None,
+        lookback_days: int = 7,
+        max_articles: int = 8,
+        use_llm: bool = False,
+        llm_model: Optional[str] = None,
+        concurrency: int = 16,
+        dedupe_across_tickers: bool = False,
+    ) -> NewsPortfolioReports:
+        """Review a whole ticker→weight book, fetching feeds concurrently.
+
+        At most ``concurrency`` tickers are in flight at once; each worker keeps a
+        keep-alive connection per host, and every HTTP request is bounded by the
+        agent's ``feed_timeout``. A slow or failing ticker never blocks the others,
+        and failures are recorded in ``errors`` instead of aborting the batch.
+
+        With ``dedupe_across_tickers`` every feed is fetched before any report is
+        composed, and a story already kept for an earlier ticker in ``portfolio``
+        order is dropped from later ones, so a shared headline is reviewed once.
+        """
+
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+        _validate_window(lookback_days, max_articles)
+
+        as_of_date = self._resolve_date(as_of)
+        start_date = as_of_date - timedelta(days=lookback_days)
+        positions, errors = normalise_portfolio(portfolio)
+        if not positions:
+            return NewsPortfolioReports(
+                as_of=as_of_date.isoformat(), lookback_days=lookback_days, reports={}, errors=errors
+            )
+
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+        executor = ThreadPoolExecutor(
+            max_workers=min(concurrency, len(positions)), thread_name_prefix="news-batch"
+        )
+
+        async def fetch(ticker: str) -> Tuple[List[NewsArticle], NewsSourcing]:
+            async with semaphore:
+                return await loop.run_in_executor(
+                    executor, self._fetch_news, ticker, start_date, as_of_date, max_articles
+                )
+
+        async def compose(
+            ticker: str, weight: float, fetched: Tuple[List[NewsArticle], NewsSourcing]
+        ) -> NewsWeightReport:
+            articles, sourcing = fetched
+            # LLM calls are bounded by llm_client's per-provider limits, not the fetch semaphore.
+            return await self._acompose_report(
+                ticker,
+                weight,
+                as_of_date,
+                lookback_days,
+                max_articles,
+                articles,
+                use_llm=use_llm,
+                llm_model=llm_model,
+                sourcing=sourcing,
+            )
+
+        async def review(ticker: str, weight: float) -> NewsWeightReport:
+            return await compose(ticker, weight, await fetch(ticker))
+
+        try:
+            if dedupe_across_tickers:
+                fetched = await asyncio.gather(
+                    *(fetch(ticker) for ticker in positions), return_exceptions=True
+                )
+                fetched = _drop_shared_stories(list(positions), fetched)
+                outcomes = await asyncio.gather(
+                    *(
+                        compose(ticker, positions[ticker], result)
+                        for ticker, result in zip(positions, fetched)
+                        if not isinstance(result, BaseException)
+                    ),
+                    return_exceptions=True,
+                )
+                composed = iter(outcomes)
+                outcomes = [
+                    result if isinstance(result, BaseException) else next(composed)
+                    for result in fetched
+                ]
+            else:
+                outcomes = await asyncio.gather(
+                    *(review(ticker, weight) for ticker, weight in positions.items()),
+                    return_exceptions=True,
+                )
+        finally:
+            executor.shutdown(wait=False)
+
+        reports: Dict[str, NewsWeightReport] = {}
+        for ticker, outcome in zip(positions, outcomes):
+            if isinstance(outcome, BaseException):
+                errors[ticker] = str(outcome) or outcome.__class__.__name__
+            else:
+                reports[ticker] = outcome
+
+        return NewsPortfolioReports(
+            as_of=as_of_date.isoformat(), lookback_days=lookback_days, reports=reports, errors=errors
+        )
+
+    def backfill(
+        self,
+        tickers: Iterable[str],
+        *,
+        start: str,
+        end: Optional[str] = None,
+        max_workers: int = 8,
+        processes: Optional[int] = None,
+    ) -> "pd.DataFrame":
+        """Build a daily headline-sentiment series for ``tickers`` between ``start`` and ``end``.
+
+        Each source is queried once per ticker for the whole range (a Google
+        News search bounded with ``after:``/``before:`` plus the yfinance
+        feed), not once per day. Tickers are fetched on ``max_workers`` threads.
+        All headlines are then scored in one ``score_texts`` call, which shards
+        large batches across ``processes`` worker processes. Google News caps a
+        search at roughly 100 items, so very long ranges are sampled rather
+        than exhaustive.
+
+        Returns one row per ticker per calendar day (days without coverage are
+        zero-filled) with columns date, ticker, articles, positive, negative
+        and net_sentiment.
+        """
+
+        import pandas as pd
+
+        start_date = self._resolve_date(start)
+        end_date = self._resolve_date(end)
+        if start_date > end_date:
+            raise ValueError("start must be on or before end")
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        symbols = list(dict.fromkeys(ticker.strip().upper() for ticker in tickers if ticker.strip()))
+        if not symbols:
+            raise ValueError("At least one ticker is required")
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(symbols)), thread_name_prefix="news-backfill"
+        ) as executor:
+            histories = list(
+                executor.map(lambda ticker: self._fetch_history(ticker, start_date, end_date), symbols)
+            )
+
+        texts = [
+            " ".join(filter(None, [article.headline, article.summary]))
+            for articles in histories
+            for article in articles
+        ]
+        labels = iter(
+            score_texts(
+                texts,
+                cache=self._sentiment_cache,
+                scorer=self._sentiment_scorer,
+                processes=processes,
+            )
+        )
+
+        days = pd.date_range(start_date, end_date, freq="D").date
+        counts: Dict[Tuple[str, date], List[int]] = {}
+        for ticker, articles in zip(symbols, histories):
+            for article in articles:
+                _, score = next(labels)
+                day = _utc_date(article.published_at)
+                if day is None:
+                    continue
+                tally = counts.setdefault((ticker, day), [0, 0, 0])
+                tally[0] += 1
+                tally[1] += score > 0
+                tally[2] += score < 0
+
+        rows = []
+        for ticker in symbols:
+            for day in days:
+                total, positive, negative = counts.get((ticker, day), (0, 0, 0))
+                rows.append((day.isoformat(), ticker, total, positive, negative, positive - negative))
+        return pd.DataFrame(
+            rows, columns=["date", "ticker", "articles", "positive", "negative", "net_sentiment"]
+        )
+
+    def _fetch_history(self, ticker: str, start_date: date, end_date: date) -> List[NewsArticle]:
+        """Every distinct, unscored story for ``ticker`` in the range."""
+
+        query = quote_plus(
+            f"{ticker} stock after:{start_date.isoformat()} "
+            f"before:{(end_date + timedelta(days=1)).isoformat()}"
+        )
+        url = f"https://news.google.com/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"
+
+        story_key = _daily_story_keys()
+        articles: List[NewsArticle] = []
+        feed = self._download_feed(url)
+        if feed is not None:
+            try:
+                recent = _parse_feed_items(
+                    feed[0], start_date, end_date, sys.maxsize, story_key=story_key
+                )
+            except ET.ParseError:
+                pass
+            else:
+                articles.extend(recent.articles())
+        articles.extend(
+            self._fetch_yfinance_news(ticker, start_date, end_date, sys.maxsize, story_key=story_key)
+        )
+        # The shared keys make a yfinance copy of a Google story collapse into it.
+        return _recent_stories(articles, max(1, len(articles)), story_key=story_key)
+
+    def _compose_report(
+        self,
+        ticker: str,
+        weight: float,
+        as_of_date: date,
+        lookback_days: int,
+        max_articles: int,
+        articles: List[NewsArticle],
+        *,
+        use_llm: bool,
+        llm_model: Optional[str],
+        sourcing: Optional[NewsSourcing] = None,
+        on_llm_point: Optional[Callable[[str], None]] = None,
+    ) -> NewsWeightReport:
         articles = articles[:max_articles]
+        llm_points = None
+        if use_llm:
+            llm_points = llm_client.summarise_news(
+                **_llm_request(ticker, weight, as_of_date, lookback_days, articles),
+                model=llm_model,
+                on_point=on_llm_point,
+            )
+        return self._build_report(
+            ticker, weight, as_of_date, lookback_days, articles, llm_points, sourcing
+        )
 
+    async def _acompose_report(
+        self,
+        ticker: str,
+        weight: float,
+        as_of_date: date,
+        lookback_days: int,
+        max_articles: int,
+        articles: List[NewsArticle],
+        *,
+        use_llm: bool,
+        llm_model: Optional[str],
+        sourcing: Optional[NewsSourcing] = None,
+    ) -> NewsWeightReport:
+        articles = articles[:max_articles]
+        llm_points = None
+        if use_llm:
+            llm_points = await llm_client.asummarise_news(
+                **_llm_request(ticker, weight, as_of_date, lookback_days, articles), model=llm_model
+            )
+        return self._build_report(
+            ticker, weight, as_of_date, lookback_days, articles, llm_points, sourcing
+        )
+
+    def _build_report(
+        self,
+        ticker: str,
+        weight: float,
+        as_of_date: date,
+        lookback_days: int,
+        articles: List[NewsArticle],
+        llm_points: Optional[List[str]],
+        sourcing: Optional[NewsSourcing],
+    ) -> NewsWeightReport:
         judgement, supporting_points = self._build_opinion(weight, articles)
         points = [judgement] + supporting_points
         points = points[:4]
         generated_via_llm = False
 
-        if use_llm:
-            article_summaries = _articles_prompt_digest(articles)
-            net_sentiment = sum(article.sentiment_score for article in articles)
-            llm_points = llm_client.summarise_news(
-                ticker=clean_ticker,
-                weight=weight,
-                as_of=as_of_date.isoformat(),
-                lookback_days=lookback_days,
-                article_summaries=article_summaries,
-                net_sentiment=net_sentiment,
-                max_points=4,
-                model=llm_model,
-            )
-            if llm_points:
-                points = llm_points[:4]
-                if points:
-                    judgement = points[0]
-                generated_via_llm = True
+        if llm_points:
+            points = llm_points[:4]
+            if points:
+                judgement = points[0]
+            generated_via_llm = True
 
         return NewsWeightReport(
-            ticker=clean_ticker,
+            ticker=ticker,
             weight=weight,
             as_of=as_of_date.isoformat(),
             lookback_days=lookback_days,
@@ -132,6 +574,7 @@ class NewsWeightReviewAgent:
             points=points,
             articles=articles,
             generated_via_llm=generated_via_llm,
+            sourcing=sourcing,
         )
 
     def _resolve_date(self, as_of: Optional[str]) -> date:
@@ -142,97 +585,296 @@ class NewsWeightReviewAgent:
         except ValueError as exc:
             raise ValueError("as_of must be in YYYY-MM-DD format") from exc
 
-    def _fetch_news(self, ticker: str, start_date: date, end_date: date) -> List[NewsArticle]:
-        primary = self._fetch_google_news(ticker, start_date, end_date)
-        if primary:
-            return primary
-        return self._fetch_yfinance_news(ticker, start_date, end_date)
+    def _fetch_news(
+        self, ticker: str, start_date: date, end_date: date, max_articles: int
+    ) -> Tuple[List[NewsArticle], NewsSourcing]:
+        """Return the ``max_articles`` most recent stories in the window, scored.
+
+        With a news store attached only articles published after the ticker's
+        high-water mark are fetched and scored; the window is then read back
+        from the store so earlier runs' articles are reused as-is. Everything
+        in the window is stored, not just the top ``max_articles``, because the
+        mark claims the whole window is covered for later, larger requests.
+        """
+
+        store = self._news_store
+        if store is None:
+            return self._fetch_latest(ticker, start_date, end_date, max_articles)
+
+        mark = store.high_water_mark(ticker)
+        newer_than: Optional[datetime] = None
+        if mark is not None and mark[1] <= start_date:
+            newer_than = mark[0] - _HIGH_WATER_OVERLAP
+        sourcing = NewsSourcing(source="store")
+        if newer_than is None or newer_than.date() <= end_date:
+            fresh, sourcing = self._fetch_latest(
+                ticker, start_date, end_date, sys.maxsize, newer_than=newer_than
+            )
+            # With no source answering, nothing was fetched, so the window must not count as covered.
+            if sourcing.source is not None:
+                store.ingest(ticker, fresh, covered_from=start_date)
+
+        stored = store.window(ticker, start_date, end_date)
+        if sourcing.source is None and stored:
+            sourcing.source = "store"
+        return _rank_by_sentiment(_recent_stories(stored, max_articles)), sourcing
+
+    def _fetch_latest(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date,
+        max_articles: int,
+        *,
+        newer_than: Optional[datetime] = None,
+    ) -> Tuple[List[NewsArticle], NewsSourcing]:
+        """Fetch and score the newest articles, preferring Google News over yfinance."""
+
+        def google_news() -> Optional[List[NewsArticle]]:
+            articles = self._fetch_google_news(
+                ticker, start_date, end_date, max_articles, newer_than=newer_than
+            )
+            # Past a high-water mark, a feed with nothing newer is an answer, not a miss.
+            if articles or (articles is not None and newer_than is not None):
+                return articles
+            return None
+
+        def yfinance() -> Optional[List[NewsArticle]]:
+            articles = self._score_articles(
+                self._fetch_yfinance_news(
+                    ticker, start_date, end_date, max_articles, newer_than=newer_than
+                )
+            )
+            return articles or None
+
+        sources: List[_NewsSource] = [("google_news", google_news), ("yfinance", yfinance)]
+        if self._hedge_delay is None:
+            timings: Dict[str, float] = {}
+            for name, fetch in sources:
+                started = time.perf_counter()
+                articles = fetch()
+                timings[name] = time.perf_counter() - started
+                if articles is not None:
+                    return articles, NewsSourcing(source=name, timings=timings)
+            return [], NewsSourcing(source=None, timings=timings)
+        return self._fetch_hedged(sources)
+
+    def _fetch_hedged(self, sources: List[_NewsSource]) -> Tuple[List[NewsArticle], NewsSourcing]:
+        """Race the primary source against a fallback started after ``hedge_delay``.
+
+        The first answer (see ``_NewsSource``) wins, with ties going to the earlier source.
+        A source still running at that point is abandoned: a queued call is
+        cancelled, and a running one finishes in the background with its result
+        discarded.
+        """
+
+        executor = self._hedge_pool()
+        timings: Dict[str, float] = {}
+        started: Dict[str, float] = {}
+
+        def timed(
+            name: str, fetch: Callable[[], Optional[List[NewsArticle]]]
+        ) -> Callable[[], Optional[List[NewsArticle]]]:
+            def run() -> Optional[List[NewsArticle]]:
+                started[name] = time.perf_counter()
+                try:
+                    return fetch()
+                finally:
+                    timings[name] = time.perf_counter() - started[name]
+
+            return run
+
+        order = {name: position for position, (name, _) in enumerate(sources)}
+        pending: Dict[Future, str] = {}
+        remaining = list(sources)
+        name, fetch = remaining.pop(0)
+        pending[executor.submit(timed(name, fetch))] = name
+
+        while pending:
+            timeout = self._hedge_delay if remaining else None
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda item: order[pending[item]]):
+                name = pending.pop(future)
+                try:
+                    articles = future.result()
+                except Exception:  # noqa: BLE001 - a failed source simply loses the race
+                    articles = None
+                if articles is not None:
+                    abandoned = []
+                    for other, other_name in pending.items():
+                        other.cancel()
+                        abandoned.append(other_name)
+                        if other_name in started:
+                            timings.setdefault(
+                                other_name, time.perf_counter() - started[other_name]
+                            )
+                    return articles, NewsSourcing(
+                        source=name, timings=dict(timings), abandoned=abandoned
+                    )
+            if remaining and (not done or not pending):
+                # The hedge delay elapsed, or the primary had no answer: start the next source.
+                name, fetch = remaining.pop(0)
+                pending[executor.submit(timed(name, fetch))] = name
+        return [], NewsSourcing(source=None, timings=dict(timings))
+
+    def _hedge_pool(self) -> ThreadPoolExecutor:
+        with self._hedge_executor_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=32, thread_name_prefix="news-hedge"
+                )
+            return self._hedge_executor
+
+    def _fetch_google_news(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date,
+        max_articles: int,
+        *,
+        newer_than: Optional[datetime] = None,
+    ) -> Optional[List[NewsArticle]]:
+        """Scored feed items in the window; None when the feed could not be fetched or parsed."""
 
-    def _fetch_google_news(self, ticker: str, start_date: date, end_date: date) -> List[NewsArticle]:
         query = quote_plus(f"{ticker} stock")
         url = (
             "https://news.google.com/rss/search?q="
             f"{query}&hl=en-US&gl=US&ceid=US:en"
         )
 
-        try:
-            with contextlib.closing(urlopen(url, timeout=10)) as response:
-                payload = response.read()
-        except URLError:
-            return []
-        except TimeoutError:
-            return []
+        feed = self._download_feed(url)
+        if feed is None:
+            return None
+        payload, validator, persisted = feed
+
+        # An unchanged validator means an identical body, so reuse the scored result:
+        # from this process's memo, or from the feed cache entry a previous run wrote.
+        params = (start_date, end_date, max_articles, newer_than, self._sentiment_scorer)
+        memo_key = (url, validator, *params) if validator else None
+        if memo_key is not None:
+            with self._scored_feeds_lock:
+                cached = self._scored_feeds.get(memo_key)
+                if cached is not None:
+                    self._scored_feeds.move_to_end(memo_key)
+                    return list(cached)
+            cached = persisted.get(params)
+            if cached is not None:
+                self._remember_scored(memo_key, cached)
+                return list(cached)
 
         try:
-            root = ET.fromstring(payload)
+            recent = _parse_feed_items(
+                payload, start_date, end_date, max_articles, newer_than=newer_than
+            )
         except ET.ParseError:
-            return []
-
-        articles: List[NewsArticle] = []
-        for item in root.findall(".//item"):
-            title = (item.findtext("title") or "").strip()
-            if not title:
-                continue
-
-            pub_date_raw = item.findtext("pubDate")
-            publish_dt: Optional[datetime] = None
-            if pub_date_raw:
-                try:
-                    publish_dt = parsedate_to_datetime(pub_date_raw)
-                    if publish_dt.tzinfo is None:
-                        publish_dt = publish_dt.replace(tzinfo=timezone.utc)
-                    else:
-                        publish_dt = publish_dt.astimezone(timezone.utc)
-                except (TypeError, ValueError):
-                    publish_dt = None
-            if publish_dt is None:
-                continue
-            if publish_dt.date() < start_date or publish_dt.date() > end_date:
-                continue
-
-            summary_raw = item.findtext("description") or ""
-            summary = _strip_html(summary_raw).strip() or None
-            source_elem = item.find("{http://news.google.com/newssources}news-source")
-            source = source_elem.text.strip() if source_elem is not None and source_elem.text else None
-            link = (item.findtext("link") or "").strip() or None
-
-            articles.append(
-                NewsArticle(
-                    headline=html.unescape(title),
-                    published_at=publish_dt.isoformat(),
-                    summary=html.unescape(summary) if summary else None,
-                    source=source,
-                    url=link,
-                    sentiment="neutral",
-                    sentiment_score=0,
-                )
+            return None
+        articles = self._score_articles(recent.articles())
+
+        if memo_key is not None:
+            self._remember_scored(memo_key, articles)
+            self._persist_scored(url, validator, params, articles)
+        return list(articles)
+
+    def _remember_scored(self, memo_key: Tuple[Any, ...], articles: List[NewsArticle]) -> None:
+        with self._scored_feeds_lock:
+            self._scored_feeds[memo_key] = articles
+            self._scored_feeds.move_to_end(memo_key)
+            while len(self._scored_feeds) > _SCORED_FEED_MEMO_SIZE:
+                self._scored_feeds.popitem(last=False)
+
+    def _persist_scored(
+        self, url: str, validator: str, params: Tuple[Any, ...], articles: List[NewsArticle]
+    ) -> None:
+        """Store scored articles beside the cached body so a 304 in a later run skips parsing too."""
+
+        if self._feed_cache is None:
+            return
+        entry = self._feed_cache.get(url)
+        if not entry or _feed_validator(entry.get("etag"), entry.get("last_modified")) != validator:
+            return
+        scored = dict(entry.get("scored") or {})
+        scored.pop(params, None)
+        scored[params] = articles
+        while len(scored) > _PERSISTED_SCORES_PER_FEED:
+            del scored[next(iter(scored))]
+        self._feed_cache.set(url, {**entry, "scored": scored})
+
+    def _download_feed(
+        self, url: str
+    ) -> Optional[Tuple[bytes, Optional[str], Dict[Tuple[Any, ...], List[NewsArticle]]]]:
+        """Conditional GET backed by the persistent feed cache.
+
+        Returns the body, its validator (ETag / Last-Modified) and any scored
+        results persisted for that body, or None when nothing usable came back.
+        A 304 serves the cached body and its scored results without a download.
+        """
+
+        cached = self._feed_cache.get(url) if self._feed_cache is not None else None
+        try:
+            response = self._provider.fetch_feed_conditional(
+                url,
+                timeout=self._feed_timeout,
+                etag=cached.get("etag") if cached else None,
+                last_modified=cached.get("last_modified") if cached else None,
             )
+        except Exception:
+            return None
+
+        if response.not_modified and cached:
+            validator = _feed_validator(cached.get("etag"), cached.get("last_modified"))
+            return cached["body"], validator, cached.get("scored") or {}
+        if not response.body:
+            return None
+
+        validator = _feed_validator(response.etag, response.last_modified)
+        if self._feed_cache is not None and validator:
+            self._feed_cache.set(
+                url,
+                {"etag": response.etag, "last_modified": response.last_modified, "body": response.body},
+            )
+        return response.body, validator, {}
 
-        articles.sort(key=lambda article: article.published_at or "", reverse=True)
-        return _deduplicate_articles(articles)
-
-    def _fetch_yfinance_news(self, ticker: str, start_date: date, end_date: date) -> List[NewsArticle]:
+    def _fetch_yfinance_news(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date,
+        max_articles: int,
+        *,
+        newer_than: Optional[datetime] = None,
+        story_key: Optional[_StoryKey] = None,
+    ) -> List[NewsArticle]:
         try:
-            payload = yf.Ticker(ticker).news or []
+            payload = self._provider.fetch_ticker_news(ticker) or []
         except Exception:
             payload = []
 
-        articles: List[NewsArticle] = []
+        recent = _RecentArticles(max_articles)
+        story_key = story_key or _story_keys()
         for item in payload:
             if not isinstance(item, dict):
                 continue
             published = _extract_publish_datetime(item)
             if published is None:
                 continue
+            if published.tzinfo is None:
+                published = published.replace(tzinfo=timezone.utc)
             if published.date() < start_date or published.date() > end_date:
                 continue
+            if newer_than is not None and published <= newer_than:
+                continue
             headline = (item.get("title") or item.get("headline") or "").strip()
             if not headline:
                 continue
+            key = story_key(headline, published)
+            if not recent.admits(key, published):
+                continue
             summary = (item.get("summary") or item.get("content") or "").strip() or None
             source = (item.get("publisher") or item.get("source") or "").strip() or None
             url = (item.get("link") or item.get("url") or "").strip() or None
-            articles.append(
+            recent.offer(
+                key,
+                published,
                 NewsArticle(
                     headline=headline,
                     published_at=published.isoformat(),
@@ -241,17 +883,16 @@ class NewsWeightReviewAgent:
                     url=url,
                     sentiment="neutral",
                     sentiment_score=0,
-                )
+                ),
             )
 
-        articles.sort(key=lambda article: article.published_at or "", reverse=True)
-        return _deduplicate_articles(articles)
+        return recent.articles()
 
     def _score_articles(self, articles: List[NewsArticle]) -> List[NewsArticle]:
+        texts = [" ".join(filter(None, [article.headline, article.summary])) for article in articles]
+        labels = score_texts(texts, cache=self._sentiment_cache, scorer=self._sentiment_scorer)
         scored: List[NewsArticle] = []
-        for article in articles:
-            text = " ".join(filter(None, [article.headline, article.summary]))
-            label, score = _score_text(text)
+        for article, (label, score) in zip(articles, labels):
             scored.append(
                 NewsArticle(
                     headline=article.headline,
@@ -263,8 +904,7 @@ class NewsWeightReviewAgent:
                     sentiment_score=score,
                 )
             )
-        scored.sort(key=lambda a: (a.sentiment_score, a.headline.lower()), reverse=True)
-        return scored
+        return _rank_by_sentiment(scored)
 
     def _build_opinion(
         self, weight: float, articles: List[NewsArticle]
@@ -303,6 +943,52 @@ class NewsWeightReviewAgent:
         return judgement, supporting
 
 
+def _shared_news_store(scorer: str) -> Optional[NewsArticleStore]:
+    """One store per scorer's database path per process; None when the cache root is unusable."""
+
+    path = default_news_store_path(scorer)
+    with _NEWS_STORES_LOCK:
+        store = _NEWS_STORES.get(path)
+        if store is None:
+            try:
+                store = NewsArticleStore(path)
+            except (OSError, sqlite3.Error):
+                return None
+            _NEWS_STORES[path] = store
+        return store
+
+
+def _feed_validator(etag: Optional[str], last_modified: Optional[str]) -> Optional[str]:
+    if not etag and not last_modified:
+        return None
+    return f"{etag or ''}|{last_modified or ''}"
+
+
+def _llm_request(
+    ticker: str,
+    weight: float,
+    as_of_date: date,
+    lookback_days: int,
+    articles: List[NewsArticle],
+) -> Dict[str, Any]:
+    return {
+        "ticker": ticker,
+        "weight": weight,
+        "as_of": as_of_date.isoformat(),
+        "lookback_days": lookback_days,
+        "article_summaries": _articles_prompt_digest(articles),
+        "net_sentiment": sum(article.sentiment_score for article in articles),
+        "max_points": 4,
+    }
+
+
+def _validate_window(lookback_days: int, max_articles: int) -> None:
+    if lookback_days <= 0:
+        raise ValueError("Lookback window must be positive")
+    if max_articles <= 0:
+        raise ValueError("max_articles must be positive")
+
+
 def _top_articles(positives: List[NewsArticle], negatives: List[NewsArticle]) -> Iterable[NewsArticle]:
     ordered = sorted(positives, key=lambda a: -a.sentiment_score) + sorted(
         negatives, key=lambda a: a.sentiment_score
@@ -341,22 +1027,6 @@ def _compose_weight_statement(
     )
 
 
-def _score_text(text: str) -> Tuple[str, int]:
-    cleaned = text.strip()
-    if not cleaned:
-        return "neutral", 0
-
-    if _SENTIMENT_ANALYSER is None:
-        return "neutral", 0
-
-    compound = _SENTIMENT_ANALYSER.polarity_scores(cleaned)["compound"]
-    if compound >= 0.1:
-        return "positive", 1
-    if compound <= -0.1:
-        return "negative", -1
-    return "neutral", 0
-
-
 def _extract_publish_datetime(item: dict) -> Optional[datetime]:
     raw = item.get("providerPublishTime")
     if raw is not None:
@@ -394,25 +1064,248 @@ def _strip_html(value: str) -> str:
     return re.sub(r"<[^>]+>", "", value)
 
 
-def _deduplicate_articles(articles: List[NewsArticle]) -> List[NewsArticle]:
-    seen: set[str] = set()
-    deduped: List[NewsArticle] = []
+def write_sentiment_series(frame: "pd.DataFrame", path: Union[str, Path]) -> Path:
+    """Write a ``backfill`` frame as Parquet (``.parquet`` suffix) or CSV (anything else)."""
+
+    from tradingagents.snapshot_store import _parquet_available
+
+    path = Path(path).expanduser()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".parquet":
+        if not _parquet_available():
+            raise ValueError("Writing Parquet needs pyarrow or fastparquet; use a .csv path instead")
+        frame.to_parquet(path, index=False)
+    else:
+        frame.to_csv(path, index=False)
+    return path
+
+
+def _utc_date(published_at: Optional[str]) -> Optional[date]:
+    if not published_at:
+        return None
+    try:
+        published = datetime.fromisoformat(published_at)
+    except ValueError:
+        return None
+    if published.tzinfo is not None:
+        published = published.astimezone(timezone.utc)
+    return published.date()
+
+
+def _rank_by_sentiment(articles: List[NewsArticle]) -> List[NewsArticle]:
+    return sorted(articles, key=lambda a: (a.sentiment_score, a.headline.lower()), reverse=True)
+
+
+def _recent_stories(
+    articles: Iterable[NewsArticle],
+    max_articles: int,
+    *,
+    story_key: Optional[_StoryKey] = None,
+) -> List[NewsArticle]:
+    """The newest copy of each of the ``max_articles`` most recent stories in ``articles``."""
+
+    recent = _RecentArticles(max_articles)
+    story_key = story_key or _story_keys()
     for article in articles:
-        key = article.headline.lower().strip()
-        if not key or key in seen:
+        published = datetime.fromisoformat(article.published_at)
+        if published.tzinfo is None:
+            published = published.replace(tzinfo=timezone.utc)
+        recent.offer(story_key(article.headline, published), published, article)
+    return recent.articles()
+
+
+def _story_keys() -> _StoryKey:
+    """Key headlines by near-duplicate cluster, so rewrites of a story share a key."""
+
+    clusters = NearDuplicateIndex()
+    return lambda headline, published: clusters.add(headline)[0]
+
+
+def _daily_story_keys() -> _StoryKey:
+    """Like ``_story_keys`` but per UTC day: similar headlines on other days are new events."""
+
+    clusters: Dict[date, NearDuplicateIndex] = {}
+
+    def key(headline: str, published: datetime) -> Hashable:
+        day = published.astimezone(timezone.utc).date()
+        index = clusters.get(day)
+        if index is None:
+            index = clusters[day] = NearDuplicateIndex()
+        return day, index.add(headline)[0]
+
+    return key
+
+
+def _drop_shared_stories(tickers: List[str], fetched: List[object]) -> List[object]:
+    """Keep each story only for the first ticker (in ``tickers`` order) that carries it."""
+
+    clusters = NearDuplicateIndex()
+    owners: Dict[int, str] = {}
+    deduped: List[object] = []
+    for ticker, result in zip(tickers, fetched):
+        if isinstance(result, BaseException):
+            deduped.append(result)
             continue
-        seen.add(key)
-        deduped.append(article)
+        articles, sourcing = result
+        kept = []
+        for article in articles:
+            cluster, _ = clusters.add(article.headline)
+            if owners.setdefault(cluster, ticker) == ticker:
+                kept.append(article)
+        deduped.append((kept, sourcing))
     return deduped
 
 
-def _format_articles_table(articles: List[NewsArticle]) -> str:
-    header = "| Date | Source | Tone | Headline |\n| --- | --- | --- | --- |"
+def _parse_feed_items(
+    payload: bytes,
+    start_date: date,
+    end_date: date,
+    max_articles: int,
+    *,
+    newer_than: Optional[datetime] = None,
+    story_key: Optional[_StoryKey] = None,
+) -> "_RecentArticles":
+    """Stream RSS ``<item>`` elements into a bounded top-k without building the whole tree.
+
+    Items outside the window (or not newer than ``newer_than``), older copies
+    of a story already seen (per ``story_key``, near-duplicate clusters by
+    default) and anything older than the current top-k are dropped as soon as
+    their title and date are read, and every parsed item is detached from its
+    parent so memory stays flat.
+    """
+
+    recent = _RecentArticles(max_articles)
+    story_key = story_key or _story_keys()
+    parents: List[ET.Element] = []
+    for event, element in ET.iterparse(io.BytesIO(payload), events=("start", "end")):
+        if event == "start":
+            parents.append(element)
+            continue
+        parents.pop()
+        if element.tag != "item":
+            continue
+
+        _offer_feed_item(recent, story_key, element, start_date, end_date, newer_than)
+        element.clear()
+        if parents:
+            parents[-1].remove(element)
+    return recent
+
+
+def _offer_feed_item(
+    recent: "_RecentArticles",
+    story_key: _StoryKey,
+    item: ET.Element,
+    start_date: date,
+    end_date: date,
+    newer_than: Optional[datetime],
+) -> None:
+    title = (item.findtext("title") or "").strip()
+    if not title:
+        return
+
+    pub_date_raw = item.findtext("pubDate")
+    if not pub_date_raw:
+        return
+    try:
+        publish_dt = parsedate_to_datetime(pub_date_raw)
+    except (TypeError, ValueError):
+        return
+    if publish_dt.tzinfo is None:
+        publish_dt = publish_dt.replace(tzinfo=timezone.utc)
+    else:
+        publish_dt = publish_dt.astimezone(timezone.utc)
+    if publish_dt.date() < start_date or publish_dt.date() > end_date:
+        return
+    if newer_than is not None and publish_dt <= newer_than:
+        return
+
+    headline = html.unescape(title)
+    key = story_key(headline, publish_dt)
+    if not recent.admits(key, publish_dt):
+        return
+
+    summary_raw = item.findtext("description") or ""
+    summary = _strip_html(summary_raw).strip() or None
+    source_elem = item.find("{http://news.google.com/newssources}news-source")
+    source = source_elem.text.strip() if source_elem is not None and source_elem.text else None
+    link = (item.findtext("link") or "").strip() or None
+
+    recent.offer(
+        key,
+        publish_dt,
+        NewsArticle(
+            headline=headline,
+            published_at=publish_dt.isoformat(),
+            summary=html.unescape(summary) if summary else None,
+            source=source,
+            url=link,
+            sentiment="neutral",
+            sentiment_score=0,
+        ),
+    )
+
+
+class _RecentArticles:
+    """The ``limit`` most recent articles seen so far, one per story cluster.
+
+    A story seen again keeps its newest copy. Because the set only ever holds
+    ``limit`` entries, eviction is a linear scan rather than a heap.
+    """
+
+    __slots__ = ("_limit", "_entries")
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._entries: Dict[Hashable, Tuple[datetime, NewsArticle]] = {}
+
+    def admits(self, key: Hashable, published: datetime) -> bool:
+        """Cheap pre-check so callers can skip building articles that would be dropped."""
+
+        existing = self._entries.get(key)
+        if existing is not None:
+            return published > existing[0]
+        if len(self._entries) < self._limit:
+            return True
+        return published > self._oldest()[1][0]
+
+    def offer(self, key: Hashable, published: datetime, article: NewsArticle) -> None:
+        if not self.admits(key, published):
+            return
+        if key not in self._entries and len(self._entries) >= self._limit:
+            del self._entries[self._oldest()[0]]
+        self._entries[key] = (published, article)
+
+    def articles(self) -> List[NewsArticle]:
+        """Kept articles, newest first."""
+
+        ordered = sorted(self._entries.values(), key=lambda entry: entry[0], reverse=True)
+        return [article for _, article in ordered]
+
+    def _oldest(self) -> Tuple[Hashable, Tuple[datetime, NewsArticle]]:
+        return min(self._entries.items(), key=lambda item: item[1][0])
+
+
+def _format_portfolio_table(reports: Iterable[NewsWeightReport]) -> str:
+    header = "| Ticker | Weight | Headlines | Positive | Negative | Net |\n| --- | --- | --- | --- | --- | --- |"
     rows = []
-    for article in articles:
-        date_str = article.published_at.split("T")[0] if article.published_at else "--"
-        source = article.source or "--"
-        tone = article.sentiment
-        headline = article.headline.replace("|", "/")
-        rows.append(f"| {date_str} | {source} | {tone} | {headline} |")
+    for report in reports:
+        positives = sum(1 for article in report.articles if article.sentiment_score > 0)
+        negatives = sum(1 for article in report.articles if article.sentiment_score < 0)
+        rows.append(
+            f"| {report.ticker} | {report.weight:.2%} | {len(report.articles)} | {positives} | {negatives} | {positives - negatives:+d} |"
+        )
     return "\n".join([header] + rows)
+
+
+def _format_articles_table(articles: List[NewsArticle]) -> str:
+    header = "| Date | Source | Tone | Headline |\n| --- | --- | --- | --- |"
+    return "\n".join([header] + [_article_row(article) for article in articles])
+
+
+def _article_row(article: NewsArticle) -> str:
+    date_str = article.published_at.split("T")[0] if article.published_at else "--"
+    source = article.source or "--"
+    tone = article.sentiment
+    headline = article.headline.replace("|", "/")
+    return f"| {date_str} | {source} | {tone} | {headline} |"
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple, Union
+
+from tradingagents.disk_cache import default_cache_root
+from tradingagents.sentiment import default_scorer, resolve_scorer
+
+if TYPE_CHECKING:  # pragma: no cover - import cycle at runtime
+    from tradingagents.news_agent import NewsArticle
+
+
+def default_news_store_path(scorer: Optional[str] = None) -> Path:
+    """One database per sentiment scorer, since rows keep the labels they were scored with."""
+
+    scorer = resolve_scorer(scorer) if scorer else default_scorer()
+    return default_cache_root() / "news" / f"articles-{scorer}.sqlite3"
+
+
+class NewsArticleStore:
+    """SQLite archive of scored headlines with a per-ticker high-water mark.
+
+    Articles are keyed by ticker plus a hash of their URL (or headline when no
+    URL is known) and keep the sentiment they were scored with. The high-water
+    mark records the newest publish time ingested for a ticker and the earliest
+    day its window has been filled from, so a later run only has to fetch and
+    score what appeared since and can read the rest of its window back from here.
+    Because rows keep their labels, a store should serve a single sentiment
+    scorer; the default path is per scorer.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        *,
+        retention_days: int = 120,
+    ):
+        if retention_days <= 0:
+            raise ValueError("retention_days must be positive")
+        self._path = Path(path).expanduser() if path else default_news_store_path()
+        self._retention = timedelta(days=retention_days)
+        self._lock = threading.Lock()
+        self._connection = _open_store(self._path)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def high_water_mark(self, ticker: str) -> Optional[Tuple[datetime, date]]:
+        """Return ``(newest_published, covered_from)`` for ``ticker``, or None if never ingested."""
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT newest_ts, covered_from FROM high_water WHERE ticker = ?", (ticker,)
+            ).fetchone()
+        if row is None:
+            return None
+        return datetime.fromtimestamp(row[0], tz=timezone.utc), date.fromisoformat(row[1])
+
+    def ingest(
+        self,
+        ticker: str,
+        articles: Iterable["NewsArticle"],
+        *,
+        covered_from: date,
+    ) -> int:
+        """Store scored ``articles`` and advance the high-water mark; returns rows added."""
+
+        rows = []
+        for article in articles:
+            published = _timestamp(article.published_at)
+            if published is None:
+                continue
+            rows.append(
+                (
+                    ticker,
+                    _article_key(article),
+                    published,
+                    article.published_at,
+                    article.headline,
+                    article.summary,
+                    article.source,
+                    article.url,
+                    article.sentiment,
+                    article.sentiment_score,
+                )
+            )
+
+        cutoff = time.time() - self._retention.total_seconds()
+        with self._lock, self._connection:
+            before = self._connection.total_changes
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO articles (ticker, article_key, published_ts, published_at, "
+                "headline, summary, source, url, sentiment, sentiment_score) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            added = self._connection.total_changes - before
+
+            newest = max((row[2] for row in rows), default=None)
+            current = self._connection.execute(
+                "SELECT newest_ts, covered_from FROM high_water WHERE ticker = ?", (ticker,)
+            ).fetchone()
+            if current is not None:
+                newest = max(filter(None, (newest, current[0])), default=None)
+                covered_from = min(covered_from, date.fromisoformat(current[1]))
+            self._connection.execute(
+                "INSERT OR REPLACE INTO high_water (ticker, newest_ts, covered_from) VALUES (?, ?, ?)",
+                (ticker, newest if newest is not None else 0.0, covered_from.isoformat()),
+            )
+            self._connection.execute(
+                "DELETE FROM articles WHERE ticker = ? AND published_ts < ?", (ticker, cutoff)
+            )
+        return added
+
+    def window(self, ticker: str, start_date: date, end_date: date) -> List["NewsArticle"]:
+        """Stored articles published between ``start_date`` and ``end_date`` (UTC), newest first."""
+
+        from tradingagents.news_agent import NewsArticle
+
+        start = datetime.combine(start_date, dt_time.min, tzinfo=timezone.utc).timestamp()
+        end = datetime.combine(end_date + timedelta(days=1), dt_time.min, tzinfo=timezone.utc).timestamp()
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT headline, published_at, summary, source, url, sentiment, sentiment_score "
+                "FROM articles WHERE ticker = ? AND published_ts >= ? AND published_ts < ? "
+                "ORDER BY published_ts DESC",
+                (ticker, start, end),
+            ).fetchall()
+        return [
+            NewsArticle(
+                headline=headline,
+                published_at=published_at,
+                summary=summary,
+                source=source,
+                url=url,
+                sentiment=sentiment,
+                sentiment_score=int(score),
+            )
+            for headline, published_at, summary, source, url, sentiment, score in rows
+        ]
+
+    def clear(self, ticker: Optional[str] = None) -> None:
+        with self._lock, self._connection:
+            if ticker is None:
+                self._connection.execute("DELETE FROM articles")
+                self._connection.execute("DELETE FROM high_water")
+            else:
+                self._connection.execute("DELETE FROM articles WHERE ticker = ?", (ticker,))
+                self._connection.execute("DELETE FROM high_water WHERE ticker = ?", (ticker,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def _article_key(article: "NewsArticle") -> bytes:
+    identity = article.url or article.headline.strip().lower()
+    return hashlib.blake2b(identity.encode("utf-8"), digest_size=16).digest()
+
+
+def _timestamp(published_at: Optional[str]) -> Optional[float]:
+    if not published_at:
+        return None
+    try:
+        published = datetime.fromisoformat(published_at)
+    except ValueError:
+        return None
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return published.timestamp()
+
+
+def _open_store(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(str(path), check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    with connection:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS articles ("
+            "ticker TEXT NOT NULL, article_key BLOB NOT NULL, published_ts REAL NOT NULL, "
+            "published_at TEXT NOT NULL, headline TEXT NOT NULL, summary TEXT, source TEXT, "
+            "url TEXT, sentiment TEXT NOT NULL, sentiment_score INTEGER NOT NULL, "
+            "PRIMARY KEY (ticker, article_key))"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS articles_by_time ON articles (ticker, published_ts)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS high_water ("
+            "ticker TEXT PRIMARY KEY, newest_ts REAL NOT NULL, covered_from TEXT NOT NULL)"
+        )
+    return connection
@@ -0,0 +1,50 @@
+"""Position and portfolio validation shared by the review agents."""
+
+from __future__ import annotations
+
+from typing import Dict, Mapping, Tuple
+
+
+def validate_position(ticker: str, weight: float) -> str:
+    """Return the upper-cased ticker, raising ValueError for a blank ticker or a weight outside [0, 1]."""
+
+    clean_ticker = ticker.strip().upper()
+    if not clean_ticker:
+        raise ValueError("Ticker symbol cannot be empty")
+    if not (0.0 <= weight <= 1.0):
+        raise ValueError("Weight must be between 0.0 and 1.0 inclusive")
+    return clean_ticker
+
+
+def normalise_portfolio(
+    portfolio: Mapping[str, float]
+) -> Tuple[Dict[str, float], Dict[str, str]]:
+    """Split ``portfolio`` into valid ``{TICKER: weight}`` positions and per-ticker errors.
+
+    Tickers are upper-cased and weights of repeated tickers summed before
+    each position is validated.
+    """
+
+    combined: Dict[str, float] = {}
+    errors: Dict[str, str] = {}
+    for ticker, weight in portfolio.items():
+        clean_ticker = str(ticker).strip().upper()
+        if not clean_ticker:
+            errors[repr(ticker)] = "Ticker symbol cannot be empty"
+            continue
+        try:
+            combined[clean_ticker] = combined.get(clean_ticker, 0.0) + float(weight)
+        except (TypeError, ValueError):
+            errors[clean_ticker] = f"Weight {weight!r} is not a number"
+
+    positions: Dict[str, float] = {}
+    for ticker, weight in combined.items():
+        if ticker in errors:
+            continue
+        try:
+            validate_position(ticker, weight)
+        except ValueError as exc:
+            errors[ticker] = str(exc)
+            continue
+        positions[ticker] = weight
+    return positions, errors
@@ -0,0 +1,194 @@
+"""Token counting and budget-aware compaction of the combined-summary prompt.
+
+The rendered fundamentals and news reports repeat their own bullets above
+their tables, and several bullets merely restate a metric row or a headline.
+``compact_weight_prompt`` sends each fact once: the two tables carry the
+data, and a bullet survives only if it adds something the tables do not
+say. When the prompt is still over budget, rows are trimmed in ascending
+order of value: neutral headlines, absolute-dollar statement lines, older
+headlines, trailing bullets.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from tradingagents.llm_client import _build_weight_points_prompt
+
+if TYPE_CHECKING:
+    from tradingagents.fundamental_agent import WeightReport
+    from tradingagents.news_agent import NewsArticle, NewsWeightReport
+
+DEFAULT_PROMPT_BUDGET = int(os.getenv("TRADINGAGENTS_LLM_PROMPT_BUDGET", "1500"))
+
+# Statement lines the ratios already summarise; dropped before any ratio.
+_LOW_VALUE_METRICS = frozenset(
+    ("operating_income", "operating_cash_flow", "gross_profit", "equity", "liabilities")
+)
+
+_ENCODERS: Dict[str, Any] = {}
+_ENCODERS_LOCK = threading.Lock()
+
+
+@dataclass(slots=True)
+class WeightPrompt:
+    """Keyword arguments for ``summarise_weight_points`` plus the size of the prompt they render."""
+
+    request: Dict[str, Any]
+    tokens: int
+    trimmed: Dict[str, int] = field(default_factory=dict)
+
+    def describe(self) -> str:
+        cuts = ", ".join(f"{count} {name.replace('_', ' ')}" for name, count in self.trimmed.items() if count)
+        return f"{self.tokens} prompt tokens" + (f" (trimmed {cuts})" if cuts else "")
+
+
+def count_tokens(text: str, *, model: Optional[str] = None) -> int:
+    """Token count under the model's tiktoken encoding, or a chars/4 estimate without tiktoken."""
+
+    encoder = _encoder(model or "")
+    if encoder is None:
+        return math.ceil(len(text) / 4)
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+def compact_weight_prompt(
+    fund_report: "WeightReport",
+    news_report: "NewsWeightReport",
+    weight: float,
+    *,
+    max_points: int,
+    budget: Optional[int] = None,
+    model: Optional[str] = None,
+) -> WeightPrompt:
+    """Build a deduplicated ``summarise_weight_points`` request that fits ``budget`` tokens.
+
+    The floor is one headline, three metric rows and two bullets per agent;
+    if even that exceeds the budget it is returned as-is rather than emptied.
+    """
+
+    # The agents import llm_client, which counts tokens through this module.
+    from tradingagents.fundamental_agent import _metric_rows
+    from tradingagents.news_agent import _article_row
+
+    budget = DEFAULT_PROMPT_BUDGET if budget is None else budget
+    if budget <= 0:
+        raise ValueError("budget must be positive")
+
+    metric_rows = _metric_rows(fund_report.metrics)
+    articles: List[Tuple["NewsArticle", str]] = [
+        (article, _article_row(article)) for article in news_report.articles
+    ]
+    parts: Dict[str, list] = {
+        "fundamental_points": _novel_points(
+            fund_report.rationale_points, [row for _, row in metric_rows]
+        ),
+        "news_points": _novel_points(
+            news_report.points, [article.headline for article, _ in articles]
+        ),
+        "metric_rows": metric_rows,
+        "articles": articles,
+    }
+    seen = {_normalise(point) for point in parts["fundamental_points"]}
+    parts["news_points"] = [point for point in parts["news_points"] if _normalise(point) not in seen]
+
+    def render() -> Dict[str, Any]:
+        return {
+            "ticker": fund_report.ticker,
+            "weight": weight,
+            "as_of": fund_report.as_of,
+            "fundamental_points": list(parts["fundamental_points"]),
+            "news_points": list(parts["news_points"]),
+            "metrics_table": _table("| Metric | Value |\n| --- | --- |", [row for _, row in parts["metric_rows"]]),
+            "news_table": _table(
+                "| Date | Source | Tone | Headline |\n| --- | --- | --- | --- |",
+                [row for _, row in parts["articles"]],
+            ),
+            "max_points": max_points,
+        }
+
+    def measure() -> int:
+        return count_tokens(_build_weight_points_prompt(**render()), model=model)
+
+    trimmed = {name: 0 for name in parts}
+    tokens = measure()
+    # Every stage stops at its part's final floor, including the selective ones:
+    # an all-neutral feed still keeps one headline.
+    stages = (
+        ("articles", lambda item: item[0].sentiment_score == 0, 1),
+        ("metric_rows", lambda item: item[0] in _LOW_VALUE_METRICS, 3),
+        ("articles", None, 3),
+        ("news_points", None, 2),
+        ("fundamental_points", None, 2),
+        ("articles", None, 1),
+        ("metric_rows", None, 3),
+    )
+    for name, predicate, floor in stages:
+        items = parts[name]
+        index = len(items) - 1
+        while tokens > budget and index >= 0 and len(items) > floor:
+            if predicate is None or predicate(items[index]):
+                del items[index]
+                trimmed[name] += 1
+                tokens = measure()
+            index -= 1
+
+    return WeightPrompt(request=render(), tokens=tokens, trimmed=trimmed)
+
+
+def _novel_points(points: List[str], table_cells: List[str]) -> List[str]:
+    """Drop bullets that only restate a table value or headline, and exact repeats."""
+
+    novel: List[str] = []
+    seen = set()
+    for point in points:
+        key = _normalise(point)
+        if key in seen:
+            continue
+        seen.add(key)
+        if any(_restates(point, cell) for cell in table_cells):
+            continue
+        novel.append(point)
+    return novel
+
+
+def _restates(point: str, cell: str) -> bool:
+    if cell.startswith("|"):
+        value = cell.strip("| ").rsplit("|", 1)[-1].strip()
+        return bool(value) and value in point
+    return bool(cell) and cell in point
+
+
+def _normalise(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def _table(header: str, rows: List[str]) -> str:
+    return "\n".join([header] + rows) if rows else ""
+
+
+def _encoder(model: str) -> Any:
+    with _ENCODERS_LOCK:
+        if model in _ENCODERS:
+            return _ENCODERS[model]
+        encoder = None
+        try:
+            import tiktoken  # type: ignore[import]
+        except ImportError:
+            pass
+        else:
+            try:
+                encoder = tiktoken.encoding_for_model(model)
+            except KeyError:
+                try:
+                    encoder = tiktoken.get_encoding("cl100k_base")
+                except Exception:  # noqa: BLE001 - the BPE file may need a download
+                    encoder = None
+            except Exception:  # noqa: BLE001
+                encoder = None
+        _ENCODERS[model] = encoder
+        return encoder
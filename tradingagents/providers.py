@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import http.client
+import os
+import pickle
+import random
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
+
+
+class FixtureNotFoundError(LookupError):
+    """Raised by ReplayProvider when no recording exists for a request."""
+
+
+@dataclass(slots=True)
+class FeedResponse:
+    """Outcome of a (possibly conditional) feed request."""
+
+    body: Optional[bytes]
+    not_modified: bool = False
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class FundamentalsProvider:
+    """Source of raw Yahoo-style fundamentals datasets for one ticker."""
+
+    def fetch_dataset(self, ticker: str, dataset: str) -> Any:
+        """Return ``info`` (dict) or a statement frame (financials, balance_sheet, cashflow)."""
+
+        raise NotImplementedError
+
+
+class NewsProvider:
+    """Source of raw news payloads: RSS feed bytes and yfinance news items."""
+
+    def fetch_feed(self, url: str, *, timeout: float) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def fetch_feed_conditional(
+        self,
+        url: str,
+        *,
+        timeout: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> FeedResponse:
+        """Fetch ``url`` sending If-None-Match / If-Modified-Since when validators are known.
+
+        Providers without HTTP semantics fall back to an unconditional fetch.
+        """
+
+        return FeedResponse(body=self.fetch_feed(url, timeout=timeout))
+
+    def fetch_ticker_news(self, ticker: str) -> List[dict]:
+        raise NotImplementedError
+
+
+class YahooFundamentalsProvider(FundamentalsProvider):
+    def fetch_dataset(self, ticker: str, dataset: str) -> Any:
+        import yfinance as yf  # type: ignore[import]
+
+        ticker_obj = yf.Ticker(ticker)
+        if dataset == "info":
+            try:
+                return ticker_obj.get_info() or {}
+            except Exception:
+                try:
+                    return getattr(ticker_obj, "info", {}) or {}
+                except Exception:
+                    return {}
+
+        loader = getattr(ticker_obj, f"get_{dataset}")
+        try:
+            return loader()
+        except Exception:
+            return None
+
+
+class LiveNewsProvider(NewsProvider):
+    """Fetches feeds over HTTP, reusing one keep-alive connection per host and thread."""
+
+    _USER_AGENT = f"Python-urllib/{sys.version_info[0]}.{sys.version_info[1]}"
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def fetch_feed(self, url: str, *, timeout: float) -> Optional[bytes]:
+        return self.fetch_feed_conditional(url, timeout=timeout).body
+
+    def fetch_feed_conditional(
+        self,
+        url: str,
+        *,
+        timeout: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> FeedResponse:
+        headers = {"User-Agent": self._USER_AGENT, "Accept-Encoding": "identity"}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.netloc:
+            return self._fetch_once(url, timeout=timeout, headers=headers)
+
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        for _ in range(2):
+            connection, reused = self._connection(parts.scheme, parts.netloc, timeout)
+            try:
+                connection.request("GET", target, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError):
+                self._drop(parts.scheme, parts.netloc)
+                if reused:
+                    # The server may have closed an idle keep-alive socket; retry on a fresh one.
+                    continue
+                return FeedResponse(body=None)
+
+            if response.will_close:
+                self._drop(parts.scheme, parts.netloc)
+            if response.status == 304:
+                return FeedResponse(body=None, not_modified=True)
+            if 300 <= response.status < 400 and response.getheader("Location"):
+                return self._fetch_once(
+                    urljoin(url, response.getheader("Location")), timeout=timeout, headers=headers
+                )
+            if response.status != 200:
+                return FeedResponse(body=None)
+            return FeedResponse(
+                body=body,
+                etag=response.getheader("ETag"),
+                last_modified=response.getheader("Last-Modified"),
+            )
+        return FeedResponse(body=None)
+
+    def close(self) -> None:
+        for connection in getattr(self._local, "connections", {}).values():
+            connection.close()
+        self._local.connections = {}
+
+    def _connection(self, scheme: str, netloc: str, timeout: float):
+        connections: Dict[Tuple[str, str], http.client.HTTPConnection] = getattr(
+            self._local, "connections", None
+        ) or {}
+        self._local.connections = connections
+
+        connection = connections.get((scheme, netloc))
+        reused = connection is not None
+        if connection is None:
+            factory = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            connection = factory(netloc, timeout=timeout)
+            connections[(scheme, netloc)] = connection
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        return connection, reused
+
+    def _drop(self, scheme: str, netloc: str) -> None:
+        connection = getattr(self._local, "connections", {}).pop((scheme, netloc), None)
+        if connection is not None:
+            connection.close()
+
+    @staticmethod
+    def _fetch_once(url: str, *, timeout: float, headers: Dict[str, str]) -> FeedResponse:
+        from urllib.request import Request, urlopen
+
+        try:
+            with contextlib.closing(urlopen(Request(url, headers=headers), timeout=timeout)) as response:
+                return FeedResponse(
+                    body=response.read(),
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+        except HTTPError as exc:
+            return FeedResponse(body=None, not_modified=exc.code == 304)
+        except URLError:
+            return FeedResponse(body=None)
+        except TimeoutError:
+            return FeedResponse(body=None)
+
+    def fetch_ticker_news(self, ticker: str) -> List[dict]:
+        import yfinance as yf
+
+        try:
+            return yf.Ticker(ticker).news or []
+        except Exception:
+            return []
+
+
+class RecordingProvider(FundamentalsProvider, NewsProvider):
+    """Delegates to live providers and captures every response (and its latency) to disk."""
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        *,
+        fundamentals: Optional[FundamentalsProvider] = None,
+        news: Optional[NewsProvider] = None,
+    ):
+        self._store = _FixtureStore(directory)
+        self._fundamentals = fundamentals or YahooFundamentalsProvider()
+        self._news = news or LiveNewsProvider()
+
+    def fetch_dataset(self, ticker: str, dataset: str) -> Any:
+        return self._record(("dataset", ticker, dataset), self._fundamentals.fetch_dataset, ticker, dataset)
+
+    def fetch_feed(self, url: str, *, timeout: float) -> Optional[bytes]:
+        return self._record(("feed", url), self._news.fetch_feed, url, timeout=timeout)
+
+    def fetch_ticker_news(self, ticker: str) -> List[dict]:
+        return self._record(("ticker_news", ticker), self._news.fetch_ticker_news, ticker)
+
+    def _record(self, key: Tuple[str, ...], call, *args, **kwargs) -> Any:
+        started = time.perf_counter()
+        value = call(*args, **kwargs)
+        self._store.write(key, value, time.perf_counter() - started)
+        return value
+
+
+class ReplayProvider(FundamentalsProvider, NewsProvider):
+    """Serves recorded responses offline with deterministic synthetic latency.
+
+    Each call sleeps ``latency`` seconds (or the originally recorded latency when
+    ``use_recorded_latency`` is set), scaled by a uniform jitter factor in
+    ``[1 - jitter, 1 + jitter]``. The jitter is seeded per request key so repeat
+    runs reproduce the same delays regardless of thread scheduling.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        use_recorded_latency: bool = False,
+        seed: int = 0,
+    ):
+        if latency < 0:
+            raise ValueError("latency must be non-negative")
+        if not (0.0 <= jitter <= 1.0):
+            raise ValueError("jitter must be between 0.0 and 1.0")
+        self._store = _FixtureStore(directory)
+        self._latency = latency
+        self._jitter = jitter
+        self._use_recorded_latency = use_recorded_latency
+        self._seed = seed
+
+    def fetch_dataset(self, ticker: str, dataset: str) -> Any:
+        return self._replay(("dataset", ticker, dataset))
+
+    def fetch_feed(self, url: str, *, timeout: float) -> Optional[bytes]:
+        return self._replay(("feed", url))
+
+    def fetch_ticker_news(self, ticker: str) -> List[dict]:
+        return self._replay(("ticker_news", ticker))
+
+    def _replay(self, key: Tuple[str, ...]) -> Any:
+        fixture = self._store.read(key)
+        if fixture is None:
+            raise FixtureNotFoundError(f"No recorded fixture for {key!r}")
+        value, recorded_latency = fixture
+
+        delay = recorded_latency if self._use_recorded_latency else self._latency
+        if self._jitter:
+            rng = random.Random(f"{self._seed}:{_fixture_digest(key)}")
+            delay *= rng.uniform(1.0 - self._jitter, 1.0 + self._jitter)
+        if delay > 0:
+            time.sleep(delay)
+        return value
+
+
+def default_fundamentals_provider() -> FundamentalsProvider:
+    provider = _provider_from_environment()
+    return provider if provider is not None else YahooFundamentalsProvider()
+
+
+def default_news_provider() -> NewsProvider:
+    provider = _provider_from_environment()
+    return provider if provider is not None else LiveNewsProvider()
+
+
+def _provider_from_environment():
+    """Honour TRADINGAGENTS_FIXTURES_DIR / _MODE / _LATENCY / _JITTER for CLI runs."""
+
+    directory = os.getenv("TRADINGAGENTS_FIXTURES_DIR")
+    if not directory:
+        return None
+
+    mode = os.getenv("TRADINGAGENTS_FIXTURES_MODE", "replay").strip().lower()
+    if mode == "record":
+        return RecordingProvider(directory)
+    if mode != "replay":
+        raise ValueError("TRADINGAGENTS_FIXTURES_MODE must be 'record' or 'replay'")
+    return ReplayProvider(
+        directory,
+        latency=float(os.getenv("TRADINGAGENTS_FIXTURES_LATENCY", "0") or 0),
+        jitter=float(os.getenv("TRADINGAGENTS_FIXTURES_JITTER", "0") or 0),
+    )
+
+
+class _FixtureStore:
+    def __init__(self, directory: Union[str, Path]):
+        self._directory = Path(directory).expanduser()
+
+    def read(self, key: Tuple[str, ...]) -> Optional[Tuple[Any, float]]:
+        path = self._path_for(key)
+        try:
+            with path.open("rb") as handle:
+                _, value, latency = pickle.load(handle)
+        except FileNotFoundError:
+            return None
+        return value, latency
+
+    def write(self, key: Tuple[str, ...], value: Any, latency: float) -> None:
+        path = self._path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                pickle.dump((key, value, latency), handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, path)
+        except Exception:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
+
+    def _path_for(self, key: Tuple[str, ...]) -> Path:
+        return self._directory / key[0] / f"{_fixture_digest(key)}.pkl"
+
+
+def _fixture_digest(key: Tuple[str, ...]) -> str:
+    return hashlib.sha1("\x1f".join(key).encode("utf-8")).hexdigest()
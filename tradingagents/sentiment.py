@@ -0,0 +1,417 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import os
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from tradingagents.disk_cache import default_cache_root
+
+Sentiment = Tuple[str, int]
+
+SCORERS = ("vader", "lexicon")
+
+_LABELS = {1: ("positive", 1), 0: ("neutral", 0), -1: ("negative", -1)}
+
+_SENTIMENT_ANALYSER = None
+_SENTIMENT_ANALYSER_LOADED = False
+_SENTIMENT_ANALYSER_LOCK = threading.Lock()
+
+_LEXICON_SCORER: Optional["LexiconScorer"] = None
+_LEXICON_SCORER_LOADED = False
+_LEXICON_SCORER_LOCK = threading.Lock()
+
+_SHARED_CACHES: Dict[str, "SentimentCache"] = {}
+_SHARED_CACHE_LOCK = threading.Lock()
+
+
+class SentimentCache:
+    """Content-addressed memo of headline sentiment labels.
+
+    Keys are a BLAKE2b digest of the scorer name and the exact text, so the same
+    syndicated headline scored for different tickers or on a later poll is a
+    lookup. Recent entries live in an in-memory LRU; when ``path`` is given,
+    every result is also written to a SQLite table that survives restarts and
+    refills the LRU on a memory miss.
+    """
+
+    def __init__(
+        self,
+        *,
+        scorer: str = "vader",
+        max_entries: int = 50_000,
+        path: Optional[Union[str, Path]] = None,
+    ):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self._scorer = scorer
+        self._max_entries = max_entries
+        self._memory: "OrderedDict[bytes, Sentiment]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._connection = _open_store(Path(path).expanduser()) if path else None
+
+    @property
+    def scorer(self) -> str:
+        return self._scorer
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def get(self, text: str) -> Optional[Sentiment]:
+        key = self._key(text)
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._memory.move_to_end(key)
+                self._hits += 1
+                return cached
+
+            if self._connection is not None:
+                row = self._connection.execute(
+                    "SELECT label, score FROM sentiment WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    cached = (row[0], int(row[1]))
+                    self._remember(key, cached)
+                    self._hits += 1
+                    return cached
+
+            self._misses += 1
+            return None
+
+    def set(self, text: str, sentiment: Sentiment) -> None:
+        self.set_many([(text, sentiment)])
+
+    def set_many(self, items: Iterable[Tuple[str, Sentiment]]) -> None:
+        """Store several results, writing them to disk in a single transaction."""
+
+        rows = [(self._key(text), sentiment[0], sentiment[1]) for text, sentiment in items]
+        with self._lock:
+            for key, label, score in rows:
+                self._remember(key, (label, score))
+            if self._connection is not None:
+                try:
+                    with self._connection:
+                        self._connection.executemany(
+                            "INSERT OR REPLACE INTO sentiment (key, label, score) VALUES (?, ?, ?)",
+                            rows,
+                        )
+                except sqlite3.Error:
+                    pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._hits = 0
+            self._misses = 0
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute("DELETE FROM sentiment")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _key(self, text: str) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self._scorer.encode("utf-8"))
+        digest.update(b"\x1f")
+        digest.update(text.encode("utf-8"))
+        return digest.digest()
+
+    def _remember(self, key: bytes, sentiment: Sentiment) -> None:
+        self._memory[key] = sentiment
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+
+def default_scorer() -> str:
+    """Scorer named by TRADINGAGENTS_SENTIMENT_SCORER ("vader" or "lexicon"), VADER by default."""
+
+    return resolve_scorer(os.getenv("TRADINGAGENTS_SENTIMENT_SCORER"))
+
+
+def resolve_scorer(name: Optional[str]) -> str:
+    scorer = (name or "vader").strip().lower()
+    if scorer not in SCORERS:
+        raise ValueError(f"sentiment scorer must be one of: {', '.join(SCORERS)}")
+    return scorer
+
+
+def shared_sentiment_cache(scorer: Optional[str] = None) -> SentimentCache:
+    """Process-wide cache per scorer, persisted under the cache root (memory-only if unwritable)."""
+
+    scorer = resolve_scorer(scorer) if scorer else default_scorer()
+    with _SHARED_CACHE_LOCK:
+        cache = _SHARED_CACHES.get(scorer)
+        if cache is None:
+            path = default_cache_root() / "sentiment" / f"{scorer}.sqlite3"
+            try:
+                cache = SentimentCache(scorer=scorer, path=path)
+            except (OSError, sqlite3.Error):
+                cache = SentimentCache(scorer=scorer)
+            _SHARED_CACHES[scorer] = cache
+        return cache
+
+
+def score_text(
+    text: str,
+    *,
+    cache: Optional[SentimentCache] = None,
+    scorer: Optional[str] = None,
+) -> Sentiment:
+    """Label ``text`` positive / negative / neutral, consulting ``cache`` first."""
+
+    return score_texts([text], cache=cache, scorer=scorer)[0]
+
+
+def score_texts(
+    texts: Sequence[str],
+    *,
+    cache: Optional[SentimentCache] = None,
+    scorer: Optional[str] = None,
+    processes: Optional[int] = None,
+    chunk_size: int = 512,
+    min_parallel: int = 2_000,
+) -> List[Sentiment]:
+    """Score many texts at once, returning labels in input order.
+
+    Cached and repeated texts are resolved up front, so only distinct misses
+    reach the scorer. When at least ``min_parallel`` of them remain, they are
+    split into ``chunk_size`` shards across a process pool. Each worker builds
+    its scorer once, in the pool initialiser. Smaller batches are scored
+    in-process, where starting workers would cost more than it saves.
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if processes is not None and processes <= 0:
+        raise ValueError("processes must be positive")
+    scorer = resolve_scorer(scorer) if scorer else default_scorer()
+    if cache is not None and cache.scorer != scorer:
+        raise ValueError(f"cache holds {cache.scorer!r} labels, not {scorer!r}")
+
+    cleaned = [text.strip() for text in texts]
+    resolved: Dict[str, Sentiment] = {"": ("neutral", 0)}
+    misses: List[str] = []
+    for text in cleaned:
+        if text in resolved:
+            continue
+        cached = cache.get(text) if cache is not None else None
+        if cached is not None:
+            resolved[text] = cached
+        else:
+            resolved[text] = ("neutral", 0)
+            misses.append(text)
+
+    if misses:
+        workers = processes or os.cpu_count() or 1
+        if workers > 1 and len(misses) >= min_parallel:
+            chunks = [misses[i:i + chunk_size] for i in range(0, len(misses), chunk_size)]
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(chunks)),
+                initializer=_load_scorer,
+                initargs=(scorer,),
+            ) as executor:
+                labels = [
+                    label
+                    for chunk in executor.map(_score_chunk, chunks, [scorer] * len(chunks))
+                    for label in chunk
+                ]
+        else:
+            labels = _score_chunk(misses, scorer)
+
+        resolved.update(zip(misses, labels))
+        if cache is not None and _vader_available():
+            cache.set_many(zip(misses, labels))
+
+    return [resolved[text] for text in cleaned]
+
+
+class LexiconScorer:
+    """Vectorised approximation of VADER's compound score.
+
+    VADER's lexicon is compiled once into a token→valence table. A batch of
+    texts is then tokenised into one flat array, and the per-token rules are
+    applied with NumPy masks: negation within the three preceding words
+    (each negator scales by VADER's -0.74, with its special case for "no") and
+    "but" damping (x0.5 before the word, x1.5 after). Valences are summed per text with ``bincount`` and normalised as
+    ``s / sqrt(s^2 + 15)``. Boosters, capitalisation and punctuation emphasis
+    are ignored, so labels can differ from VADER on emphatic text.
+    """
+
+    _WORD = re.compile(r"[a-z][a-z'\-]*")
+    _NEGATION_SCALAR = -0.74
+    _ALPHA = 15.0
+
+    def __init__(self, lexicon: Mapping[str, float], negations: Iterable[str]):
+        import numpy as np  # deferred so importing the news agent stays light
+
+        self._np = np
+        self._index = {token: position for position, token in enumerate(lexicon)}
+        self._valence = np.fromiter(lexicon.values(), dtype=np.float64, count=len(lexicon))
+        self._negations = frozenset(negations)
+
+    @classmethod
+    def from_vader(cls) -> Optional["LexiconScorer"]:
+        analyser = _sentiment_analyser()
+        if analyser is None:
+            return None
+        from vaderSentiment.vaderSentiment import NEGATE
+
+        lexicon = {token: valence for token, valence in analyser.lexicon.items() if " " not in token}
+        return cls(lexicon, NEGATE)
+
+    def compound(self, texts: Sequence[str]):
+        """Compound score per text as a float array aligned with ``texts``."""
+
+        np = self._np
+        tokenised = [self._WORD.findall(text.lower()) for text in texts]
+        lengths = np.fromiter((len(words) for words in tokenised), dtype=np.int64, count=len(texts))
+        total = int(lengths.sum())
+        if total == 0:
+            return np.zeros(len(texts))
+
+        words = [word for sentence in tokenised for word in sentence]
+        vocabulary, inverse = np.unique(np.array(words), return_inverse=True)
+        vocab_ids = np.fromiter(
+            (self._index.get(word, -1) for word in vocabulary), dtype=np.int64, count=len(vocabulary)
+        )
+        vocab_negates = np.fromiter(
+            (word in self._negations or word.endswith("n't") for word in vocabulary),
+            dtype=bool,
+            count=len(vocabulary),
+        )
+        vocab_but = vocabulary == "but"
+        vocab_no = vocabulary == "no"
+
+        token_ids = vocab_ids[inverse]
+        negates = vocab_negates[inverse]
+        is_but = vocab_but[inverse]
+        documents = np.repeat(np.arange(len(texts)), lengths)
+
+        valence = np.where(token_ids >= 0, self._valence[np.maximum(token_ids, 0)], 0.0)
+
+        same_doc = [None] + [documents[offset:] == documents[:-offset] for offset in (1, 2, 3)]
+        is_no = vocab_no[inverse]
+        # "no" only counts as a sentiment word when it does not lead into one.
+        follows_lexicon = np.zeros(total, dtype=bool)
+        follows_lexicon[:-1] = (token_ids[1:] >= 0) & same_doc[1]
+        valence = np.where(is_no & follows_lexicon, 0.0, valence)
+
+        # Each negator in the three preceding words flips and damps the valence again;
+        # "no" reaches back only two words.
+        for offset in (1, 2, 3):
+            negators = negates if offset == 3 else negates | is_no
+            scale = np.ones(total)
+            scale[offset:] = np.where(negators[:-offset] & same_doc[offset], self._NEGATION_SCALAR, 1.0)
+            valence = valence * scale
+
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        but_running = np.cumsum(is_but)
+        but_before_doc = (but_running - is_but)[np.minimum(starts, total - 1)]
+        seen_but = (but_running - but_before_doc[documents]) > 0
+        has_but = np.bincount(documents, weights=is_but, minlength=len(texts)) > 0
+        valence = np.where(seen_but & ~is_but, valence * 1.5, valence)
+        valence = np.where(has_but[documents] & ~seen_but, valence * 0.5, valence)
+
+        sums = np.bincount(documents, weights=valence, minlength=len(texts))
+        return sums / np.sqrt(sums * sums + self._ALPHA)
+
+    def score(self, texts: Sequence[str]) -> List[Sentiment]:
+        np = self._np
+        compound = self.compound(texts)
+        signs = np.where(compound >= 0.1, 1, np.where(compound <= -0.1, -1, 0))
+        return [_LABELS[sign] for sign in signs.tolist()]
+
+
+def _score_chunk(texts: Sequence[str], scorer: str = "vader") -> List[Sentiment]:
+    if scorer == "lexicon":
+        lexicon = _lexicon_scorer()
+        if lexicon is None:
+            return [("neutral", 0)] * len(texts)
+        return lexicon.score(texts)
+
+    analyser = _sentiment_analyser()
+    if analyser is None:
+        return [("neutral", 0)] * len(texts)
+    return [_label(analyser.polarity_scores(text)["compound"]) for text in texts]
+
+
+def _load_scorer(scorer: str) -> None:
+    if scorer == "lexicon":
+        _lexicon_scorer()
+    else:
+        _sentiment_analyser()
+
+
+def _vader_available() -> bool:
+    if _SENTIMENT_ANALYSER_LOADED:
+        return _SENTIMENT_ANALYSER is not None
+    return importlib.util.find_spec("vaderSentiment") is not None
+
+
+def _label(compound: float) -> Sentiment:
+    if compound >= 0.1:
+        return "positive", 1
+    if compound <= -0.1:
+        return "negative", -1
+    return "neutral", 0
+
+
+def _lexicon_scorer() -> Optional[LexiconScorer]:
+    global _LEXICON_SCORER, _LEXICON_SCORER_LOADED
+    if _LEXICON_SCORER_LOADED:
+        return _LEXICON_SCORER
+    with _LEXICON_SCORER_LOCK:
+        if not _LEXICON_SCORER_LOADED:
+            _LEXICON_SCORER = LexiconScorer.from_vader()
+            _LEXICON_SCORER_LOADED = True
+    return _LEXICON_SCORER
+
+
+def _sentiment_analyser():
+    """Build the VADER analyser on first use; loading its lexicon is slow."""
+
+    global _SENTIMENT_ANALYSER, _SENTIMENT_ANALYSER_LOADED
+    if _SENTIMENT_ANALYSER_LOADED:
+        return _SENTIMENT_ANALYSER
+    with _SENTIMENT_ANALYSER_LOCK:
+        if not _SENTIMENT_ANALYSER_LOADED:
+            try:
+                from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+            except ImportError:  # pragma: no cover - handled at runtime
+                _SENTIMENT_ANALYSER = None
+            else:
+                _SENTIMENT_ANALYSER = SentimentIntensityAnalyzer()
+            _SENTIMENT_ANALYSER_LOADED = True
+    return _SENTIMENT_ANALYSER
+
+
+def _open_store(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS sentiment ("
+        "key BLOB PRIMARY KEY, label TEXT NOT NULL, score INTEGER NOT NULL)"
+    )
+    connection.isolation_level = ""
+    return connection
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+from datetime import date
+from numbers import Number
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from tradingagents.disk_cache import default_cache_root
+
+Statements = Tuple[Dict[str, Any], Any, Any, Any]
+
+_STATEMENT_NAMES = ("financials", "balance_sheet", "cashflow")
+_PARTITION_PREFIX = "date="
+_COLUMNS = ["dataset", "label", "period", "position", "value", "text"]
+
+
+def default_snapshot_root() -> Path:
+    configured = os.getenv("TRADINGAGENTS_SNAPSHOT_DIR")
+    if configured:
+        return Path(configured).expanduser()
+    return default_cache_root() / "snapshots" / "fundamentals"
+
+
+class FundamentalsSnapshotStore:
+    """Date-partitioned archive of raw fundamentals payloads for point-in-time replays.
+
+    Each fetch is flattened into a long, columnar table (dataset, label, period,
+    value) and written to ``<root>/date=YYYY-MM-DD/<TICKER>.parquet``. When no
+    Parquet engine is installed the same table is written as gzipped CSV.
+    """
+
+    def __init__(self, root: Optional[Union[str, Path]] = None):
+        self._root = Path(root).expanduser() if root else default_snapshot_root()
+        self._index: Optional[Dict[str, List[date]]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def has_snapshot(self, ticker: str, snapshot_date: date) -> bool:
+        dates = self._ticker_index().get(ticker, [])
+        position = bisect.bisect_left(dates, snapshot_date)
+        return position < len(dates) and dates[position] == snapshot_date
+
+    def record(
+        self,
+        ticker: str,
+        statements: Statements,
+        *,
+        snapshot_date: Optional[date] = None,
+    ) -> Path:
+        """Persist one ticker's statement set under ``snapshot_date`` (today by default)."""
+
+        snapshot_date = snapshot_date or date.today()
+        partition = self._root / f"{_PARTITION_PREFIX}{snapshot_date.isoformat()}"
+        partition.mkdir(parents=True, exist_ok=True)
+
+        table = _flatten_statements(statements)
+        if _parquet_available():
+            path = partition / f"{ticker}.parquet"
+            tmp_path = partition / f".{ticker}.parquet.tmp"
+            table.to_parquet(tmp_path, index=False)
+        else:
+            path = partition / f"{ticker}.csv.gz"
+            tmp_path = partition / f".{ticker}.csv.gz.tmp"
+            table.to_csv(tmp_path, index=False, compression="gzip")
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._index is not None:
+                dates = self._index.setdefault(ticker, [])
+                if snapshot_date not in dates:
+                    bisect.insort(dates, snapshot_date)
+        return path
+
+    def load(self, ticker: str, as_of: date) -> Optional[Tuple[date, Statements]]:
+        """Return the latest snapshot recorded on or before ``as_of``, if any."""
+
+        dates = self._ticker_index().get(ticker, [])
+        position = bisect.bisect_right(dates, as_of)
+        if position == 0:
+            return None
+
+        snapshot_date = dates[position - 1]
+        partition = self._root / f"{_PARTITION_PREFIX}{snapshot_date.isoformat()}"
+        for suffix in (".parquet", ".csv.gz"):
+            path = partition / f"{ticker}{suffix}"
+            if path.exists():
+                return snapshot_date, _read_statements(path)
+        return None
+
+    def _ticker_index(self) -> Dict[str, List[date]]:
+        with self._lock:
+            if self._index is None:
+                self._index = self._scan()
+            return self._index
+
+    def _scan(self) -> Dict[str, List[date]]:
+        index: Dict[str, List[date]] = {}
+        try:
+            partitions = list(os.scandir(self._root))
+        except OSError:
+            return index
+
+        for partition in partitions:
+            if not partition.is_dir() or not partition.name.startswith(_PARTITION_PREFIX):
+                continue
+            try:
+                snapshot_date = date.fromisoformat(partition.name[len(_PARTITION_PREFIX):])
+            except ValueError:
+                continue
+            for entry in os.scandir(partition.path):
+                if entry.name.startswith("."):
+                    continue
+                for suffix in (".parquet", ".csv.gz"):
+                    if entry.name.endswith(suffix):
+                        index.setdefault(entry.name[: -len(suffix)], []).append(snapshot_date)
+                        break
+
+        for dates in index.values():
+            dates.sort()
+        return index
+
+
+def _flatten_statements(statements: Statements) -> pd.DataFrame:
+    info, *frames = statements
+    rows: List[Dict[str, Any]] = []
+
+    for key, raw in (info or {}).items():
+        if isinstance(raw, bool) or raw is None:
+            continue
+        if isinstance(raw, Number):
+            rows.append(_row("info", key, "", 0, float(raw), None))
+        elif isinstance(raw, str):
+            rows.append(_row("info", key, "", 0, None, raw))
+
+    for name, frame in zip(_STATEMENT_NAMES, frames):
+        if frame is None or getattr(frame, "empty", True):
+            continue
+        for position, period in enumerate(frame.columns):
+            period_label = period.isoformat() if hasattr(period, "isoformat") else str(period)
+            for label, raw in frame[period].items():
+                value = pd.to_numeric(raw, errors="coerce")
+                if pd.isna(value):
+                    continue
+                rows.append(_row(name, str(label), period_label, position, float(value), None))
+
+    return pd.DataFrame(rows, columns=_COLUMNS).astype({"position": "int64", "value": "float64"})
+
+
+def _row(dataset: str, label: str, period: str, position: int, value, text) -> Dict[str, Any]:
+    return {
+        "dataset": dataset,
+        "label": label,
+        "period": period,
+        "position": position,
+        "value": value,
+        "text": text,
+    }
+
+
+def _read_statements(path: Path) -> Statements:
+    if path.suffix == ".parquet":
+        table = pd.read_parquet(path)
+    else:
+        table = pd.read_csv(path, compression="gzip", keep_default_na=False, na_values=[""])
+
+    info: Dict[str, Any] = {}
+    info_rows = table[table["dataset"] == "info"]
+    for label, value, text in zip(info_rows["label"], info_rows["value"], info_rows["text"]):
+        info[label] = text if pd.isna(value) else float(value)
+
+    frames = []
+    for name in _STATEMENT_NAMES:
+        subset = table[table["dataset"] == name]
+        if subset.empty:
+            frames.append(None)
+            continue
+        frame = subset.pivot_table(
+            index="label", columns=["position", "period"], values="value", aggfunc="first", sort=False
+        )
+        frame = frame.sort_index(axis=1, level="position")
+        frame.columns = pd.to_datetime(frame.columns.get_level_values("period"), errors="coerce")
+        frames.append(frame.rename_axis(index=None, columns=None))
+
+    return info, frames[0], frames[1], frames[2]
+
+
+def _parquet_available() -> bool:
+    for module in ("pyarrow", "fastparquet"):
+        try:
+            __import__(module)
+        except ImportError:
+            continue
+        return True
+    return False